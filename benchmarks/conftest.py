@@ -0,0 +1,71 @@
+# Standard Imports
+import functools
+import json
+import tracemalloc
+
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from smartsheet_dataframe.testing import (
+    generate_report,
+    generate_sheet,
+)
+
+pytest_plugins = ["smartsheet_dataframe.testing.pytest_plugin"]
+
+
+@functools.lru_cache(maxsize=None)
+def _sheet(**kwargs):
+    return generate_sheet(**kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _report(**kwargs):
+    return generate_report(**kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _sheet_body(**kwargs):
+    return json.dumps(_sheet(**kwargs)).encode()
+
+
+@pytest.fixture
+def sheet_payload():
+    """Generate a synthetic sheet, once per session for the same arguments."""
+    return _sheet
+
+
+@pytest.fixture
+def report_payload():
+    """Generate a synthetic report, once per session for the same arguments."""
+    return _report
+
+
+@pytest.fixture
+def sheet_body():
+    """Synthetic sheet encoded as the API would send it, once per session for the same arguments."""
+    return _sheet_body
+
+
+@pytest.fixture(autouse=True)
+def unlimited_rate_limiter(unlimited_rate_limiter):
+    """Keep the process-wide rate limiters from slowing down the benchmarks."""
+    return unlimited_rate_limiter
+
+
+@pytest.fixture
+def measure(benchmark):
+    """Benchmark a call, and record the peak memory of one extra run in the results' extra_info."""
+    def run(func, *args, **kwargs):
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory_mb"] = round(peak / 1024 ** 2, 2)
+
+        return benchmark(func, *args, **kwargs)
+
+    return run
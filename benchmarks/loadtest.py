@@ -0,0 +1,230 @@
+"""Load test of the fetch and convert path against a fake Smartsheet API.
+
+Starts ``smartsheet_dataframe.testing.fake_server`` in a separate process,
+so that serving does not compete with the client for the GIL, then gets its
+sheets from a pool of threads and reports throughput, latency percentiles,
+retries, where the time went and the peak memory of this process::
+
+    python benchmarks/loadtest.py --concurrency 8 --calls 200 --rows 5000 --rate-limit-rate 0.05
+
+Pass ``--base-url`` to load test a server that is already running instead.
+"""
+
+# Standard Imports
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Local Imports
+from smartsheet_dataframe import (
+    FetchStats,
+    RateLimiter,
+    RetryPolicy,
+    SmartsheetDataFrameClient,
+    get_sheet_as_df,
+)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the load test and write its results to stdout.
+
+    :param argv: Command line arguments. ``sys.argv`` is used if not provided
+    :type argv: Sequence[str]
+
+    :return: Exit status, 1 if any call failed
+    :rtype: int
+    """
+    args = _parser().parse_args(argv)
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server, base_url, sheet_ids = _start_server(args)
+    else:
+        sheet_ids = args.sheet_ids or [1]
+
+    try:
+        result = run(base_url, sheet_ids, args)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(10)
+
+    if args.json:
+        sys.stdout.write(json.dumps(result, indent=2) + "\n")
+    else:
+        for name, value in result.items():
+            sys.stdout.write(f"{name:>24}: {value}\n")
+
+    return 0 if not result["failures"] else 1
+
+
+def run(base_url: str, sheet_ids: List[int], args: argparse.Namespace) -> Dict[str, Any]:
+    """Get the sheets ``args.calls`` times from ``args.concurrency`` threads and summarise the calls.
+
+    :param base_url: API base URL of the server
+    :type base_url: str
+
+    :param sheet_ids: IDs of the sheets to get, in turn
+    :type sheet_ids: list[int]
+
+    :param args: Parsed command line arguments
+    :type args: argparse.Namespace
+
+    :return: Results by name
+    :rtype: dict
+    """
+    fetches = []
+    lock = threading.Lock()
+
+    def on_fetch(stats: FetchStats) -> None:
+        with lock:
+            fetches.append(stats)
+
+    client = SmartsheetDataFrameClient(token="load-test",  # noqa: S106
+                                       base_url=base_url,
+                                       pool_size=args.concurrency,
+                                       retries=args.retries,
+                                       rate_limiter=RateLimiter(requests_per_minute=args.rpm,
+                                                                burst=max(args.concurrency, 1)),
+                                       retry_policy=RetryPolicy(base=args.backoff_base,
+                                                                max_delay=args.backoff_base * 8),
+                                       on_fetch=on_fetch,
+                                       schema_first=args.schema_first)
+
+    def call(number: int) -> Tuple[float, Optional[Exception]]:
+        start = time.perf_counter()
+        try:
+            get_sheet_as_df(sheet_id=sheet_ids[number % len(sheet_ids)], client=client, stream=args.stream,
+                            backend=args.backend)
+        # Every failure is counted, whatever its type
+        except Exception as e:  # noqa: BLE001
+            return time.perf_counter() - start, e
+        return time.perf_counter() - start, None
+
+    if args.trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with client, ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        outcomes = list(executor.map(call, range(args.calls)))
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if args.trace_memory else None
+    if args.trace_memory:
+        tracemalloc.stop()
+
+    latencies = sorted(seconds for seconds, error in outcomes if error is None)
+    failures = [error for _, error in outcomes if error is not None]
+    totals = FetchStats()
+    for stats in fetches:
+        totals.add(**{name: getattr(stats, name) for name in FetchStats.COUNTERS})
+
+    return {
+        "calls": args.calls,
+        "concurrency": args.concurrency,
+        "failures": len(failures),
+        "seconds": round(elapsed, 3),
+        "calls_per_second": round(args.calls / elapsed, 2),
+        "rows_per_second": round(totals.rows / elapsed),
+        "mb_per_second": round(totals.response_bytes / elapsed / 1024 ** 2, 2),
+        "latency_p50": _percentile(latencies, 50),
+        "latency_p90": _percentile(latencies, 90),
+        "latency_p99": _percentile(latencies, 99),
+        "latency_max": round(latencies[-1], 4) if latencies else None,
+        "latency_mean": round(statistics.mean(latencies), 4) if latencies else None,
+        "requests": totals.requests,
+        "retries": totals.retries,
+        "rate_limit_seconds": round(totals.rate_limit_seconds, 3),
+        "network_seconds": round(totals.network_seconds, 3),
+        "backoff_seconds": round(totals.backoff_seconds, 3),
+        "decode_seconds": round(totals.decode_seconds, 3),
+        "convert_seconds": round(totals.convert_seconds, 3),
+        "peak_traced_mb": None if peak is None else round(peak / 1024 ** 2, 1),
+        "max_rss_mb": _max_rss_mb(),
+        "first_error": repr(failures[0]) if failures else None,
+    }
+
+
+def _start_server(args: argparse.Namespace) -> Tuple[subprocess.Popen, str, List[int]]:
+    command = [sys.executable, "-m", "smartsheet_dataframe.testing.fake_server", "--port", "0",
+               "--sheets", str(args.sheets), "--rows", str(args.rows), "--columns", str(args.columns),
+               "--latency", str(args.latency), "--rate-limit-rate", str(args.rate_limit_rate),
+               "--error-rate", str(args.error_rate)]
+    if args.body_bytes_per_second:
+        command += ["--body-bytes-per-second", str(args.body_bytes_per_second)]
+    if args.retry_after is not None:
+        command += ["--retry-after", str(args.retry_after)]
+
+    # The command is this interpreter and numbers parsed by argparse, and no shell is used
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)  # noqa: S603
+    stdout = server.stdout
+    if stdout is None:
+        raise RuntimeError("The fake server's output could not be read")
+    base_url = stdout.readline().strip()
+    listing = stdout.readline()
+    sheet_ids = json.loads(listing.split("sheets ")[1].split(" and")[0])
+
+    return server, base_url, sheet_ids
+
+
+def _percentile(values: List[float], percent: float) -> Optional[float]:
+    if not values:
+        return None
+    position = min(len(values) - 1, max(0, round(percent / 100 * len(values)) - 1))
+    return round(values[position], 4)
+
+
+def _max_rss_mb() -> Optional[float]:
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        # Not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(max_rss / (1024 ** 2 if sys.platform == "darwin" else 1024), 1)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Load test get_sheet_as_df against a fake Smartsheet API")
+    parser.add_argument("--base-url", help="URL of a running fake server. One is started if not given")
+    parser.add_argument("--sheet-ids", type=int, nargs="+", help="Sheets to get from the server at --base-url")
+    parser.add_argument("--calls", type=int, default=100, help="Number of sheets to get")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of calls made at the same time")
+    parser.add_argument("--sheets", type=int, default=4, help="Number of sheets served")
+    parser.add_argument("--rows", type=int, default=2000, help="Rows of each sheet")
+    parser.add_argument("--columns", type=int, default=20, help="Columns of each sheet")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds each response is delayed by")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests rate limited")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing with 5xx")
+    parser.add_argument("--retry-after", type=float, help="Retry-After seconds sent with rate limit errors")
+    parser.add_argument("--body-bytes-per-second", type=float, help="Rate response bodies are sent at")
+    parser.add_argument("--rpm", type=float, default=10 ** 6,
+                        help="Client rate limit in requests per minute. Smartsheet allows 300")
+    parser.add_argument("--retries", type=int, default=10, help="Attempts made for each request")
+    parser.add_argument("--backoff-base", type=float, default=0.05, help="First backoff ceiling in seconds")
+    parser.add_argument("--stream", action="store_true", help="Parse responses incrementally")
+    parser.add_argument("--schema-first", action="store_true", help="Fetch columns first, as schema_first=True")
+    parser.add_argument("--backend", default="pandas", help="Output format")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Record the peak traced memory, which slows the calls down")
+    parser.add_argument("--json", action="store_true", help="Write the results as JSON")
+
+    return parser
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Benchmarks of the conversion from Smartsheet payloads to DataFrames.
+
+Run with ``pytest benchmarks``. Each result records the peak memory of one
+run in ``extra_info``; save runs with ``--benchmark-autosave`` and compare
+them with ``--benchmark-compare``.
+"""
+
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from smartsheet_dataframe.conversion import (
+    ConversionOptions,
+    _handle_object_value,
+)
+from smartsheet_dataframe.smartsheet_dataframe import (
+    _convert,
+    _to_dataframe,
+)
+
+# Sizes up to Smartsheet's limits of 20,000 rows, 400 columns and 500,000 cells per sheet
+SHEETS = {
+    "1k_rows_20_columns": {"rows": 1000, "columns": 20},
+    "20k_rows_25_columns": {"rows": 20000, "columns": 25},
+    "1250_rows_400_columns": {"rows": 1250, "columns": 400},
+    "sparse_10k_rows_20_columns": {"rows": 10000, "columns": 20, "sparsity": 0.8},
+    "contacts_10k_rows_10_columns": {"rows": 10000, "columns": 10, "column_types": ("MULTI_CONTACT_LIST",)},
+}
+
+
+@pytest.mark.parametrize("scenario", SHEETS)
+def test_sheet_typed(measure, sheet_payload, scenario):
+    sheet = sheet_payload(**SHEETS[scenario])
+
+    measure(_convert, sheet, ConversionOptions())
+
+
+@pytest.mark.parametrize("scenario", SHEETS)
+def test_sheet_untyped(measure, sheet_payload, scenario):
+    sheet = sheet_payload(**SHEETS[scenario])
+
+    measure(_to_dataframe, sheet, typed=False)
+
+
+@pytest.mark.parametrize("max_depth", [3, 12])
+def test_sheet_hierarchy(measure, sheet_payload, max_depth):
+    sheet = sheet_payload(rows=20000, columns=10, max_depth=max_depth)
+
+    measure(_convert, sheet, ConversionOptions(hierarchy=True))
+
+
+def test_sheet_categorical(measure, sheet_payload):
+    sheet = sheet_payload(rows=20000, columns=25)
+
+    measure(_convert, sheet, ConversionOptions(categorical=True))
+
+
+@pytest.mark.parametrize("backend", ["arrow", "polars", "dict"])
+def test_sheet_backend(measure, sheet_payload, backend):
+    if backend != "dict":
+        pytest.importorskip({"arrow": "pyarrow", "polars": "polars"}[backend])
+    sheet = sheet_payload(rows=20000, columns=25)
+
+    measure(_convert, sheet, ConversionOptions(backend=backend))
+
+
+@pytest.mark.parametrize("rows", [1000, 20000])
+def test_report(measure, report_payload, rows):
+    report = report_payload(rows=rows, columns=25)
+
+    measure(_convert, report, ConversionOptions())
+
+
+def test_handle_object_value(benchmark):
+    object_value = {"objectType": "MULTI_CONTACT",
+                    "values": [{"objectType": "CONTACT", "email": f"user{number}@example.com"} for number in range(5)]}
+
+    benchmark(_handle_object_value, object_value)
@@ -0,0 +1,50 @@
+"""Benchmarks of the public functions, from the API's JSON bytes to a DataFrame.
+
+The HTTP session is mocked, so these measure decoding and conversion, not the network.
+"""
+
+# Standard Imports
+import json
+
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from smartsheet_dataframe import (
+    get_report_as_df,
+    get_sheet_as_df,
+)
+
+SIZES = {
+    "1k_rows_20_columns": {"rows": 1000, "columns": 20},
+    "20k_rows_25_columns": {"rows": 20000, "columns": 25},
+}
+
+
+@pytest.mark.parametrize("scenario", SIZES)
+def test_get_sheet_as_df(measure, mock_client, sheet_body, scenario):
+    client = mock_client(sheet_body(**SIZES[scenario]))
+
+    measure(get_sheet_as_df, sheet_id=1, client=client)
+
+
+@pytest.mark.parametrize("scenario", SIZES)
+def test_get_sheet_as_df_stream(measure, mock_client, sheet_body, scenario):
+    pytest.importorskip("ijson")
+    client = mock_client(sheet_body(**SIZES[scenario]))
+
+    measure(get_sheet_as_df, sheet_id=1, client=client, stream=True)
+
+
+def test_get_report_as_df(measure, mock_client, report_payload):
+    client = mock_client(json.dumps(report_payload(rows=20000, columns=25)).encode())
+
+    # One page, since every request gets the whole report back
+    measure(get_report_as_df, report_id=2, client=client, page_size=20000)
+
+
+def test_get_sheet_as_df_sdk_object(measure, sheet_payload):
+    smartsheet = pytest.importorskip("smartsheet")
+    sheet = smartsheet.models.Sheet(sheet_payload(rows=5000, columns=20))
+
+    measure(get_sheet_as_df, sheet_obj=sheet)
@@ -1,13 +1,77 @@
 """Init file for smartsheet_dataframe module."""
 
+from .aio import (
+    AsyncSmartsheetDataFrameClient,
+    aget_as_df,
+    aget_report_as_df,
+    aget_sheet_as_df,
+    get_default_async_client,
+)
+from .cache import (
+    DiskCache,
+    MemoryCache,
+)
+from .client import (
+    SmartsheetDataFrameClient,
+    get_default_client,
+)
+from .export import (
+    ExportResult,
+    export_to_parquet,
+)
+from .hierarchy import (
+    adjacency,
+    hierarchy_index,
+    rollup,
+    subtree,
+)
+from .incremental import IncrementalSheet
+from .rate_limit import (
+    FileRateLimiter,
+    RateLimiter,
+    RetryPolicy,
+)
 from .smartsheet_dataframe import (
     get_as_df,
+    get_many_as_df,
     get_report_as_df,
     get_sheet_as_df,
+    iter_report_chunks,
+    iter_sheet_chunks,
+)
+from .stats import FetchStats
+from .update import (
+    SheetUpdate,
+    update_sheet_from_df,
 )
 
 __all__ = [
+    "AsyncSmartsheetDataFrameClient",
+    "DiskCache",
+    "ExportResult",
+    "FetchStats",
+    "FileRateLimiter",
+    "IncrementalSheet",
+    "MemoryCache",
+    "RateLimiter",
+    "RetryPolicy",
+    "SheetUpdate",
+    "SmartsheetDataFrameClient",
+    "adjacency",
+    "aget_as_df",
+    "aget_report_as_df",
+    "aget_sheet_as_df",
+    "export_to_parquet",
     "get_as_df",
+    "get_default_async_client",
+    "get_default_client",
+    "get_many_as_df",
     "get_report_as_df",
     "get_sheet_as_df",
+    "hierarchy_index",
+    "iter_report_chunks",
+    "iter_sheet_chunks",
+    "rollup",
+    "subtree",
+    "update_sheet_from_df",
 ]
@@ -0,0 +1,554 @@
+"""Asyncio API for the smartsheet_dataframe package.
+
+These functions mirror ``get_sheet_as_df``, ``get_report_as_df`` and
+``get_as_df`` without blocking the event loop. They require the optional
+``httpx`` dependency::
+
+    pip install smartsheet-dataframe[async]
+"""
+
+from __future__ import annotations
+
+# Standard Imports
+import asyncio
+import functools
+import logging
+import threading
+import time
+import warnings
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+# Local Imports
+from .client import (
+    BaseClient,
+    Timeout,
+)
+from .conversion import ConversionOptions
+from .decoders import (
+    JsonDecoder,
+    decode_json,
+)
+from .exceptions import (
+    AuthenticationError,
+    RetryError,
+)
+from .rate_limit import (
+    RateLimiter,
+    RetryPolicy,
+    retry_after,
+)
+from .smartsheet_dataframe import (
+    _convert,
+    _error_code,
+    _merge_pages,
+    _object_url,
+    _remaining_pages,
+)
+from .stats import (
+    FetchHook,
+    FetchStats,
+    observe,
+)
+from .utils.constants import (
+    ASYNC_EXECUTOR_BODY_BYTES,
+    ASYNC_EXECUTOR_ROW_THRESHOLD,
+    AUTH_ERROR_CODES,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
+    RATE_LIMIT_ERROR_CODE,
+    REPORT,
+    REPORT_PAGE_SIZE,
+    RETRY_STATUS_CODES,
+    SHEET,
+    SMARTSHEET_API_BASE_URL,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncSmartsheetDataFrameClient(BaseClient):
+    """Pooled asyncio Smartsheet API client built on ``httpx.AsyncClient``.
+
+    :param token: Smartsheet Personal Access Token used when a call
+        does not provide its own token
+    :type token: str
+
+    :param max_concurrency: Maximum number of requests in flight at once
+    :type max_concurrency: int
+
+    :param timeout: Default request timeout in seconds, either a single value
+        or a ``(connect, read)`` tuple
+    :type timeout: float | tuple[float, float]
+
+    :param retries: Default number of attempts made for each request
+    :type retries: int
+
+    :param base_url: Smartsheet API base URL
+    :type base_url: str
+
+    :param rate_limiter: Rate limiter applied to every request sent by this client.
+        The process-wide limiter for the request's token is used if not provided
+    :type rate_limiter: RateLimiter
+
+    :param on_fetch: Hook called with the ``FetchStats`` of every sheet or report
+        fetched through this client, for example to export them as metrics
+    :type on_fetch: Callable[[FetchStats], None]
+
+    :param retry_policy: Backoff between attempts and total backoff allowed for each request
+    :type retry_policy: RetryPolicy
+
+    :param json_decoder: Decoder of response bodies. One of 'orjson', 'msgspec' or 'json',
+        or a function decoding bytes. The fastest installed library is used if not provided
+    :type json_decoder: str | Callable[[bytes], Any]
+
+    :param pause_gc: If True, the garbage collector is paused while a response body is decoded.
+        Decoding large bodies is then faster, but the pause applies to every thread in the process
+    :type pause_gc: bool
+    """
+
+    def __init__(self,
+                 token: Optional[str] = None,
+                 max_concurrency: int = DEFAULT_MAX_WORKERS,
+                 timeout: Timeout = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES,
+                 base_url: str = SMARTSHEET_API_BASE_URL,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 on_fetch: Optional[FetchHook] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 json_decoder: Union[str, JsonDecoder, None] = None,
+                 pause_gc: bool = False) -> None:
+        """Create the client and its connection pool."""
+        try:
+            import httpx  # noqa: PLC0415
+        except ModuleNotFoundError as e:
+            raise ImportError("The asyncio API requires the 'httpx' package. "
+                              "Install it with 'pip install smartsheet-dataframe[async]'") from e
+
+        if max_concurrency < 1:
+            raise ValueError("'max_concurrency' must be at least 1")
+
+        super().__init__(token, timeout, retries, base_url, rate_limiter, on_fetch, retry_policy,
+                         json_decoder, pause_gc)
+        self.max_concurrency = max_concurrency
+
+        if isinstance(timeout, tuple):
+            httpx_timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        else:
+            httpx_timeout = httpx.Timeout(timeout)
+
+        self.http = httpx.AsyncClient(timeout=httpx_timeout,
+                                      limits=httpx.Limits(max_connections=max_concurrency,
+                                                          max_keepalive_connections=max_concurrency))
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore limiting the number of requests in flight.
+
+        Created on first use so that it is bound to the running event loop.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return self._semaphore
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self.http.aclose()
+
+    async def __aenter__(self) -> AsyncSmartsheetDataFrameClient:  # noqa: PYI034
+        """Enter an ``async with`` block."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Close the pooled connections when leaving an ``async with`` block."""
+        await self.aclose()
+
+
+_default_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_default_clients_lock = threading.Lock()
+
+
+def get_default_async_client() -> AsyncSmartsheetDataFrameClient:
+    """Get the running event loop's client used when no client is passed to a call.
+
+    Connection pools cannot be shared between event loops, so each loop has
+    its own default client, kept for as long as the loop is open. The clients
+    of closed loops are dropped on the next call, which releases their
+    connections.
+
+    :return: Shared default client of the running event loop
+    :rtype: AsyncSmartsheetDataFrameClient
+    """
+    loop = asyncio.get_running_loop()
+    with _default_clients_lock:
+        # A client's connections refer to its loop, so the loop is not freed until its client is dropped
+        for closed_loop in [other for other in _default_clients if other.is_closed()]:
+            del _default_clients[closed_loop]
+
+        client = _default_clients.get(loop)
+        if client is None:
+            client = _default_clients[loop] = AsyncSmartsheetDataFrameClient()
+
+    return client
+
+
+async def aget_report_as_df(token: Optional[str] = None,
+                            report_id: Optional[int] = None,
+                            include_row_id: bool = True,
+                            include_parent_id: bool = True,
+                            client: Optional[AsyncSmartsheetDataFrameClient] = None,
+                            page_size: int = REPORT_PAGE_SIZE,
+                            typed: bool = True,
+                            stats: Optional[FetchStats] = None) -> pd.DataFrame:
+    """Get a Smartsheet report as a Pandas DataFrame without blocking the event loop.
+
+    :param token: Smartsheet Personal Access Token
+    :type token: str
+
+    :param report_id: ID of report to retrieve
+    :type report_id: int
+
+    :param include_row_id: If True, will append a 'row_id' column to the dataframe
+            and populate with row id for each row in sheet
+    :type include_row_id: bool
+
+    :param include_parent_id: If True, will append a 'parent_id' column to the
+            dataframe and populate with parent ID for each nested row
+    :type include_parent_id: bool
+
+    :param client: Client whose connection pool, token and timeouts are used
+        for the request. The event loop's default client is used if not provided
+    :type client: AsyncSmartsheetDataFrameClient
+
+    :param page_size: Number of report rows requested per page. The first page
+        is used to find the total row count, then the remaining pages are fetched
+        concurrently and joined in order
+    :type page_size: int
+
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type,
+        such as numbers for TEXT_NUMBER columns and datetimes for DATE columns, and missing
+        cells are nulls. If False, dtypes are inferred by Pandas and missing cells are
+        empty strings, as in earlier versions
+    :type typed: bool
+
+    :param stats: Filled in with the call's timings and counts. The client's
+        ``on_fetch`` hook also receives them
+    :type stats: FetchStats
+
+    :return: Pandas DataFrame with report data
+    :rtype: pd.DataFrame
+    """
+
+    if not report_id:
+        raise ValueError("A report_id must be included in the parameters")
+
+    return await aget_as_df(REPORT, token, report_id, include_row_id, include_parent_id, client,
+                            page_size=page_size, typed=typed, stats=stats)
+
+
+async def aget_sheet_as_df(token: Optional[str] = None,
+                           sheet_id: Optional[int] = None,
+                           include_row_id: bool = True,
+                           include_parent_id: bool = True,
+                           client: Optional[AsyncSmartsheetDataFrameClient] = None,
+                           typed: bool = True,
+                           stats: Optional[FetchStats] = None) -> pd.DataFrame:
+    """Get a Smartsheet sheet as a Pandas DataFrame without blocking the event loop.
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param sheet_id: Smartsheet source sheet ID to get
+    :type sheet_id: int
+
+    :param include_row_id: If True, will append a 'row_id' column to the dataframe
+            and populate with row id for each row in sheet
+    :type include_row_id: bool
+
+    :param include_parent_id: If True, will append a 'parent_id' column to the
+            dataframe and populate with parent ID for each nested row
+    :type include_parent_id: bool
+
+    :param client: Client whose connection pool, token and timeouts are used
+        for the request. The event loop's default client is used if not provided
+    :type client: AsyncSmartsheetDataFrameClient
+
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type,
+        such as numbers for TEXT_NUMBER columns and datetimes for DATE columns, and missing
+        cells are nulls. If False, dtypes are inferred by Pandas and missing cells are
+        empty strings, as in earlier versions
+    :type typed: bool
+
+    :param stats: Filled in with the call's timings and counts. The client's
+        ``on_fetch`` hook also receives them
+    :type stats: FetchStats
+
+    :return: Pandas DataFrame with sheet data
+    :rtype: pd.DataFrame
+    """
+
+    if not sheet_id:
+        raise ValueError("A sheet_id must be included in the parameters")
+
+    return await aget_as_df(SHEET, token, sheet_id, include_row_id, include_parent_id, client,
+                            typed=typed, stats=stats)
+
+
+async def aget_as_df(type_: str,
+                     token: Optional[str] = None,
+                     id_: Optional[int] = None,
+                     include_row_id: bool = True,
+                     include_parent_id: bool = True,
+                     client: Optional[AsyncSmartsheetDataFrameClient] = None,
+                     page_size: int = REPORT_PAGE_SIZE,
+                     typed: bool = True,
+                     stats: Optional[FetchStats] = None) -> pd.DataFrame:
+    """Get a Smartsheet report or sheet as a Pandas DataFrame without blocking the event loop.
+
+    Large response bodies are decoded, and large payloads converted, in the
+    default executor so that the event loop stays responsive. So are the
+    bucket updates of a ``FileRateLimiter``, which lock and write a file.
+
+    :param type_: type of object to get. Must be one of 'report' or 'sheet'
+    :type type_: str
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param id_: Smartsheet object (report or sheet) ID
+    :type id_: int
+
+    :param include_row_id: If True, will append a 'row_id' column to the dataframe
+            and populate with row id for each row in sheet
+    :type include_row_id: bool
+
+    :param include_parent_id: If True, will append a 'parent_id' column to the
+            dataframe and populate with parent ID for each nested row
+    :type include_parent_id: bool
+
+    :param client: Client whose connection pool, token and timeouts are used
+        for the request. The event loop's default client is used if not provided
+    :type client: AsyncSmartsheetDataFrameClient
+
+    :param page_size: Number of report rows requested per page
+    :type page_size: int
+
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type,
+        such as numbers for TEXT_NUMBER columns and datetimes for DATE columns, and missing
+        cells are nulls. If False, dtypes are inferred by Pandas and missing cells are
+        empty strings, as in earlier versions
+    :type typed: bool
+
+    :param stats: Filled in with the call's timings and counts. The client's
+        ``on_fetch`` hook also receives them
+    :type stats: FetchStats
+
+    :return: Pandas DataFrame with object data
+    :rtype: pd.DataFrame
+    """
+
+    if not (token or (client and client.token)):
+        raise ValueError("One of 'token' or 'client' with a token must be included in parameters")
+    if not id_:
+        raise ValueError("An id_ must be included in the parameters")
+
+    client = client or get_default_async_client()
+    with observe(stats, client.on_fetch, type_, id_) as call_stats:
+        object_dict = await _aget_from_request(token, id_, type_, client, page_size, call_stats)
+        convert = functools.partial(_convert, object_dict, ConversionOptions(include_row_id, include_parent_id, typed),
+                                    call_stats)
+
+        return await _arun(convert, len(object_dict.get("rows") or ()) >= ASYNC_EXECUTOR_ROW_THRESHOLD)
+
+
+async def _aget_from_request(token: Optional[str],
+                             id_: int,
+                             type_: str,
+                             client: AsyncSmartsheetDataFrameClient,
+                             page_size: int = REPORT_PAGE_SIZE,
+                             stats: Optional[FetchStats] = None) -> dict:
+    if type_.upper() == REPORT:
+        return await _aget_report_pages(token, id_, client, page_size, stats)
+
+    return await _aget_json(client, _object_url(client.base_url, id_, type_), token, stats)
+
+
+async def _aget_json(client: AsyncSmartsheetDataFrameClient,
+                     url: str,
+                     token: Optional[str],
+                     stats: Optional[FetchStats] = None) -> dict:
+    response = await _ado_request(url,
+                                  options=client.headers(token),
+                                  client=client,
+                                  rate_limiter=client.limiter(token),
+                                  stats=stats)
+    decode = functools.partial(decode_json, client.json_decoder, response.content, client.pause_gc)
+    if stats is None:
+        return await _arun(decode, len(response.content) >= ASYNC_EXECUTOR_BODY_BYTES)
+
+    start = time.perf_counter()
+    object_dict = await _arun(decode, len(response.content) >= ASYNC_EXECUTOR_BODY_BYTES)
+    stats.add(decode_seconds=time.perf_counter() - start, response_bytes=len(response.content))
+
+    return object_dict
+
+
+async def _arun(func: Callable[[], T], in_executor: bool) -> T:
+    """Call a blocking function, in the default executor if it would stall the event loop for long."""
+    if in_executor:
+        return await asyncio.get_running_loop().run_in_executor(None, func)
+
+    return func()
+
+
+async def _aget_report_pages(token: Optional[str],
+                             id_: int,
+                             client: AsyncSmartsheetDataFrameClient,
+                             page_size: int,
+                             stats: Optional[FetchStats] = None) -> dict:
+    """Get every page of a report and join them into one report dictionary.
+
+    The first page is fetched on its own to learn ``totalRowCount``.
+    The remaining pages are then fetched concurrently, limited by the client's semaphore.
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param id_: Smartsheet report ID
+    :type id_: int
+
+    :param client: Client used to send the requests
+    :type client: AsyncSmartsheetDataFrameClient
+
+    :param page_size: Number of rows requested per page
+    :type page_size: int
+
+    :param stats: Timings and counts to add to
+    :type stats: FetchStats
+
+    :return: Report dictionary holding the rows of every page, in order
+    :rtype: dict
+    """
+    if page_size < 1:
+        raise ValueError("'page_size' must be at least 1")
+
+    def page_url(page: int) -> str:
+        return _object_url(client.base_url, id_, REPORT, page=page, pageSize=page_size)
+
+    first_page = await _aget_json(client, page_url(1), token, stats)
+    page_numbers = _remaining_pages(first_page, page_size)
+    if not page_numbers:
+        return first_page
+
+    pages = await asyncio.gather(*(_aget_json(client, page_url(page), token, stats) for page in page_numbers))
+
+    return _merge_pages(first_page, list(pages))
+
+
+async def _ado_request(url: str,
+                       options: dict,
+                       client: AsyncSmartsheetDataFrameClient,
+                       rate_limiter: Optional[RateLimiter] = None,
+                       stats: Optional[FetchStats] = None) -> Any:
+    """Do the HTTP request without blocking, handling rate limit retrying.
+
+    Rate limit errors, server errors and connection errors are retried after
+    a backoff, which is the response's ``Retry-After`` when it has one.
+
+    :param url: Smartsheet API URL
+    :type url: str
+
+    :param options: API request headers
+    :type options: dict
+
+    :param client: Client used to send the request
+    :type client: AsyncSmartsheetDataFrameClient
+
+    :param rate_limiter: Rate limiter to reserve a slot from before each attempt.
+        It is throttled when the request is rate limited
+    :type rate_limiter: RateLimiter
+
+    :param stats: Timings and counts to add the requests, retries and waits to
+    :type stats: FetchStats
+
+    :return: httpx response object
+    :rtype: httpx.Response
+    """
+    backed_off = 0.0
+
+    i = 0
+    for i in range(client.retries):
+        if rate_limiter is not None:
+            delay = await _arun(rate_limiter.reserve, rate_limiter.blocking)
+            if delay:
+                await asyncio.sleep(delay)
+            if stats is not None:
+                stats.add(rate_limit_seconds=delay)
+
+        throttle = False
+        try:
+            async with client.semaphore:
+                if stats is not None:
+                    stats.add(requests=1, retries=int(i > 0))
+                start = time.perf_counter()
+                response = await client.http.get(url, headers=options)
+                if stats is not None:
+                    stats.add(network_seconds=time.perf_counter() - start)
+        except Exception:
+            logger.exception(f"Not able to retrieve get response. Retrying... {i}")
+            delay = client.retry_policy.delay(i)
+        else:
+            if response.status_code == 200:
+                return response
+
+            error_code = _error_code(response)
+            if error_code in AUTH_ERROR_CODES:
+                raise AuthenticationError("Could not connect using the supplied auth token \n" +
+                                          response.text)
+            elif error_code == RATE_LIMIT_ERROR_CODE or response.status_code in RETRY_STATUS_CODES:
+                logger.debug(f"Rate limit exceeded or server error. Waiting and trying again... {i}")
+                throttle = error_code == RATE_LIMIT_ERROR_CODE or response.status_code == 429
+                delay = client.retry_policy.delay(i, retry_after(response.headers))
+            else:
+                warnings.warn("An unhandled status_code was returned by the Smartsheet API: \n" +
+                              response.text)
+                response.raise_for_status()
+                return response
+
+        # No point waiting after the last attempt, or past the retry budget
+        if i == client.retries - 1 or backed_off + delay > client.retry_policy.budget:
+            break
+        await _abackoff(delay, stats, rate_limiter if throttle else None)
+        backed_off += delay
+
+    raise RetryError(f"Could not retrieve request after retrying {i} times")
+
+
+async def _abackoff(delay: float,
+                    stats: Optional[FetchStats] = None,
+                    rate_limiter: Optional[RateLimiter] = None) -> None:
+    """Wait before sending a request again, without blocking the event loop.
+
+    After a rate limit error the shared rate limiter is throttled for the same
+    time, so the other requests using it wait as well.
+    """
+    if rate_limiter is not None:
+        await _arun(functools.partial(rate_limiter.throttle, delay), rate_limiter.blocking)
+    await asyncio.sleep(delay)
+    if stats is not None:
+        stats.add(backoff_seconds=delay)
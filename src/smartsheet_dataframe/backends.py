@@ -0,0 +1,120 @@
+"""Output formats other than Pandas for the smartsheet_dataframe package.
+
+Each backend builds its output straight from the converted column values,
+without going through a Pandas DataFrame. The libraries are imported only
+when their backend is used.
+"""
+
+# Standard Imports
+from collections import Counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+# Local Imports
+from .utils.constants import (
+    ARROW_BACKEND,
+    BACKENDS,
+    DICT_BACKEND,
+    POLARS_BACKEND,
+)
+from .utils.sequences import zip_equal
+
+
+def check_backend(backend: str) -> None:
+    """Raise a ValueError if the backend is not supported.
+
+    :param backend: Output format
+    :type backend: str
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"'backend' parameter must be one of {', '.join(BACKENDS)}. The current value is {backend}")
+
+
+def build_columns(backend: str, names: List[str], data: List[list], categorical: List[bool]) -> Any:
+    """Build the output of a backend other than Pandas.
+
+    :param backend: Output format. One of 'arrow', 'polars' or 'dict'
+    :type backend: str
+
+    :param names: Column names
+    :type names: list[str]
+
+    :param data: Values of each column, with None for missing values
+    :type data: list[list]
+
+    :param categorical: Whether each column should be dictionary encoded
+    :type categorical: list[bool]
+
+    :return: pyarrow Table, polars DataFrame or dictionary of column name to values
+    :rtype: pyarrow.Table | polars.DataFrame | dict[str, list]
+    """
+    builders: Dict[str, Callable[[List[str], List[list], List[bool]], Any]] = {
+        ARROW_BACKEND: _build_arrow,
+        POLARS_BACKEND: _build_polars,
+        DICT_BACKEND: _build_dict,
+    }
+    if backend not in builders:
+        check_backend(backend)
+        raise ValueError(f"The '{backend}' backend is not built from columns")
+
+    return builders[backend](names, data, categorical)
+
+
+def _build_dict(names: List[str], data: List[list], categorical: List[bool]) -> Dict[str, list]:
+    _check_unique(names)
+
+    return dict(zip_equal(names, data))
+
+
+def _build_arrow(names: List[str], data: List[list], categorical: List[bool]) -> Any:
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+    except ModuleNotFoundError as e:
+        raise ImportError("The 'arrow' backend requires the 'pyarrow' package. "
+                          "Install it with 'pip install smartsheet-dataframe[arrow]'") from e
+
+    arrays = []
+    for values, is_categorical in zip_equal(data, categorical):
+        try:
+            array = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            array = pa.array(_as_text(values), type=pa.string())
+        arrays.append(array.dictionary_encode() if is_categorical else array)
+
+    # Tables allow duplicate column names, as DataFrames do
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def _build_polars(names: List[str], data: List[list], categorical: List[bool]) -> Any:
+    try:
+        import polars as pl  # noqa: PLC0415
+    except ModuleNotFoundError as e:
+        raise ImportError("The 'polars' backend requires the 'polars' package. "
+                          "Install it with 'pip install smartsheet-dataframe[polars]'") from e
+
+    _check_unique(names)
+
+    series = []
+    for name, values, is_categorical in zip_equal(names, data, categorical):
+        try:
+            column = pl.Series(name, values)
+        except (TypeError, ValueError, OverflowError, pl.exceptions.PolarsError):
+            column = pl.Series(name, _as_text(values), dtype=pl.String)
+        series.append(column.cast(pl.Categorical) if is_categorical else column)
+
+    return pl.DataFrame(series)
+
+
+def _as_text(values: list) -> list:
+    """Fall back to text for a column holding values of several types."""
+    return [None if value is None else str(value) for value in values]
+
+
+def _check_unique(names: List[str]) -> None:
+    duplicates = sorted(name for name, count in Counter(names).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Columns {duplicates} appear more than once, which this backend does not allow")
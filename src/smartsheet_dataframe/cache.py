@@ -0,0 +1,365 @@
+"""DataFrame caches for the smartsheet_dataframe package.
+
+A ``DiskCache`` stores converted DataFrames on disk together with the
+version of the sheet they were built from. Entries are evicted least
+recently used first once the cache grows beyond its size limit. The cache
+may be shared by several processes on one host.
+
+A ``MemoryCache`` keeps converted DataFrames in memory for a short time,
+for applications that ask for the same sheets from many threads.
+"""
+
+from __future__ import annotations
+
+# Standard Imports
+import collections
+import contextlib
+import json
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Union,
+)
+
+# Local Imports
+from .utils.constants import (
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_MEMORY_CACHE_MAX_BYTES,
+    DEFAULT_MEMORY_CACHE_TTL,
+)
+from .utils.filelock import FileLock
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """Version-checked, size-limited DataFrame cache in a directory.
+
+    DataFrames are stored as Parquet when ``pyarrow`` is installed and the
+    frame can be represented by Arrow, and as pickle files otherwise. Frames
+    holding tuples, such as the 'path' column of hierarchy frames, are
+    pickled, since Parquet would read the tuples back as arrays.
+
+    :param directory: Directory holding the cache. It is created if it does not exist
+    :type directory: str | os.PathLike
+
+    :param max_bytes: Maximum total size of the cached data files
+    :type max_bytes: int
+    """
+
+    def __init__(self,
+                 directory: Union[str, os.PathLike[str]],
+                 max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        """Create the cache directory if needed."""
+        if max_bytes < 0:
+            raise ValueError("'max_bytes' must not be negative")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = FileLock(self.directory / ".lock")
+
+    def get(self, key: str, version: int) -> Optional[pd.DataFrame]:
+        """Get a cached DataFrame if it was stored for the given version.
+
+        :param key: Cache key
+        :type key: str
+
+        :param version: Current version of the cached object
+        :type version: int
+
+        :return: Cached DataFrame, or None if missing or out of date
+        :rtype: pd.DataFrame | None
+        """
+        meta = self._read_meta(key)
+        if meta is None or meta["version"] != version:
+            return None
+
+        data_path = self.directory / meta["data"]
+        try:
+            if meta["format"] == "parquet":
+                import pandas as pd  # noqa: PLC0415
+
+                df = pd.read_parquet(data_path, memory_map=True)
+            else:
+                with data_path.open("rb") as f:
+                    df = pickle.load(f)  # noqa: S301
+            # Mark as recently used for LRU eviction
+            os.utime(data_path)
+        except OSError:
+            # Evicted or replaced by another process while reading
+            logger.debug(f"Cache entry {key} disappeared while reading")
+            return None
+
+        return df
+
+    def put(self, key: str, version: int, df: pd.DataFrame) -> None:
+        """Store a DataFrame for the given version, then evict old entries.
+
+        :param key: Cache key
+        :type key: str
+
+        :param version: Version of the object the DataFrame was built from
+        :type version: int
+
+        :param df: DataFrame to store
+        :type df: pd.DataFrame
+        """
+        # Data files are never overwritten, so readers holding the previous
+        # entry keep a consistent file until the metadata is replaced.
+        stem = f"{key}-v{version}-{uuid.uuid4().hex}"
+        data_path = self.directory / f"{stem}.parquet"
+        data_format = "pickle" if _holds_tuples(df) else "parquet"
+        if data_format == "parquet":
+            try:
+                df.to_parquet(data_path)
+            except (ImportError, TypeError, ValueError):
+                logger.debug(f"Cache entry {key} can not be stored as Parquet, using pickle")
+                data_path.unlink(missing_ok=True)
+                data_format = "pickle"
+
+        if data_format == "pickle":
+            data_path = self.directory / f"{stem}.pickle"
+            with data_path.open("wb") as f:
+                pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._lock:
+            previous = self._read_meta(key)
+            self._write_meta(key, {"version": version, "format": data_format, "data": data_path.name})
+            if previous is not None and previous["data"] != data_path.name:
+                with contextlib.suppress(OSError):
+                    (self.directory / previous["data"]).unlink()
+
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            for path in self.directory.iterdir():
+                if path.suffix in (".json", ".parquet", ".pickle"):
+                    with contextlib.suppress(OSError):
+                        path.unlink()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits in ``max_bytes``.
+
+        Must be called while holding the cache lock.
+        """
+        entries = []
+        for meta_path in self.directory.glob("*.json"):
+            try:
+                meta = json.loads(meta_path.read_text())
+                stat = (self.directory / meta["data"]).stat()
+            except (OSError, ValueError, KeyError):
+                continue
+            entries.append((stat.st_mtime, stat.st_size, meta_path, meta["data"]))
+
+        total = sum(size for _, size, _, _ in entries)
+        for _, size, meta_path, data_name in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+
+            logger.debug(f"Evicting cache entry {meta_path.stem}")
+            with contextlib.suppress(OSError):
+                meta_path.unlink()
+                (self.directory / data_name).unlink()
+            total -= size
+
+    def _read_meta(self, key: str) -> Optional[dict]:
+        try:
+            return json.loads((self.directory / f"{key}.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, key: str, meta: dict) -> None:
+        temporary_path = self.directory / f".{key}-{uuid.uuid4().hex}.tmp"
+        temporary_path.write_text(json.dumps(meta))
+        temporary_path.replace(self.directory / f"{key}.json")
+
+
+class MemoryCache:
+    """Thread-safe, time-limited and size-limited cache of converted objects in memory.
+
+    Entries expire ``ttl`` seconds after they were fetched and are evicted
+    least recently used first once their total size grows beyond
+    ``max_bytes``. Calls that miss the same key at the same time share one
+    fetch. Every caller gets its own copy of a cached DataFrame, which
+    shares the cached data until either is modified, so one caller cannot
+    change another caller's result.
+
+    :param ttl: Number of seconds an entry is used for after it was fetched
+    :type ttl: float
+
+    :param max_bytes: Maximum total size of the cached objects
+    :type max_bytes: int
+    """
+
+    def __init__(self,
+                 ttl: float = DEFAULT_MEMORY_CACHE_TTL,
+                 max_bytes: int = DEFAULT_MEMORY_CACHE_MAX_BYTES) -> None:
+        """Create an empty cache."""
+        if ttl <= 0:
+            raise ValueError("'ttl' must be greater than 0")
+        if max_bytes < 0:
+            raise ValueError("'max_bytes' must not be negative")
+
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # Key to (expiry time, size, value), least recently used first
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._loading: Dict[Hashable, Future] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Get a cached object, or load it if it is missing or expired.
+
+        If another thread is already loading the key, waits for its result,
+        or its exception, instead of loading it again.
+
+        :param key: Cache key
+        :type key: Hashable
+
+        :param load: Function fetching and converting the object
+        :type load: Callable[[], Any]
+
+        :return: Copy of the cached or loaded object
+        :rtype: Any
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return _share(entry[2])
+            if entry is not None:
+                self._remove(key)
+
+            future = self._loading.get(key)
+            loading = future is None
+            if loading:
+                future = self._loading[key] = Future()
+
+        if not loading:
+            return _share(future.result())
+
+        try:
+            value = load()
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+
+        size = _size_of(value)
+        with self._lock:
+            del self._loading[key]
+            if size <= self.max_bytes:
+                self._entries[key] = (time.monotonic() + self.ttl, size, value)
+                self._size += size
+                self._evict()
+        future.set_result(value)
+
+        return _share(value)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached objects, including expired ones not yet removed."""
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        """Remove expired entries, then least recently used ones until the cache fits in ``max_bytes``.
+
+        Must be called while holding the cache lock.
+        """
+        now = time.monotonic()
+        for key in [key for key, (expires, _, _) in self._entries.items() if expires <= now]:
+            self._remove(key)
+        while self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+
+def _holds_tuples(df: pd.DataFrame) -> bool:
+    """Check whether any object column of a DataFrame holds tuples.
+
+    Only the first value of each column that is not null is checked.
+
+    :param df: DataFrame to check
+    :type df: pd.DataFrame
+
+    :return: True if a column holds tuples
+    :rtype: bool
+    """
+    for position, dtype in enumerate(df.dtypes):
+        if dtype == object:
+            values = df.iloc[:, position].dropna()
+            if len(values) and isinstance(values.iloc[0], tuple):
+                return True
+
+    return False
+
+
+def _share(value: Any) -> Any:
+    """Get a copy of a cached object that can be changed without changing the cached one."""
+    if type(value).__name__ == "DataFrame" and hasattr(value, "memory_usage"):
+        # With copy-on-write the copy shares the data until one of them is modified
+        return value.copy(deep=not _copy_on_write())
+    if type(value).__name__ == "DataFrame" and hasattr(value, "clone"):
+        # Polars
+        return value.clone()
+    if isinstance(value, dict):
+        return {name: list(values) for name, values in value.items()}
+
+    # Arrow tables are immutable
+    return value
+
+
+def _size_of(value: Any) -> int:
+    """Estimate the memory used by a converted object."""
+    if hasattr(value, "memory_usage"):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if hasattr(value, "estimated_size"):
+        return int(value.estimated_size())
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(sys.getsizeof(values) + sum(map(sys.getsizeof, values)) for values in value.values())
+
+    return sys.getsizeof(value)
+
+
+def _copy_on_write() -> bool:
+    """Check whether Pandas copies shared data before modifying it, as it always does since 3.0."""
+    import pandas as pd  # noqa: PLC0415
+
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:
+        return False
+
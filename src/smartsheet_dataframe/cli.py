@@ -0,0 +1,94 @@
+"""Command line interface for the smartsheet_dataframe package.
+
+Installed as the ``smartsheet-dataframe`` command::
+
+    smartsheet-dataframe export --workspace 1234 --out ./snapshot
+
+The access token is read from ``--token`` or the ``SMARTSHEET_ACCESS_TOKEN``
+environment variable.
+"""
+
+# Standard Imports
+import argparse
+import logging
+import os
+import sys
+from typing import (
+    List,
+    Optional,
+)
+
+# Local Imports
+from .client import SmartsheetDataFrameClient
+from .export import (
+    FAILED,
+    SKIPPED,
+    export_to_parquet,
+)
+from .utils.constants import DEFAULT_MAX_WORKERS
+
+TOKEN_ENVIRONMENT_VARIABLE = "SMARTSHEET_ACCESS_TOKEN"  # noqa: S105
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command line interface.
+
+    :param argv: Command line arguments. ``sys.argv`` is used if not provided
+    :type argv: list[str]
+
+    :return: Exit status. 1 if any object could not be exported
+    :rtype: int
+    """
+    args = _parser().parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    token = args.token or os.environ.get(TOKEN_ENVIRONMENT_VARIABLE)
+    if not token:
+        sys.stderr.write(f"A token must be given with --token or the {TOKEN_ENVIRONMENT_VARIABLE} "
+                         "environment variable\n")
+        return 2
+
+    with SmartsheetDataFrameClient(token=token) as client:
+        results = export_to_parquet(args.out,
+                                    workspace_id=args.workspace,
+                                    folder_id=args.folder,
+                                    client=client,
+                                    max_workers=args.max_workers,
+                                    typed=not args.untyped,
+                                    reports=not args.no_reports)
+
+    failed = [result for result in results if result.status == FAILED]
+    skipped = sum(result.status == SKIPPED for result in results)
+    for result in failed:
+        sys.stderr.write(f"Failed to export {result.type_.lower()} {result.id_} ({result.name}): {result.error}\n")
+    sys.stdout.write(f"Exported {len(results) - len(failed) - skipped}, skipped {skipped} unchanged, "
+                     f"failed {len(failed)} of {len(results)} objects to {args.out}\n")
+
+    return 1 if failed else 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="smartsheet-dataframe",
+                                     description="Smartsheet sheets and reports as DataFrames")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export",
+                                 help="Export every sheet and report in a workspace or folder to Parquet files")
+    container = export.add_mutually_exclusive_group(required=True)
+    container.add_argument("--workspace", type=int, help="ID of the workspace to export")
+    container.add_argument("--folder", type=int, help="ID of the folder to export")
+    export.add_argument("--out", required=True, help="Directory to write the Parquet files and manifest to")
+    export.add_argument("--token", help=f"Smartsheet access token. Defaults to ${TOKEN_ENVIRONMENT_VARIABLE}")
+    export.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Maximum number of objects fetched at the same time")
+    export.add_argument("--untyped", action="store_true",
+                        help="Do not choose column types from the Smartsheet column types")
+    export.add_argument("--no-reports", action="store_true", help="Export only sheets")
+    export.add_argument("--verbose", action="store_true", help="Log every request")
+
+    return parser
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Reusable HTTP client for the smartsheet_dataframe package.
+
+A client holds a pooled ``requests.Session`` so that repeated fetches
+reuse the same keep-alive connections instead of opening a new TCP/TLS
+connection for every sheet or report.
+"""
+
+# Standard Imports
+import threading
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# 3rd-Party Imports
+import requests
+from requests.adapters import HTTPAdapter
+
+# Local Imports
+from .decoders import (
+    JsonDecoder,
+    get_json_decoder,
+)
+from .rate_limit import (
+    RateLimiter,
+    RetryPolicy,
+    get_rate_limiter,
+)
+from .stats import FetchHook
+from .utils.constants import (
+    DEFAULT_POOL_SIZE,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
+    SMARTSHEET_API_BASE_URL,
+)
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class BaseClient:
+    """Settings shared by the blocking and asyncio Smartsheet API clients.
+
+    :param token: Smartsheet Personal Access Token used when a call
+        does not provide its own token
+    :type token: str
+
+    :param timeout: Default request timeout in seconds, either a single value
+        or a ``(connect, read)`` tuple
+    :type timeout: float | tuple[float, float]
+
+    :param retries: Default number of attempts made for each request
+    :type retries: int
+
+    :param base_url: Smartsheet API base URL
+    :type base_url: str
+
+    :param rate_limiter: Rate limiter applied to every request sent by this client.
+        The process-wide limiter for the request's token is used if not provided
+    :type rate_limiter: RateLimiter
+
+    :param on_fetch: Hook called with the ``FetchStats`` of every sheet or report
+        fetched through this client, for example to export them as metrics
+    :type on_fetch: Callable[[FetchStats], None]
+
+    :param retry_policy: Backoff between attempts and total backoff allowed for each request
+    :type retry_policy: RetryPolicy
+
+    :param json_decoder: Decoder of response bodies. One of 'orjson', 'msgspec' or 'json',
+        or a function decoding bytes. The fastest installed library is used if not provided
+    :type json_decoder: str | Callable[[bytes], Any]
+
+    :param pause_gc: If True, the garbage collector is paused while a response body is decoded.
+        Decoding large bodies is then faster, but the pause applies to every thread in the process
+    :type pause_gc: bool
+    """
+
+    def __init__(self,
+                 token: Optional[str] = None,
+                 timeout: Timeout = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES,
+                 base_url: str = SMARTSHEET_API_BASE_URL,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 on_fetch: Optional[FetchHook] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 json_decoder: Union[str, JsonDecoder, None] = None,
+                 pause_gc: bool = False) -> None:
+        """Store the client settings."""
+        self.token = token
+        self.timeout = timeout
+        self.retries = retries
+        self.base_url = base_url.rstrip("/")
+        self.rate_limiter = rate_limiter
+        self.on_fetch = on_fetch
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.json_decoder = get_json_decoder(json_decoder)
+        self.pause_gc = pause_gc
+        # Column schemas of sheets by sheet ID, used to resolve column titles to IDs
+        # and to find the sheets that need cell object values
+        self.columns_cache: Dict[int, list] = {}
+
+    def headers(self, token: Optional[str] = None) -> dict:
+        """Build the request headers for a call.
+
+        :param token: Token overriding the client's own token for this call
+        :type token: str
+
+        :return: Request headers
+        :rtype: dict
+        """
+        token = token or self.token
+        if not token:
+            raise ValueError("A token must be provided either to the call or to the client")
+
+        return {"Authorization": f"Bearer {token}"}
+
+    def limiter(self, token: Optional[str] = None) -> RateLimiter:
+        """Get the rate limiter for a call.
+
+        :param token: Token overriding the client's own token for this call
+        :type token: str
+
+        :return: Rate limiter to acquire before each request
+        :rtype: RateLimiter
+        """
+        return self.rate_limiter or get_rate_limiter(token or self.token)
+
+
+class SmartsheetDataFrameClient(BaseClient):
+    """Pooled Smartsheet API client.
+
+    :param token: Smartsheet Personal Access Token used when a call
+        does not provide its own token
+    :type token: str
+
+    :param pool_size: Maximum number of keep-alive connections kept open
+    :type pool_size: int
+
+    :param timeout: Default request timeout in seconds, either a single value
+        or a ``(connect, read)`` tuple
+    :type timeout: float | tuple[float, float]
+
+    :param retries: Default number of attempts made for each request
+    :type retries: int
+
+    :param base_url: Smartsheet API base URL
+    :type base_url: str
+
+    :param rate_limiter: Rate limiter applied to every request sent by this client.
+        The process-wide limiter for the request's token is used if not provided
+    :type rate_limiter: RateLimiter
+
+    :param on_fetch: Hook called with the ``FetchStats`` of every sheet or report
+        fetched through this client, for example to export them as metrics
+    :type on_fetch: Callable[[FetchStats], None]
+
+    :param retry_policy: Backoff between attempts and total backoff allowed for each request
+    :type retry_policy: RetryPolicy
+
+    :param json_decoder: Decoder of response bodies. One of 'orjson', 'msgspec' or 'json',
+        or a function decoding bytes. The fastest installed library is used if not provided
+    :type json_decoder: str | Callable[[bytes], Any]
+
+    :param schema_first: If True, a sheet's columns are fetched, and cached on the client,
+        before its rows, and cell object values are only requested from sheets with
+        multi-contact columns. This roughly halves the response size of other sheets
+    :type schema_first: bool
+
+    :param pause_gc: If True, the garbage collector is paused while a response body is decoded.
+        Decoding large bodies is then faster, but the pause applies to every thread in the process
+    :type pause_gc: bool
+    """
+
+    def __init__(self,
+                 token: Optional[str] = None,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 timeout: Timeout = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES,
+                 base_url: str = SMARTSHEET_API_BASE_URL,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 on_fetch: Optional[FetchHook] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 json_decoder: Union[str, JsonDecoder, None] = None,
+                 schema_first: bool = False,
+                 pause_gc: bool = False) -> None:
+        """Create the client and its pooled session."""
+        if pool_size < 1:
+            raise ValueError("'pool_size' must be at least 1")
+
+        super().__init__(token, timeout, retries, base_url, rate_limiter, on_fetch, retry_policy,
+                         json_decoder, pause_gc)
+        self.pool_size = pool_size
+        self.schema_first = schema_first
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "SmartsheetDataFrameClient":  # noqa: PYI034
+        """Enter a ``with`` block."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the pooled connections when leaving a ``with`` block."""
+        self.close()
+
+
+_default_client: Optional[SmartsheetDataFrameClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> SmartsheetDataFrameClient:
+    """Get the process-wide client used when no client is passed to a call.
+
+    :return: Shared default client
+    :rtype: SmartsheetDataFrameClient
+    """
+    global _default_client
+
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = SmartsheetDataFrameClient()
+
+    return _default_client
@@ -0,0 +1,742 @@
+"""Conversion of Smartsheet rows to DataFrame columns.
+
+Rows are appended one at a time to a ``ColumnBuilder``, which keeps one
+buffer per column. This lets rows come from a decoded object dictionary
+or straight from a streaming JSON parser without building the whole
+object in memory first.
+
+The buffers are turned into a Pandas DataFrame by default, or into another
+output format chosen with the ``backend`` option. Pandas is only imported
+when a DataFrame is built.
+
+Large decoded objects can be converted on several cores with the
+``workers`` option when the interpreter runs without the GIL. Their rows
+are split into contiguous chunks, each is converted into its own builder
+in a shared thread pool, and the builders are joined in row order before
+the output is built.
+"""
+
+from __future__ import annotations
+
+# Standard Imports
+import logging
+import sys
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import (
+    date,
+    datetime,
+    timezone,
+)
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Local Imports
+from .backends import build_columns
+from .utils.constants import (
+    CATEGORICAL_COLUMN_TYPES,
+    CATEGORICAL_MAX_UNIQUE_RATIO,
+    CHECKBOX_COLUMN_TYPE,
+    DATE_COLUMN_TYPES,
+    DATETIME_COLUMN_TYPES,
+    PANDAS_BACKEND,
+    PARALLEL_CONVERT_MIN_ROWS,
+    TEXT_NUMBER_COLUMN_TYPE,
+)
+from .utils.sequences import zip_equal
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+COLUMNS_PREFIX = "columns.item"
+ROWS_PREFIX = "rows.item"
+
+# How a column is typed, chosen by _typed_kind
+BOOL_KIND = "bool"
+DATE_KIND = "date"
+DATETIME_KIND = "datetime"
+INT_KIND = "int"
+FLOAT_KIND = "float"
+
+
+class ConversionOptions(NamedTuple):
+    """Options controlling how Smartsheet rows are converted to a DataFrame.
+
+    :param include_row_id: If True, will append a 'row_id' column to the dataframe
+            and populate with row id for each row
+    :type include_row_id: bool
+
+    :param include_parent_id: If True, will append a 'parent_id' column to the
+            dataframe and populate with parent ID for each nested row
+    :type include_parent_id: bool
+
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type
+        and missing cells are nulls. If False, every column is inferred by Pandas and
+        missing cells are empty strings
+    :type typed: bool
+
+    :param hierarchy: If True, 'depth', 'root_id', 'sibling_index' and 'path' columns
+        describing each row's place in the sheet hierarchy are added
+    :type hierarchy: bool
+
+    :param categorical: If True, PICKLIST and contact columns, and text columns with few
+        distinct values, are stored as ``pd.Categorical``
+    :type categorical: bool
+
+    :param backend: Output format. One of 'pandas', 'arrow', 'polars' or 'dict'
+    :type backend: str
+
+    :param workers: Number of threads the rows of a large decoded object are converted in,
+        if the interpreter runs without the GIL. The output is the same as with one worker.
+        With the GIL, more than one worker has no effect and a warning is issued
+    :type workers: int
+    """
+
+    include_row_id: bool = True
+    include_parent_id: bool = True
+    typed: bool = True
+    hierarchy: bool = False
+    categorical: bool = False
+    backend: str = PANDAS_BACKEND
+    workers: int = 1
+
+
+class ColumnBuilder:
+    """Columnar buffer for Smartsheet rows.
+
+    :param options: Conversion options
+    :type options: ConversionOptions
+    """
+
+    def __init__(self, options: Optional[ConversionOptions] = None) -> None:
+        """Create empty buffers."""
+        self.options = options or ConversionOptions()
+        self.include_row_id = self.options.include_row_id
+        self.include_parent_id = self.options.include_parent_id
+        self._missing = None if self.options.typed else ""
+        self.row_ids: list[int] = []
+        self.parent_ids: list[Any] = []
+        self.buffers: list[list[Any]] = []
+        self.row_count = 0
+        self.cell_count = 0
+
+        # Hierarchy columns, and (depth, root_id, path) of each row seen so far by row ID
+        self.depths: list[int] = []
+        self.root_ids: list[int] = []
+        self.sibling_indexes: list[int] = []
+        self.paths: list[Tuple[int, ...]] = []
+        self._nodes: dict = {}
+        self._child_counts: dict = {}
+
+        # Repeated text values share one string object when building categorical columns
+        self._interned: Optional[dict] = {} if self.options.categorical else None
+
+    def add_row(self, row: dict) -> None:
+        """Append one row to the buffers.
+
+        :param row: Smartsheet row dictionary
+        :type row: dict
+        """
+        self._add_ids(int(row["id"]), int(row["parentId"]) if "parentId" in row else None)
+
+        cells = row["cells"]
+        self._grow(len(cells))
+
+        interned = self._interned
+        # The buffers were grown to at least the number of cells, so no cell is left out
+        for buffer, cell in zip(self.buffers, cells):
+            if "value" in cell:
+                value = cell["value"]
+            elif "objectValue" in cell:
+                value = _handle_object_value(cell["objectValue"])
+            else:
+                buffer.append(self._missing)
+                continue
+
+            if interned is not None and type(value) is str:
+                value = interned.setdefault(value, value)
+            buffer.append(value)
+
+        self._end_row(len(cells))
+
+    def add_model_row(self, row: Any) -> None:
+        """Append one smartsheet-python-sdk row to the buffers.
+
+        The row's attributes are read directly, which gives the same values as
+        ``add_row(row.to_dict())`` without copying the row into dictionaries.
+
+        :param row: Smartsheet Python SDK Row or ReportRow
+        :type row: Any
+        """
+        parent_id = row.parent_id
+        self._add_ids(int(row.id), None if parent_id is None else int(parent_id))
+
+        cells = row.cells
+        self._grow(len(cells))
+
+        interned = self._interned
+        # The buffers were grown to at least the number of cells, so no cell is left out
+        for buffer, cell in zip(self.buffers, cells):
+            value = cell.value
+            if value is None:
+                object_value = cell.object_value
+                if object_value is None:
+                    buffer.append(self._missing)
+                    continue
+                value = _handle_model_object_value(object_value)
+            elif not isinstance(value, (str, int, float)):
+                # ExplicitNull, which the SDK serializes as a null value
+                value = None
+
+            if interned is not None and type(value) is str:
+                value = interned.setdefault(value, value)
+            buffer.append(value)
+
+        self._end_row(len(cells))
+
+    def _add_ids(self, row_id: int, parent_id: Optional[int]) -> None:
+        if self.include_row_id:
+            self.row_ids.append(row_id)
+        if self.include_parent_id:
+            self.parent_ids.append(self._missing if parent_id is None else parent_id)
+        if self.options.hierarchy:
+            self._add_node(row_id, parent_id)
+
+    def _grow(self, cell_count: int) -> None:
+        while len(self.buffers) < cell_count:
+            self.buffers.append([None] * self.row_count)
+
+    def _end_row(self, cell_count: int) -> None:
+        # Rows with fewer cells than other rows are padded with nulls
+        for buffer in self.buffers[cell_count:]:
+            buffer.append(None)
+
+        self.row_count += 1
+        self.cell_count += cell_count
+
+    def _add_node(self, row_id: int, parent_id: Optional[int]) -> None:
+        """Place a row in the hierarchy from its already placed parent.
+
+        Sheet rows are listed with each parent before its children, so one pass is
+        enough. A row whose parent was not loaded, for example because it was left
+        out by a row filter, is placed as a root.
+        """
+        parent = self._nodes.get(parent_id)
+        if parent is None:
+            depth, root_id, path = 0, row_id, (row_id,)
+        else:
+            depth, root_id, path = parent[0] + 1, parent[1], parent[2] + (row_id,)
+        self._nodes[row_id] = (depth, root_id, path)
+
+        sibling_index = self._child_counts.get(parent_id, 0)
+        self._child_counts[parent_id] = sibling_index + 1
+
+        self.depths.append(depth)
+        self.root_ids.append(root_id)
+        self.sibling_indexes.append(sibling_index)
+        self.paths.append(path)
+
+    def add_rows(self, rows: Iterable[dict]) -> None:
+        """Append many rows to the buffers.
+
+        :param rows: Smartsheet row dictionaries
+        :type rows: Iterable[dict]
+        """
+        for row in rows:
+            self.add_row(row)
+
+    def add_model_rows(self, rows: Iterable[Any]) -> None:
+        """Append many smartsheet-python-sdk rows to the buffers.
+
+        :param rows: Smartsheet Python SDK Row or ReportRow objects
+        :type rows: Iterable[Any]
+        """
+        for row in rows:
+            self.add_model_row(row)
+
+    def extend(self, other: ColumnBuilder) -> None:
+        """Append the rows buffered by another builder after this builder's rows.
+
+        The hierarchy columns are not copied, since the other builder could not
+        place its rows under parents it did not see.
+
+        :param other: Builder of the following rows, created with the same options
+        :type other: ColumnBuilder
+        """
+        self._grow(len(other.buffers))
+        for position, buffer in enumerate(self.buffers):
+            if position < len(other.buffers):
+                buffer.extend(other.buffers[position])
+            else:
+                buffer.extend([None] * other.row_count)
+
+        self.row_ids.extend(other.row_ids)
+        self.parent_ids.extend(other.parent_ids)
+        self.row_count += other.row_count
+        self.cell_count += other.cell_count
+
+    def select(self, columns: list, positions: list) -> list:
+        """Keep only the buffers of the columns at the given positions.
+
+        :param columns: Smartsheet column dictionaries, in cell order
+        :type columns: list[dict]
+
+        :param positions: Positions of the columns to keep
+        :type positions: list[int]
+
+        :return: Column dictionaries of the kept columns
+        :rtype: list[dict]
+        """
+        self.buffers = [self.buffers[position] if position < len(self.buffers) else [None] * self.row_count
+                        for position in positions]
+
+        return [columns[position] for position in positions]
+
+    def build(self, columns: list) -> Any:
+        """Build the output of the ``backend`` option from the buffered rows.
+
+        :param columns: Smartsheet column dictionaries, in cell order
+        :type columns: list[dict]
+
+        :return: Pandas DataFrame, or the output of another backend
+        :rtype: pd.DataFrame | pyarrow.Table | polars.DataFrame | dict[str, list]
+        """
+        if self.options.backend == PANDAS_BACKEND:
+            return self.to_dataframe(columns)
+
+        names, data = self._id_columns()
+        values = self._cell_columns(columns)
+        if self.options.typed:
+            values = [_typed_values(column_values, column.get("type"))
+                      for column_values, column in zip_equal(values, columns)]
+
+        categorical = [False] * len(names)
+        for column_values, column in zip_equal(values, columns):
+            names.append(column["title"])
+            data.append(column_values)
+            categorical.append(self.options.categorical and _categories(column_values, column) is not None)
+
+        return build_columns(self.options.backend, names, data, categorical)
+
+    def to_dataframe(self, columns: list) -> pd.DataFrame:
+        """Build the DataFrame from the buffered rows.
+
+        :param columns: Smartsheet column dictionaries, in cell order
+        :type columns: list[dict]
+
+        :return: Pandas DataFrame with object data
+        :rtype: pd.DataFrame
+        """
+        import pandas as pd  # noqa: PLC0415
+
+        data: list[Any] = self._cell_columns(columns)
+        if self.options.typed:
+            data = [_typed_column(values, column.get("type")) for values, column in zip_equal(data, columns)]
+        if self.options.categorical:
+            # Columns already converted to a typed array are left as they are
+            data = [_categorical_column(values, column) if isinstance(values, list) else values
+                    for values, column in zip_equal(data, columns)]
+
+        id_names, id_data = self._id_columns()
+        if self.options.typed:
+            id_data = [pd.array(values, dtype="Int64") if name in ("row_id", "parent_id") else values
+                       for name, values in zip_equal(id_names, id_data)]
+        columns_list: list[str] = id_names + [column["title"] for column in columns]
+        data[:0] = id_data
+
+        # Handle empty sheet condition
+        if not self.row_count:
+            return pd.DataFrame(columns=columns_list)  # pyright: ignore
+
+        # Positional keys keep duplicate column titles apart
+        df = pd.DataFrame(dict(enumerate(data)))
+        df.columns = columns_list
+        return df
+
+    def _cell_columns(self, columns: list) -> list:
+        if len(self.buffers) > len(columns):
+            raise ValueError(f"Rows have {len(self.buffers)} cells but there are only {len(columns)} columns")
+
+        data = list(self.buffers)
+        # Columns without any cell in any row
+        data.extend([None] * self.row_count for _ in range(len(columns) - len(data)))
+        return data
+
+    def _id_columns(self) -> Tuple[list, list]:
+        names: list[str] = []
+        data: list[list[Any]] = []
+        if self.include_row_id:
+            names.append("row_id")
+            data.append(self.row_ids)
+        if self.include_parent_id:
+            names.append("parent_id")
+            data.append(self.parent_ids)
+        if self.options.hierarchy:
+            names.extend(["depth", "root_id", "sibling_index", "path"])
+            data.extend([self.depths, self.root_ids, self.sibling_indexes, self.paths])
+
+        return names, data
+
+
+def convert_rows(rows: Sequence[dict], options: ConversionOptions) -> ColumnBuilder:
+    """Append rows to a new column builder, on several cores if the ``workers`` option allows.
+
+    Objects with fewer than ``PARALLEL_CONVERT_MIN_ROWS`` rows, and every
+    object when the interpreter runs with the GIL, are converted in the
+    calling thread. Sending decoded rows to other processes instead would
+    cost more than converting them: pickling them takes several times as
+    long. A warning is issued when more than one worker is asked for on an
+    interpreter with the GIL.
+
+    :param rows: Smartsheet row dictionaries
+    :type rows: Sequence[dict]
+
+    :param options: Conversion options
+    :type options: ConversionOptions
+
+    :return: Builder holding the rows, in order
+    :rtype: ColumnBuilder
+    """
+    builder = ColumnBuilder(options)
+    if options.workers > 1 and _gil_enabled():
+        warnings.warn("Converting on several workers needs a Python build without the GIL. "
+                      "The rows are converted in the calling thread", stacklevel=2)
+    if options.workers < 2 or len(rows) < PARALLEL_CONVERT_MIN_ROWS or _gil_enabled():
+        builder.add_rows(rows)
+        return builder
+
+    chunk_rows = -(-len(rows) // options.workers)
+    chunks = [rows[start:start + chunk_rows] for start in range(0, len(rows), chunk_rows)]
+    chunk_options = options._replace(hierarchy=False, workers=1)
+    for chunk in _conversion_pool(options.workers).map(_convert_chunk, chunks, [chunk_options] * len(chunks)):
+        builder.extend(chunk)
+
+    if options.hierarchy:
+        # Parents can be in earlier chunks, so rows are placed once every chunk is joined
+        for row in rows:
+            builder._add_node(int(row["id"]), int(row["parentId"]) if "parentId" in row else None)
+
+    return builder
+
+
+def _convert_chunk(rows: Sequence[dict], options: ConversionOptions) -> ColumnBuilder:
+    builder = ColumnBuilder(options)
+    builder.add_rows(rows)
+
+    return builder
+
+
+def _gil_enabled() -> bool:
+    # sys._is_gil_enabled was added in Python 3.13
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+_conversion_pools: Dict[int, ThreadPoolExecutor] = {}
+_conversion_pools_lock = threading.Lock()
+
+
+def _conversion_pool(workers: int) -> ThreadPoolExecutor:
+    """Get the process-wide pool with the given number of threads, creating it on first use.
+
+    Sharing the pool keeps the number of conversion threads bounded when
+    several objects are converted at the same time.
+    """
+    with _conversion_pools_lock:
+        pool = _conversion_pools.get(workers)
+        if pool is None:
+            pool = _conversion_pools[workers] = ThreadPoolExecutor(workers, thread_name_prefix="convert")
+
+    return pool
+
+
+def cast_like(df: pd.DataFrame, like: pd.DataFrame) -> pd.DataFrame:
+    """Cast a DataFrame to the dtypes of another DataFrame with the same columns.
+
+    A batch of rows is typed from its own values, so a column can come back
+    with another dtype than in an earlier batch, for example float64 when all
+    its cells in the batch are empty. Columns whose values do not fit the
+    other dtype are left as they are.
+
+    :param df: DataFrame to cast, in place
+    :type df: pd.DataFrame
+
+    :param like: DataFrame whose dtypes are used
+    :type like: pd.DataFrame
+
+    :return: The DataFrame with the other DataFrame's dtypes
+    :rtype: pd.DataFrame
+    """
+    for column, dtype in like.dtypes.items():
+        if df[column].dtype == dtype:
+            continue
+        try:
+            df[column] = df[column].astype(dtype)
+        except (TypeError, ValueError):
+            logger.debug(f"Values of column {column!r} do not fit its dtype {dtype}")
+
+    return df
+
+
+def stream_into(fileobj: IO[bytes], builder: ColumnBuilder) -> Tuple[list, dict]:
+    """Parse a Smartsheet JSON response incrementally into a column builder.
+
+    Each element of ``rows`` is decoded on its own and appended to the
+    builder, so the full object dictionary is never held in memory.
+    Requires the optional ``ijson`` dependency.
+
+    :param fileobj: Binary file-like object holding the response body
+    :type fileobj: IO[bytes]
+
+    :param builder: Builder the rows are appended to
+    :type builder: ColumnBuilder
+
+    :return: Column dictionaries, and the top-level scalar fields such as ``totalRowCount``
+    :rtype: tuple[list[dict], dict]
+    """
+    columns: list[dict] = []
+    fields: dict = {}
+
+    for prefix, value in _iter_json_items(fileobj):
+        if prefix == ROWS_PREFIX:
+            builder.add_row(value)
+        elif prefix == COLUMNS_PREFIX:
+            columns.append(value)
+        else:
+            fields[prefix] = value
+
+    return columns, fields
+
+
+def _iter_json_items(fileobj: IO[bytes]) -> Iterator[Tuple[str, Any]]:
+    """Yield each column, each row and each top-level scalar of a JSON object.
+
+    :param fileobj: Binary file-like object holding the JSON document
+    :type fileobj: IO[bytes]
+
+    :return: Generator of ``(prefix, value)`` pairs
+    :rtype: Iterator[tuple[str, Any]]
+    """
+    try:
+        import ijson  # noqa: PLC0415
+    except ModuleNotFoundError as e:
+        raise ImportError("Streaming requires the 'ijson' package. "
+                          "Install it with 'pip install smartsheet-dataframe[stream]'") from e
+
+    builder = None
+    builder_prefix = ""
+    for prefix, event, value in ijson.parse(fileobj, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == builder_prefix and event in ("end_map", "end_array"):
+                yield builder_prefix, builder.value
+                builder = None
+        elif prefix in (COLUMNS_PREFIX, ROWS_PREFIX) and event in ("start_map", "start_array"):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            builder_prefix = prefix
+        elif prefix and "." not in prefix and event in ("string", "number", "boolean", "null"):
+            yield prefix, value
+
+
+def _typed_column(values: list, column_type: Optional[str]) -> Any:
+    """Convert a column buffer to the array type matching its Smartsheet column type.
+
+    Values that do not fit the column type, such as text typed into a date
+    column without validation, leave the column to Pandas inference. A column
+    without values still gets the array type of its column type.
+
+    :param values: Column values, with None for missing cells
+    :type values: list
+
+    :param column_type: Smartsheet column type, such as 'TEXT_NUMBER' or 'DATE'
+    :type column_type: str | None
+
+    :return: Typed array, or the values unchanged
+    :rtype: Any
+    """
+    import pandas as pd  # noqa: PLC0415
+
+    kind = _typed_kind(values, column_type)
+    if kind == BOOL_KIND:
+        # Unchecked boxes are often missing rather than False
+        return pd.array([bool(value) for value in values], dtype=bool)
+    if kind in (DATE_KIND, DATETIME_KIND):
+        return _datetime_column(values, utc=kind == DATETIME_KIND)
+    if kind == INT_KIND:
+        return pd.array(values, dtype="Int64")
+    if kind == FLOAT_KIND:
+        return pd.Series(values, dtype="float64")
+
+    return values
+
+
+def _datetime_column(values: list, utc: bool) -> Any:
+    import pandas as pd  # noqa: PLC0415
+
+    try:
+        return pd.to_datetime(pd.Series(values, dtype=object), utc=utc)
+    except (ValueError, TypeError, OverflowError):
+        return values
+
+
+def _typed_kind(values: list, column_type: Optional[str]) -> Optional[str]:
+    """Choose how a column buffer is typed, from its Smartsheet column type and the types of its values.
+
+    Both ``_typed_column`` and ``_typed_values`` use this, so every backend
+    types a column the same way.
+
+    :param values: Column values, with None for missing cells
+    :type values: list
+
+    :param column_type: Smartsheet column type, such as 'TEXT_NUMBER' or 'DATE'
+    :type column_type: str | None
+
+    :return: One of the ``*_KIND`` values, or None if the values are left unchanged
+    :rtype: str | None
+    """
+    kinds = {type(value) for value in values if value is not None}
+    if column_type == CHECKBOX_COLUMN_TYPE:
+        return BOOL_KIND if kinds <= {bool} else None
+    if column_type in DATE_COLUMN_TYPES or column_type in DATETIME_COLUMN_TYPES:
+        if not kinds <= {str}:
+            return None
+        return DATETIME_KIND if column_type in DATETIME_COLUMN_TYPES else DATE_KIND
+    if column_type in (None, TEXT_NUMBER_COLUMN_TYPE) and kinds <= {int, float}:
+        # A column without values is numeric, since Smartsheet stores numbers in these columns
+        return INT_KIND if kinds == {int} else FLOAT_KIND
+
+    return None
+
+
+def _categorical_column(values: list, column: dict) -> Any:
+    """Convert a text column buffer to a ``pd.Categorical`` if it is worth it.
+
+    PICKLIST and contact columns are always converted. The categories of a
+    PICKLIST column are its options, followed by any other value found in
+    its cells. Other text columns are converted when at most
+    ``CATEGORICAL_MAX_UNIQUE_RATIO`` of their values are distinct.
+
+    :param values: Column values, with None for missing cells
+    :type values: list
+
+    :param column: Smartsheet column dictionary
+    :type column: dict
+
+    :return: Categorical, or the values unchanged
+    :rtype: Any
+    """
+    import pandas as pd  # noqa: PLC0415
+
+    categories = _categories(values, column)
+    if categories is None:
+        return values
+
+    return pd.Categorical(values, categories=categories)
+
+
+def _categories(values: list, column: dict) -> Optional[list]:
+    """Get the categories of a text column that should be stored as categorical.
+
+    :param values: Column values, with None for missing cells
+    :type values: list
+
+    :param column: Smartsheet column dictionary
+    :type column: dict
+
+    :return: Categories, or None if the column should not be categorical
+    :rtype: list[str] | None
+    """
+    present = [value for value in values if value is not None]
+    if any(type(value) is not str for value in present):
+        return None
+
+    column_type = column.get("type")
+    if column_type in CATEGORICAL_COLUMN_TYPES:
+        return list(dict.fromkeys([*(column.get("options") or ()), *present]))
+
+    if column_type in (None, TEXT_NUMBER_COLUMN_TYPE) and present:
+        unique = list(dict.fromkeys(present))
+        if len(unique) <= len(values) * CATEGORICAL_MAX_UNIQUE_RATIO:
+            return unique
+
+    return None
+
+
+def _typed_values(values: list, column_type: Optional[str]) -> list:
+    """Convert a column buffer to the Python values matching its Smartsheet column type.
+
+    This is the counterpart of ``_typed_column`` for backends other than Pandas.
+    Dates become ``datetime.date`` and date-times become UTC ``datetime.datetime``.
+
+    :param values: Column values, with None for missing cells
+    :type values: list
+
+    :param column_type: Smartsheet column type, such as 'TEXT_NUMBER' or 'DATE'
+    :type column_type: str | None
+
+    :return: Typed values, or the values unchanged
+    :rtype: list
+    """
+    kind = _typed_kind(values, column_type)
+    if kind == BOOL_KIND:
+        return [bool(value) for value in values]
+    if kind in (DATE_KIND, DATETIME_KIND):
+        parse = _parse_datetime if kind == DATETIME_KIND else _parse_date
+        try:
+            return [None if value is None else parse(value) for value in values]
+        except ValueError:
+            return values
+    if kind == FLOAT_KIND:
+        return [None if value is None else float(value) for value in values]
+
+    return values
+
+
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value[:10])
+
+
+def _parse_datetime(value: str) -> datetime:
+    text = value[:-1] + "+0000" if value.endswith("Z") else value
+    for date_format in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            parsed = datetime.strptime(text, date_format)  # noqa: DTZ007
+        except ValueError:
+            continue
+
+        return parsed.astimezone(timezone.utc) if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+    raise ValueError(f"Unknown date-time format: {value}")
+
+
+def _handle_object_value(object_value: dict) -> str:
+    email_list_string: str = ""
+    if object_value["objectType"].upper() == "MULTI_CONTACT":
+        email_list_string = ", ".join(obj["email"] for obj in object_value["values"])
+
+    return email_list_string
+
+
+def _handle_model_object_value(object_value: Any) -> str:
+    """Join the emails of a smartsheet-python-sdk MULTI_CONTACT ObjectValue, like ``_handle_object_value``."""
+    # The SDK is already imported when one of its objects is converted
+    from smartsheet.models.object_value import MULTI_CONTACT  # noqa: PLC0415
+
+    email_list_string: str = ""
+    if getattr(object_value, "object_type", None) == MULTI_CONTACT:
+        email_list_string = ", ".join(obj.email for obj in getattr(object_value, "values", ()))
+
+    return email_list_string
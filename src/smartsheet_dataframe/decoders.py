@@ -0,0 +1,131 @@
+"""JSON decoders for the smartsheet_dataframe package.
+
+Response bodies are decoded straight from bytes with ``orjson`` or
+``msgspec`` when one of them is installed, which is faster than the
+standard library and skips decoding the body to a str first. The
+decoded strings are the ones stored in the output columns, so they are
+not copied again during the conversion.
+"""
+
+# Standard Imports
+import gc
+import json
+import threading
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Union,
+)
+
+# Local Imports
+from .utils.constants import (
+    JSON_DECODERS,
+    MSGSPEC_DECODER,
+    ORJSON_DECODER,
+    STDLIB_DECODER,
+)
+
+JsonDecoder = Callable[[bytes], Any]
+
+
+def get_json_decoder(decoder: Union[str, JsonDecoder, None] = None) -> JsonDecoder:
+    """Get the function used to decode response bodies.
+
+    :param decoder: One of 'orjson', 'msgspec' or 'json', or a function decoding bytes.
+        The fastest installed library is used if not provided
+    :type decoder: str | Callable[[bytes], Any]
+
+    :return: Function decoding a JSON document from bytes
+    :rtype: Callable[[bytes], Any]
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is not None and decoder not in JSON_DECODERS:
+        raise ValueError(f"'json_decoder' parameter must be one of {', '.join(JSON_DECODERS)} or a function. "
+                         f"The current value is {decoder}")
+
+    for name in (decoder,) if decoder is not None else JSON_DECODERS:
+        loads = _import_decoder(name)
+        if loads is not None:
+            return loads
+
+    raise ImportError(f"The '{decoder}' JSON decoder requires the '{decoder}' package. "
+                      "Install it with 'pip install smartsheet-dataframe[fast-json]'")
+
+
+def decode_json(decoder: JsonDecoder, body: bytes, pause_gc: bool = False) -> Any:
+    """Decode a response body, optionally with the garbage collector paused.
+
+    A large body decodes into millions of new lists and dicts, which set off
+    many collections that find nothing to free. Pausing the collector avoids
+    them, but it is paused for every thread in the process, so it is opt-in.
+    Concurrent decodes share one pause, and a collector disabled by the
+    application is left disabled.
+
+    :param decoder: Function decoding a JSON document from bytes
+    :type decoder: Callable[[bytes], Any]
+
+    :param body: Response body
+    :type body: bytes
+
+    :param pause_gc: If True, the garbage collector is paused while the body is decoded
+    :type pause_gc: bool
+
+    :return: Decoded document
+    :rtype: Any
+    """
+    if not pause_gc or not _pause_gc():
+        return decoder(body)
+
+    try:
+        return decoder(body)
+    finally:
+        _resume_gc()
+
+
+_gc_lock = threading.Lock()
+# Number of decodes running with the garbage collector paused
+_gc_pauses = 0
+
+
+def _pause_gc() -> bool:
+    """Pause the garbage collector, or get False if the application has disabled it."""
+    global _gc_pauses
+
+    with _gc_lock:
+        if not _gc_pauses:
+            if not gc.isenabled():
+                return False
+            gc.disable()
+        _gc_pauses += 1
+
+    return True
+
+
+def _resume_gc() -> None:
+    """End a pause, enabling the garbage collector again once no decode holds it paused."""
+    global _gc_pauses
+
+    with _gc_lock:
+        _gc_pauses -= 1
+        if not _gc_pauses:
+            gc.enable()
+
+
+def _import_decoder(name: Optional[str]) -> Optional[JsonDecoder]:
+    """Import a decoder library, or get None if it is not installed."""
+    if name == STDLIB_DECODER:
+        return json.loads
+
+    try:
+        if name == ORJSON_DECODER:
+            import orjson  # noqa: PLC0415
+            return orjson.loads
+        if name == MSGSPEC_DECODER:
+            import msgspec  # noqa: PLC0415
+            return msgspec.json.Decoder().decode
+    except ImportError:
+        pass
+
+    return None
@@ -3,3 +3,11 @@
 
 class AuthenticationError(BaseException):
     """Raised when the user is not authenticated."""
+
+
+class RetryError(Exception):
+    """Raised when a request still fails after every retry."""
+
+
+class WriteError(Exception):
+    """Raised when Smartsheet rejects a request that changes a sheet."""
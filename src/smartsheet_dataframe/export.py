@@ -0,0 +1,270 @@
+"""Bulk export of workspaces and folders for the smartsheet_dataframe package.
+
+``export_to_parquet`` finds every sheet and report in a workspace or folder,
+including its subfolders, and writes each one to its own Parquet file as
+soon as it is converted. A manifest in the output directory records the
+version of every sheet exported, so that running the export again skips
+the sheets that have not changed and picks up where an interrupted export
+stopped.
+
+Requires the optional ``pyarrow`` dependency.
+"""
+
+# Standard Imports
+import json
+import logging
+import threading
+import uuid
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    as_completed,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+# Local Imports
+from .client import (
+    SmartsheetDataFrameClient,
+    get_default_client,
+)
+from .smartsheet_dataframe import (
+    _get_json,
+    get_as_df,
+)
+from .utils.constants import (
+    ARROW_BACKEND,
+    DEFAULT_MAX_WORKERS,
+    REPORT,
+    SHEET,
+)
+
+if TYPE_CHECKING:
+    import os
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+EXPORTED = "exported"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+class ExportResult(NamedTuple):
+    """Outcome of exporting one sheet or report.
+
+    :param type_: 'sheet' or 'report'
+    :type type_: str
+
+    :param id_: ID of the object
+    :type id_: int
+
+    :param name: Name of the object
+    :type name: str
+
+    :param path: Parquet file holding the object
+    :type path: pathlib.Path
+
+    :param status: 'exported', 'skipped' if the sheet is unchanged since the last export, or 'failed'
+    :type status: str
+
+    :param version: Version of the sheet exported. Reports have no version
+    :type version: int
+
+    :param error: Exception raised if the export failed
+    :type error: Exception
+    """
+
+    type_: str
+    id_: int
+    name: str
+    path: Path
+    status: str
+    version: Optional[int] = None
+    error: Optional[Exception] = None
+
+
+def export_to_parquet(out_dir: Union[str, "os.PathLike[str]"],
+                      workspace_id: Optional[int] = None,
+                      folder_id: Optional[int] = None,
+                      token: Optional[str] = None,
+                      client: Optional[SmartsheetDataFrameClient] = None,
+                      max_workers: int = DEFAULT_MAX_WORKERS,
+                      include_row_id: bool = True,
+                      include_parent_id: bool = True,
+                      typed: bool = True,
+                      reports: bool = True) -> List[ExportResult]:
+    """Export every sheet and report in a workspace or folder to Parquet files.
+
+    Objects are fetched from a thread pool that shares the client's rate
+    limiter, and each is written to ``<out_dir>/<type>/<id>.parquet`` as soon
+    as it is converted. A sheet whose version is the same as in the manifest
+    of the previous export is skipped. Reports have no version, so they are
+    exported every time.
+
+    :param out_dir: Directory to write the Parquet files and the manifest to.
+        It is created if it does not exist
+    :type out_dir: str | os.PathLike
+
+    :param workspace_id: ID of the workspace to export
+    :type workspace_id: int
+
+    :param folder_id: ID of the folder to export, if no workspace is given
+    :type folder_id: int
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param client: Client whose pooled session, token and timeouts are used
+        for the requests. The shared default client is used if not provided
+    :type client: SmartsheetDataFrameClient
+
+    :param max_workers: Maximum number of objects fetched at the same time
+    :type max_workers: int
+
+    :param include_row_id: If True, each file has a 'row_id' column
+    :type include_row_id: bool
+
+    :param include_parent_id: If True, each file has a 'parent_id' column
+    :type include_parent_id: bool
+
+    :param typed: If True, each column's type is chosen from its Smartsheet column type
+    :type typed: bool
+
+    :param reports: If False, only sheets are exported
+    :type reports: bool
+
+    :return: Outcome of every object found, in the order they were listed.
+        An object that could not be exported has the 'failed' status and the raised exception
+    :rtype: list[ExportResult]
+    """
+    try:
+        import pyarrow.parquet  # noqa: F401, PLC0415
+    except ModuleNotFoundError as e:
+        raise ImportError("Exporting to Parquet requires the 'pyarrow' package. "
+                          "Install it with 'pip install smartsheet-dataframe[parquet]'") from e
+
+    if (workspace_id is None) == (folder_id is None):
+        raise ValueError("Exactly one of 'workspace_id' or 'folder_id' must be provided")
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be at least 1")
+
+    client = client or get_default_client()
+    token = token or client.token
+    if not token:
+        raise ValueError("A token must be included in the parameters or in the client")
+
+    if workspace_id is not None:
+        objects = _list_objects(client, token, f"{client.base_url}/workspaces/{workspace_id}")
+    else:
+        objects = _list_objects(client, token, f"{client.base_url}/folders/{folder_id}")
+    if not reports:
+        objects = [obj for obj in objects if obj[0] == SHEET]
+
+    manifest = _Manifest(Path(out_dir))
+
+    def export_object(type_: str, id_: int, name: str) -> ExportResult:
+        path = manifest.directory / type_.lower() / f"{id_}.parquet"
+        version = None
+        try:
+            if type_ == SHEET:
+                version = _get_json(client, f"{client.base_url}/sheets/{id_}/version", token)["version"]
+                if manifest.is_current(type_, id_, version, path):
+                    logger.debug(f"Skipping unchanged sheet {id_}")
+                    return ExportResult(type_, id_, name, path, SKIPPED, version)
+
+            table = get_as_df(type_, token=token, id_=id_,
+                              include_row_id=include_row_id,
+                              include_parent_id=include_parent_id,
+                              client=client,
+                              typed=typed,
+                              backend=ARROW_BACKEND)
+            _write_table(table, path)
+            manifest.record(type_, id_, name, path, version, table.num_rows)
+        except Exception as e:
+            logger.warning(f"Could not export {type_.lower()} {id_}", exc_info=True)
+            return ExportResult(type_, id_, name, path, FAILED, version, e)
+
+        return ExportResult(type_, id_, name, path, EXPORTED, version)
+
+    results: Dict[tuple, ExportResult] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(export_object, *obj): obj[:2] for obj in objects}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return [results[obj[:2]] for obj in objects]
+
+
+def _list_objects(client: SmartsheetDataFrameClient, token: str, url: str) -> List[tuple]:
+    """List the sheets and reports in a workspace or folder and its subfolders.
+
+    :return: ``(type_, id_, name)`` of each object
+    :rtype: list[tuple[str, int, str]]
+    """
+    container = _get_json(client, url, token)
+    objects = [(SHEET, sheet["id"], sheet.get("name", "")) for sheet in container.get("sheets", [])]
+    objects += [(REPORT, report["id"], report.get("name", "")) for report in container.get("reports", [])]
+    for folder in container.get("folders", []):
+        objects += _list_objects(client, token, f"{client.base_url}/folders/{folder['id']}")
+
+    return objects
+
+
+def _write_table(table: Any, path: Path) -> None:
+    """Write a table to a Parquet file, replacing it only once it is complete."""
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f".{path.stem}-{uuid.uuid4().hex}.tmp")
+    try:
+        pq.write_table(table, temporary_path)
+        temporary_path.replace(path)
+    finally:
+        if temporary_path.exists():
+            temporary_path.unlink()
+
+
+class _Manifest:
+    """Record of the objects exported to a directory, saved after every object."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / MANIFEST_NAME
+        self._lock = threading.Lock()
+        try:
+            self.objects: Dict[str, dict] = json.loads(self.path.read_text())["objects"]
+        except (OSError, ValueError, KeyError):
+            self.objects = {}
+
+    def is_current(self, type_: str, id_: int, version: int, path: Path) -> bool:
+        entry = self.objects.get(f"{type_.lower()}-{id_}")
+        return entry is not None and entry.get("version") == version and path.exists()
+
+    def record(self, type_: str, id_: int, name: str, path: Path, version: Optional[int], rows: int) -> None:
+        with self._lock:
+            self.objects[f"{type_.lower()}-{id_}"] = {
+                "type": type_.lower(),
+                "id": id_,
+                "name": name,
+                "path": path.relative_to(self.directory).as_posix(),
+                "version": version,
+                "rows": rows,
+                "exported_at": datetime.now(timezone.utc).isoformat(),
+            }
+            temporary_path = self.directory / f".{MANIFEST_NAME}-{uuid.uuid4().hex}.tmp"
+            temporary_path.write_text(json.dumps({"objects": self.objects}, indent=2))
+            temporary_path.replace(self.path)
@@ -0,0 +1,145 @@
+"""Hierarchy helpers for the smartsheet_dataframe package.
+
+These functions work on DataFrames fetched with ``hierarchy=True``, which
+hold 'depth', 'root_id', 'sibling_index' and 'path' columns computed while
+the rows were converted. 'path' is the tuple of row IDs from the row's root
+down to the row itself.
+"""
+
+from __future__ import annotations
+
+# Standard Imports
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Sequence,
+    Union,
+)
+
+# Local Imports
+from .utils.sequences import zip_equal
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def hierarchy_index(df: pd.DataFrame) -> pd.MultiIndex:
+    """Build a MultiIndex with one level per hierarchy depth.
+
+    Each row is indexed by the row IDs of its path, padded with nulls below
+    its own depth, so ``df.set_axis(hierarchy_index(df)).loc[root_id]`` selects
+    a whole tree.
+
+    :param df: DataFrame fetched with ``hierarchy=True``
+    :type df: pd.DataFrame
+
+    :return: Index with levels 'level_0' to 'level_<max depth>'
+    :rtype: pd.MultiIndex
+    """
+    import pandas as pd  # noqa: PLC0415
+
+    paths = _column(df, "path")
+    width = max((len(path) for path in paths), default=1)
+    padded = [tuple(path) + (None,) * (width - len(path)) for path in paths]
+
+    return pd.MultiIndex.from_tuples(padded, names=[f"level_{depth}" for depth in range(width)])
+
+
+def adjacency(df: pd.DataFrame) -> Dict[int, List[int]]:
+    """Map each parent row ID to the IDs of its children, in sibling order.
+
+    :param df: DataFrame with 'row_id' and 'parent_id' columns, or indexed by row ID
+    :type df: pd.DataFrame
+
+    :return: Dictionary of parent row ID to child row IDs. Top-level rows are not children of any row
+    :rtype: dict[int, list[int]]
+    """
+    import pandas as pd  # noqa: PLC0415
+
+    children: Dict[int, List[int]] = {}
+    for row_id, parent_id in zip_equal(_row_ids(df), _column(df, "parent_id")):
+        if not pd.isna(parent_id) and parent_id != "":
+            children.setdefault(int(parent_id), []).append(int(row_id))
+
+    return children
+
+
+def subtree(df: pd.DataFrame, row_id: int, include_self: bool = True) -> pd.DataFrame:
+    """Select a row and all of its descendants.
+
+    :param df: DataFrame fetched with ``hierarchy=True``
+    :type df: pd.DataFrame
+
+    :param row_id: Row ID of the subtree's top row
+    :type row_id: int
+
+    :param include_self: If False, only the descendants are selected
+    :type include_self: bool
+
+    :return: Rows of the subtree, in sheet order
+    :rtype: pd.DataFrame
+    """
+    row_ids = _row_ids(df)
+    paths = _column(df, "path")
+    positions = [position for position, value in enumerate(row_ids) if value == row_id]
+    if not positions:
+        raise KeyError(row_id)
+
+    # A descendant holds the row's ID at the row's depth in its path
+    depth = len(paths[positions[0]]) - 1
+    mask = [len(path) > depth and path[depth] == row_id for path in paths]
+    if not include_self:
+        mask = [selected and value != row_id for selected, value in zip_equal(mask, row_ids)]
+
+    return df.loc[mask]
+
+
+def rollup(df: pd.DataFrame,
+           columns: Union[str, Sequence[str]],
+           func: Any = "sum") -> Union[pd.Series, pd.DataFrame]:
+    """Aggregate each row together with all of its descendants.
+
+    Every row is counted once for itself and once for each of its ancestors,
+    so the whole roll-up is done in a single group-by.
+
+    :param df: DataFrame fetched with ``hierarchy=True``
+    :type df: pd.DataFrame
+
+    :param columns: Column, or columns, to aggregate
+    :type columns: str | Sequence[str]
+
+    :param func: Aggregation accepted by ``DataFrameGroupBy.agg``, such as 'sum' or 'max'
+    :type func: Any
+
+    :return: Aggregated values indexed by row ID, in sheet order
+    :rtype: pd.Series | pd.DataFrame
+    """
+    import pandas as pd  # noqa: PLC0415
+
+    selected = [columns] if isinstance(columns, str) else list(columns)
+    exploded = (df[selected]
+                .set_axis(pd.RangeIndex(len(df)))
+                .assign(ancestor_id=list(_column(df, "path")))
+                .explode("ancestor_id"))
+    result = exploded.groupby("ancestor_id")[selected].agg(func)
+    result = result.reindex(pd.Index(list(_row_ids(df)), name="row_id"))
+
+    return result.loc[:, columns]
+
+
+def _row_ids(df: pd.DataFrame) -> Sequence:
+    if "row_id" in df.columns:
+        return df["row_id"].tolist()
+    if df.index.name == "row_id":
+        return df.index.tolist()
+
+    raise ValueError("The DataFrame must have a 'row_id' column or be indexed by row ID")
+
+
+def _column(df: pd.DataFrame, name: str) -> list:
+    if name not in df.columns:
+        raise ValueError(f"The DataFrame has no '{name}' column. Fetch it with 'hierarchy=True'")
+
+    return df[name].tolist()
@@ -0,0 +1,294 @@
+"""Rate limiting and retry backoff for the smartsheet_dataframe package.
+
+Smartsheet allows a fixed number of requests per minute for each access
+token. A ``RateLimiter`` is a thread-safe token bucket shared by every
+request made with the same token in this process, and a
+``FileRateLimiter`` shares one bucket between processes on the same host.
+
+When a request is rate limited anyway, the limiter is throttled: every
+request sharing it pauses for the same backoff and the sustained rate is
+lowered, then climbs back over the following minute. Requests therefore
+resume one by one instead of all retrying at once.
+"""
+
+# Standard Imports
+import contextlib
+import json
+import random
+import threading
+import time
+from datetime import (
+    datetime,
+    timezone,
+)
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+# Local Imports
+from .utils.constants import (
+    BACKOFF_BASE_SECONDS,
+    BACKOFF_MAX_SECONDS,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MIN_SHARE,
+    RATE_LIMIT_PER_MINUTE,
+    RATE_LIMIT_RECOVERY_SECONDS,
+    RETRY_BUDGET_SECONDS,
+)
+from .utils.filelock import FileLock
+
+if TYPE_CHECKING:
+    import os
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    :param requests_per_minute: Sustained number of requests allowed per minute
+    :type requests_per_minute: float
+
+    :param burst: Number of requests that may be sent back to back
+        before the sustained rate applies
+    :type burst: int
+    """
+
+    # Whether reserve and throttle block on I/O, so that asyncio callers run them in an executor
+    blocking: bool = False
+
+    def __init__(self,
+                 requests_per_minute: float = RATE_LIMIT_PER_MINUTE,
+                 burst: int = RATE_LIMIT_BURST) -> None:
+        """Create a full bucket."""
+        if requests_per_minute <= 0:
+            raise ValueError("'requests_per_minute' must be greater than 0")
+        if burst < 1:
+            raise ValueError("'burst' must be at least 1")
+
+        self.max_rate = requests_per_minute / 60
+        self.rate = self.max_rate
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = self._clock()
+        # No tokens are added while requests are paused after a rate limit error
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token from the bucket without waiting.
+
+        The bucket may go into debt, in which case the caller must wait for
+        the returned delay before sending its request. This lets blocking and
+        asyncio callers share the same bucket.
+
+        :return: Number of seconds the caller must wait before sending
+        :rtype: float
+        """
+        with self._state():
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+
+            return max(0.0, self._paused_until - now) + max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> float:
+        """Take one token from the bucket, blocking until it is available.
+
+        :return: Number of seconds spent waiting
+        :rtype: float
+        """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+        return delay
+
+    def throttle(self, delay: float) -> None:
+        """Pause every request sharing the bucket after a rate limit error.
+
+        Requests reserved from now on wait until the pause is over, the bucket
+        is emptied and the sustained rate is halved. The rate then recovers
+        to ``requests_per_minute`` over the following minute.
+
+        :param delay: Number of seconds to pause for
+        :type delay: float
+        """
+        with self._state():
+            now = self._clock()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + delay)
+            self._tokens = min(self._tokens, 0.0)
+            self.rate = max(self.max_rate * RATE_LIMIT_MIN_SHARE, self.rate / 2)
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update and let a throttled rate recover."""
+        elapsed = max(0.0, now - max(self._updated, self._paused_until))
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self.rate = min(self.max_rate, self.rate + elapsed * self.max_rate / RATE_LIMIT_RECOVERY_SECONDS)
+        self._updated = max(self._updated, now)
+
+    def _clock(self) -> float:
+        return time.monotonic()
+
+    @contextlib.contextmanager
+    def _state(self) -> Iterator[None]:
+        """Hold the bucket's state for an update."""
+        with self._lock:
+            yield
+
+
+class FileRateLimiter(RateLimiter):
+    """Token bucket shared by every process on the host that uses the same file.
+
+    The bucket is stored as JSON in ``path`` and updated under a file lock,
+    so all processes using the same token should use the same path.
+
+    :param path: Path of the file holding the bucket. It is created if it does not exist
+    :type path: str | os.PathLike
+
+    :param requests_per_minute: Sustained number of requests allowed per minute
+    :type requests_per_minute: float
+
+    :param burst: Number of requests that may be sent back to back
+        before the sustained rate applies
+    :type burst: int
+    """
+
+    # The bucket is read and written under a file lock
+    blocking = True
+
+    def __init__(self,
+                 path: Union[str, "os.PathLike[str]"],
+                 requests_per_minute: float = RATE_LIMIT_PER_MINUTE,
+                 burst: int = RATE_LIMIT_BURST) -> None:
+        """Create the limiter, sharing the bucket in the file if there is one."""
+        super().__init__(requests_per_minute, burst)
+        self.path = Path(path)
+        self._file_lock = FileLock(self.path.with_name(self.path.name + ".lock"))
+
+    def _clock(self) -> float:
+        # Monotonic clocks are not comparable between processes
+        return time.time()
+
+    @contextlib.contextmanager
+    def _state(self) -> Iterator[None]:
+        """Load the bucket from the file, and save it back after the update."""
+        with self._lock, self._file_lock:
+            self._load()
+            yield
+            self.path.write_text(json.dumps({"tokens": self._tokens,
+                                             "updated": self._updated,
+                                             "rate": self.rate,
+                                             "paused_until": self._paused_until}))
+
+    def _load(self) -> None:
+        try:
+            state = json.loads(self.path.read_text())
+            tokens, updated, rate, paused_until = (float(state[key])
+                                                   for key in ("tokens", "updated", "rate", "paused_until"))
+        except (OSError, ValueError, KeyError, TypeError):
+            # A missing or unreadable file starts a new bucket from this process's state
+            return
+
+        self._tokens = min(self.capacity, tokens)
+        self._updated = updated
+        self.rate = min(self.max_rate, max(self.max_rate * RATE_LIMIT_MIN_SHARE, rate))
+        self._paused_until = paused_until
+
+
+class RetryPolicy(NamedTuple):
+    """How long to back off before retrying a failed request.
+
+    Without a ``Retry-After`` header, the delay before retry ``n`` is drawn at
+    random between half and all of ``base * 2 ** n`` seconds, capped at
+    ``max_delay``, so that requests failing together do not retry together.
+
+    :param base: Seconds to back off before the first retry, before jitter
+    :type base: float
+
+    :param max_delay: Longest backoff between two attempts, unless the API asks for more
+    :type max_delay: float
+
+    :param budget: Total seconds a request may spend backing off before it gives up
+    :type budget: float
+    """
+
+    base: float = BACKOFF_BASE_SECONDS
+    max_delay: float = BACKOFF_MAX_SECONDS
+    budget: float = RETRY_BUDGET_SECONDS
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Get the number of seconds to wait before the next attempt.
+
+        :param attempt: Zero-based number of the attempt that failed
+        :type attempt: int
+
+        :param retry_after: Seconds the API asked to wait, from its ``Retry-After`` header
+        :type retry_after: float
+
+        :return: Number of seconds to wait
+        :rtype: float
+        """
+        # The jitter only spreads retries out, so it does not need a cryptographic generator
+        if retry_after is not None:
+            # A little jitter keeps requests told to wait the same time from retrying together
+            return retry_after + random.uniform(0, 1)  # noqa: S311
+
+        ceiling = min(self.max_delay, self.base * 2 ** attempt)
+        return random.uniform(ceiling / 2, ceiling)  # noqa: S311
+
+
+def retry_after(headers: Mapping[str, Any]) -> Optional[float]:
+    """Read the number of seconds to wait from a response's ``Retry-After`` header.
+
+    :param headers: Response headers
+    :type headers: Mapping[str, str]
+
+    :return: Number of seconds to wait, or None if the header is missing or invalid
+    :rtype: float
+    """
+    value = headers.get("Retry-After")
+    if not isinstance(value, str):
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # Otherwise the header is an HTTP date
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+_limiters: dict = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(token: Optional[str]) -> RateLimiter:
+    """Get the process-wide rate limiter for an access token.
+
+    :param token: Smartsheet access token the limiter applies to
+    :type token: str
+
+    :return: Rate limiter shared by all requests using the token
+    :rtype: RateLimiter
+    """
+    with _limiters_lock:
+        if token not in _limiters:
+            _limiters[token] = RateLimiter()
+
+        return _limiters[token]
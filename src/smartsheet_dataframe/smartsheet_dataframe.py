@@ -4,21 +4,85 @@ This package contains functions to retrieve Smartsheet
 reports and sheets as a Pandas DataFrame
 """
 
+from __future__ import annotations
+
 # Standard Imports
+import collections.abc
+import hashlib
 import logging
 import time
 import warnings
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    as_completed,
+)
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Dict,
+    Iterable,
+    Iterator,
     Optional,
+    Sequence,
+    Tuple,
+    Union,
 )
+from urllib.parse import urlencode
 
 # 3rd-Party Imports
-import pandas as pd
 import requests
 
 # Local Imports
-from .exceptions import AuthenticationError
+from .backends import check_backend
+from .cache import (
+    DiskCache,
+    MemoryCache,
+)
+from .client import (
+    SmartsheetDataFrameClient,
+    Timeout,
+    get_default_client,
+)
+from .conversion import (
+    ColumnBuilder,
+    ConversionOptions,
+    _handle_object_value,  # noqa: F401
+    cast_like,
+    convert_rows,
+    stream_into,
+)
+from .decoders import decode_json
+from .exceptions import (
+    AuthenticationError,
+    RetryError,
+)
+from .rate_limit import (
+    RateLimiter,
+    RetryPolicy,
+    retry_after,
+)
+from .stats import (
+    FetchStats,
+    observe,
+)
+from .utils.constants import (
+    AUTH_ERROR_CODES,
+    CHUNK_ROWS,
+    DEFAULT_MAX_WORKERS,
+    OBJECT_VALUE_COLUMN_TYPES,
+    PANDAS_BACKEND,
+    RATE_LIMIT_ERROR_CODE,
+    REPORT,
+    REPORT_PAGE_SIZE,
+    RETRY_STATUS_CODES,
+    ROW_IDS_MAX_LENGTH,
+    SHEET,
+)
+
+if TYPE_CHECKING:
+    import os
+
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +91,22 @@ def get_report_as_df(token: Optional[str] = None,
                      report_id: Optional[int] = None,
                      include_row_id: bool = True,
                      include_parent_id: bool = True,
-                     report_obj: Optional[Any] = None) -> pd.DataFrame:
+                     report_obj: Optional[Any] = None,
+                     client: Optional[SmartsheetDataFrameClient] = None,
+                     page_size: int = REPORT_PAGE_SIZE,
+                     max_workers: int = DEFAULT_MAX_WORKERS,
+                     stream: bool = False,
+                     typed: bool = True,
+                     columns: Optional[Sequence[Union[str, int]]] = None,
+                     categorical: bool = False,
+                     backend: str = PANDAS_BACKEND,
+                     convert_workers: int = 1,
+                     memory_cache: Optional[MemoryCache] = None,
+                     stats: Optional[FetchStats] = None) -> pd.DataFrame:
     """Get a Smartsheet report as a Pandas DataFrame.
 
+    The parameters shared with ``get_as_df`` are described there.
+
     :param token: Smartsheet Personal Access Token
     :type token: str
 
@@ -49,8 +126,43 @@ def get_report_as_df(token: Optional[str] = None,
         If both token and id_, and obj are provided, obj will be ignored
     :type report_obj: Any
 
-    :return: Pandas DataFrame with report data
-    :rtype: pd.DataFrame
+    :param client: Client used for the request
+    :type client: SmartsheetDataFrameClient
+
+    :param page_size: Number of report rows requested per page. The first page
+        is used to find the total row count, then the remaining pages are fetched
+        concurrently and joined in order
+    :type page_size: int
+
+    :param max_workers: Maximum number of report pages fetched at the same time
+    :type max_workers: int
+
+    :param stream: If True, each report page is fetched in turn and parsed incrementally
+    :type stream: bool
+
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type
+    :type typed: bool
+
+    :param columns: Titles or IDs of the columns to get, instead of every column
+    :type columns: Sequence[str | int]
+
+    :param categorical: If True, columns with few distinct values are stored as ``pd.Categorical``
+    :type categorical: bool
+
+    :param backend: Output format. One of 'pandas', 'arrow', 'polars' or 'dict'
+    :type backend: str
+
+    :param convert_workers: Number of threads the rows of a large report are converted in
+    :type convert_workers: int
+
+    :param memory_cache: In-memory cache to get the report from
+    :type memory_cache: MemoryCache
+
+    :param stats: Filled in with the call's timings and counts
+    :type stats: FetchStats
+
+    :return: Pandas DataFrame with report data, or the output of ``backend``
+    :rtype: pd.DataFrame | pyarrow.Table | polars.DataFrame | dict[str, list]
     """
 
     if token and not report_id:
@@ -67,21 +179,38 @@ def get_report_as_df(token: Optional[str] = None,
         warnings.warn("A 'report_id' has been provided along with a 'report_obj' \n" +
                       "The 'sheet_id' parameter will be ignored")
 
-    if token and report_id:
-        return _to_dataframe(_get_from_request(token, report_id, type_="REPORT"), include_row_id, include_parent_id)
-    elif report_obj:
-        return _to_dataframe(report_obj.to_dict(), include_row_id, include_parent_id)
-    else:
+    options = _conversion_options(include_row_id, include_parent_id, typed, categorical=categorical, backend=backend,
+                                  convert_workers=convert_workers)
+    token = token or (client.token if client else None)
+    if not (token and report_id) and not report_obj:
         raise ValueError("One of 'token' or 'report_obj' must be included in parameters")
 
+    return _get_as_df(REPORT, token, report_id, report_obj, options, client=client, page_size=page_size,
+                      max_workers=max_workers, stream=stream, columns=columns, memory_cache=memory_cache, stats=stats)
+
 
 def get_sheet_as_df(token: Optional[str] = None,
                     sheet_id: Optional[int] = None,
                     include_row_id: bool = True,
                     include_parent_id: bool = True,
-                    sheet_obj: Optional[Any] = None) -> pd.DataFrame:
+                    sheet_obj: Optional[Any] = None,
+                    client: Optional[SmartsheetDataFrameClient] = None,
+                    cache_dir: Optional[Union[str, os.PathLike[str], DiskCache]] = None,
+                    stream: bool = False,
+                    typed: bool = True,
+                    columns: Optional[Sequence[Union[str, int]]] = None,
+                    row_ids: Optional[Sequence[int]] = None,
+                    filter_id: Optional[int] = None,
+                    hierarchy: bool = False,
+                    categorical: bool = False,
+                    backend: str = PANDAS_BACKEND,
+                    convert_workers: int = 1,
+                    memory_cache: Optional[MemoryCache] = None,
+                    stats: Optional[FetchStats] = None) -> pd.DataFrame:
     """Get a Smartsheet sheet as a Pandas DataFrame.
 
+    The parameters shared with ``get_as_df`` are described there.
+
     :param token: Smartsheet personal authentication token
     :type token: str
 
@@ -101,8 +230,47 @@ def get_sheet_as_df(token: Optional[str] = None,
         If both token and id_, and obj are provided, obj will be ignored
     :type sheet_obj: Any
 
-    :return: Pandas DataFrame with sheet data
-    :rtype: pd.DataFrame
+    :param client: Client used for the request
+    :type client: SmartsheetDataFrameClient
+
+    :param cache_dir: Directory, or ``DiskCache``, used to cache the converted sheet
+    :type cache_dir: str | os.PathLike | DiskCache
+
+    :param stream: If True, the response body is parsed incrementally
+    :type stream: bool
+
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type
+    :type typed: bool
+
+    :param columns: Titles or IDs of the columns to get, instead of every column
+    :type columns: Sequence[str | int]
+
+    :param row_ids: IDs of the rows to get, instead of every row
+    :type row_ids: Sequence[int]
+
+    :param filter_id: ID of a saved sheet filter whose rows are the only ones sent
+    :type filter_id: int
+
+    :param hierarchy: If True, 'depth', 'root_id', 'sibling_index' and 'path' columns are added
+    :type hierarchy: bool
+
+    :param categorical: If True, columns with few distinct values are stored as ``pd.Categorical``
+    :type categorical: bool
+
+    :param backend: Output format. One of 'pandas', 'arrow', 'polars' or 'dict'
+    :type backend: str
+
+    :param convert_workers: Number of threads the rows of a large sheet are converted in
+    :type convert_workers: int
+
+    :param memory_cache: In-memory cache to get the sheet from
+    :type memory_cache: MemoryCache
+
+    :param stats: Filled in with the call's timings and counts
+    :type stats: FetchStats
+
+    :return: Pandas DataFrame with sheet data, or the output of ``backend``
+    :rtype: pd.DataFrame | pyarrow.Table | polars.DataFrame | dict[str, list]
     """
 
     if token and not sheet_id:
@@ -119,22 +287,40 @@ def get_sheet_as_df(token: Optional[str] = None,
         warnings.warn("A 'sheet_id' has been provided along with a 'sheet_obj' \n" +
                       "The 'sheet_id' parameter will be ignored")
 
-    if token and sheet_id:
-        return _to_dataframe(_get_from_request(token, sheet_id, type_="SHEET"), include_row_id, include_parent_id)
-    elif sheet_obj:
-        return _to_dataframe(sheet_obj.to_dict(), include_row_id, include_parent_id)
-    else:
+    options = _conversion_options(include_row_id, include_parent_id, typed, hierarchy, categorical, backend,
+                                  convert_workers)
+    token = token or (client.token if client else None)
+    if not (token and sheet_id) and not sheet_obj:
         raise ValueError("One of 'token' or 'sheet_obj' must be included in parameters")
 
+    return _get_as_df(SHEET, token, sheet_id, sheet_obj, options, client=client,
+                      cache_dir=_usable_cache_dir(SHEET, cache_dir, row_ids, filter_id), stream=stream,
+                      columns=columns, row_ids=row_ids, filter_id=filter_id, memory_cache=memory_cache, stats=stats)
+
 
 def get_as_df(type_: str,
               token: Optional[str] = None,
               id_: Optional[int] = None,
               obj: Optional[Any] = None,
               include_row_id: bool = True,
-              include_parent_id: bool = True) -> pd.DataFrame:
+              include_parent_id: bool = True,
+              client: Optional[SmartsheetDataFrameClient] = None,
+              cache_dir: Optional[Union[str, os.PathLike[str], DiskCache]] = None,
+              stream: bool = False,
+              typed: bool = True,
+              columns: Optional[Sequence[Union[str, int]]] = None,
+              row_ids: Optional[Sequence[int]] = None,
+              filter_id: Optional[int] = None,
+              hierarchy: bool = False,
+              categorical: bool = False,
+              backend: str = PANDAS_BACKEND,
+              convert_workers: int = 1,
+              memory_cache: Optional[MemoryCache] = None,
+              stats: Optional[FetchStats] = None) -> pd.DataFrame:
     """Get a Smartsheet report or sheet as a Pandas DataFrame.
 
+    The other getters take the same parameters, which are only described here.
+
     :param type_: type of object to get. Must be one of 'report' or 'sheet'
     :type type_: str
 
@@ -157,11 +343,78 @@ def get_as_df(type_: str,
             dataframe and populate with parent ID for each nested row
     :type include_parent_id: bool
 
-    :return: Pandas DataFrame with object data
-    :rtype: pd.DataFrame
+    :param client: Client whose pooled session, token and timeouts are used
+        for the request. The shared default client is used if not provided
+    :type client: SmartsheetDataFrameClient
+
+    :param cache_dir: Directory, or ``DiskCache``, used to cache the converted sheet.
+        The sheet's version is checked first and the cached DataFrame is returned
+        if the sheet has not changed since it was cached. Reports have no version
+        and are never cached
+    :type cache_dir: str | os.PathLike | DiskCache
+
+    :param stream: If True, the response body is parsed incrementally and each row is
+        converted as it arrives, without holding the whole decoded response in memory.
+        Report pages are fetched in turn. Requires the optional ``ijson`` dependency
+    :type stream: bool
+
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type,
+        such as numbers for TEXT_NUMBER columns and datetimes for DATE columns, and missing
+        cells are nulls. If False, dtypes are inferred by Pandas and missing cells are
+        empty strings, as in earlier versions
+    :type typed: bool
+
+    :param columns: Titles or IDs of the columns to get, instead of every column.
+        Sheet column titles are resolved to IDs with the sheet's column list, which is
+        cached on the client, and the API then only sends the cells of those columns.
+        The API can not filter report columns, so they are dropped before conversion.
+        Columns are returned in sheet or report order
+    :type columns: Sequence[str | int]
+
+    :param row_ids: IDs of the sheet rows to get, instead of every row. Long lists are
+        split into several requests that are fetched concurrently and joined in order
+    :type row_ids: Sequence[int]
+
+    :param filter_id: ID of a saved sheet filter. Only the rows shown by the filter are
+        sent by the API
+    :type filter_id: int
+
+    :param hierarchy: If True, 'depth', 'root_id', 'sibling_index' and 'path' columns are
+        added, computed in the same pass as the conversion. 'path' holds the row IDs from
+        the row's top-level ancestor down to the row. See ``smartsheet_dataframe.hierarchy``
+        for subtree selection and roll-ups
+    :type hierarchy: bool
+
+    :param categorical: If True, PICKLIST and contact columns, and text columns where at most
+        half of the values are distinct, are stored as ``pd.Categorical``. The categories of a
+        PICKLIST column follow its options
+    :type categorical: bool
+
+    :param backend: Output format, built straight from the converted columns. One of
+        'pandas', 'arrow' (a ``pyarrow.Table``), 'polars' (a ``polars.DataFrame``) or
+        'dict' (a dictionary of column name to list of values)
+    :type backend: str
+
+    :param convert_workers: Number of threads the rows of a large object are converted in,
+        on interpreters running without the GIL. With the GIL, more than one has no effect
+        and a warning is issued. Ignored when ``stream`` is True
+    :type convert_workers: int
+
+    :param memory_cache: In-memory cache to get the object from if it was fetched with the same
+        options within the cache's TTL. Concurrent calls for the same object share one fetch,
+        whose stats only the first caller receives
+    :type memory_cache: MemoryCache
+
+    :param stats: Filled in with the call's timings and counts: rate limit waits,
+        network, retry backoff, JSON decoding and conversion times, response bytes,
+        rows and cells. The client's ``on_fetch`` hook also receives them
+    :type stats: FetchStats
+
+    :return: Pandas DataFrame with object data, or the output of ``backend``
+    :rtype: pd.DataFrame | pyarrow.Table | polars.DataFrame | dict[str, list]
     """
 
-    if not (token or obj):
+    if not (token or obj or (client and client.token)):
         raise ValueError("One of 'token' or 'obj' must be included in parameters")
 
     if token and not id_:
@@ -178,37 +431,981 @@ def get_as_df(type_: str,
         warnings.warn("An 'id' has been provided along with a 'obj' \n" +
                       "The 'id' parameter will be ignored")
 
-    if token and id_:
-        return _to_dataframe(_get_from_request(token, id_, type_), include_row_id, include_parent_id)
-    elif obj:
-        return _to_dataframe(obj.to_dict(), include_row_id, include_parent_id)
-    else:
+    if type_.upper() == REPORT and (row_ids is not None or filter_id is not None):
+        raise ValueError("'row_ids' and 'filter_id' can only be used with sheets")
+
+    options = _conversion_options(include_row_id, include_parent_id, typed, hierarchy, categorical, backend,
+                                  convert_workers)
+    token = token or (client.token if client else None)
+    if not (token and id_) and not obj:
         raise ValueError("One of 'token' or 'obj' must be included in parameters")
 
+    return _get_as_df(type_, token, id_, obj, options, client=client,
+                      cache_dir=_usable_cache_dir(type_, cache_dir, row_ids, filter_id), stream=stream,
+                      columns=columns, row_ids=row_ids, filter_id=filter_id, memory_cache=memory_cache, stats=stats)
+
+
+def _conversion_options(include_row_id: bool = True,
+                        include_parent_id: bool = True,
+                        typed: bool = True,
+                        hierarchy: bool = False,
+                        categorical: bool = False,
+                        backend: str = PANDAS_BACKEND,
+                        convert_workers: int = 1) -> ConversionOptions:
+    """Check the getters' conversion parameters and gather them into ``ConversionOptions``."""
+    check_backend(backend)
+    if convert_workers < 1:
+        raise ValueError("'convert_workers' must be at least 1")
+
+    return ConversionOptions(include_row_id, include_parent_id, typed, hierarchy, categorical, backend,
+                             convert_workers)
+
+
+def _usable_cache_dir(type_: str,
+                      cache_dir: Optional[Union[str, os.PathLike[str], DiskCache]],
+                      row_ids: Optional[Sequence[int]],
+                      filter_id: Optional[int]) -> Optional[Union[str, os.PathLike[str], DiskCache]]:
+    """Get the disk cache of a getter call, or None with a warning if the object can not be cached."""
+    if cache_dir is not None and type_.upper() == REPORT:
+        warnings.warn("Reports can not be cached. The 'cache_dir' parameter will be ignored")
+        return None
+    elif cache_dir is not None and (row_ids is not None or filter_id is not None):
+        warnings.warn("Filtered sheets can not be cached. The 'cache_dir' parameter will be ignored")
+        return None
+
+    return cache_dir
+
+
+def _get_as_df(type_: str,
+               token: Optional[str],
+               id_: Optional[int],
+               obj: Optional[Any],
+               options: ConversionOptions,
+               client: Optional[SmartsheetDataFrameClient] = None,
+               cache_dir: Optional[Union[str, os.PathLike[str], DiskCache]] = None,
+               page_size: int = REPORT_PAGE_SIZE,
+               max_workers: int = DEFAULT_MAX_WORKERS,
+               stream: bool = False,
+               columns: Optional[Sequence[Union[str, int]]] = None,
+               row_ids: Optional[Sequence[int]] = None,
+               filter_id: Optional[int] = None,
+               memory_cache: Optional[MemoryCache] = None,
+               stats: Optional[FetchStats] = None) -> pd.DataFrame:
+    """Get an object for a getter whose parameters were checked, from the API, a cache or an SDK object.
+
+    The object is fetched when both ``token`` and ``id_`` are given, and ``obj`` is converted otherwise.
+    """
+
+    def load() -> pd.DataFrame:
+        with observe(stats, (client or get_default_client()).on_fetch, type_, id_) as call_stats:
+            if token and id_ and cache_dir is not None:
+                return _get_sheet_cached(cache_dir, token, id_, options, client, stream, columns, call_stats)
+            elif token and id_ and stream:
+                return _stream_from_request(token, id_, type_, options, client, page_size, columns=columns,
+                                            row_ids=row_ids, filter_id=filter_id, stats=call_stats)
+            elif token and id_:
+                return _convert(_get_from_request(token, id_, type_, client=client, page_size=page_size,
+                                                  max_workers=max_workers, columns=columns, row_ids=row_ids,
+                                                  filter_id=filter_id, stats=call_stats),
+                                options, call_stats)
+            else:
+                return _convert_object(obj, options, columns, call_stats)
+
+    if memory_cache is not None and token and id_:
+        return memory_cache.get_or_load(_cache_key(client, token, type_, id_, options, columns, row_ids, filter_id),
+                                        load)
+
+    return load()
+
+
+def get_many_as_df(ids: Iterable[Union[int, Tuple[str, int]]],
+                   type_: str = SHEET,
+                   token: Optional[str] = None,
+                   max_workers: int = DEFAULT_MAX_WORKERS,
+                   include_row_id: bool = True,
+                   include_parent_id: bool = True,
+                   client: Optional[SmartsheetDataFrameClient] = None,
+                   typed: bool = True,
+                   convert_workers: int = 1,
+                   ) -> Dict[int, Union[pd.DataFrame, Exception]]:
+    """Get many Smartsheet reports and/or sheets concurrently as Pandas DataFrames.
+
+    Requests are sent from a thread pool through the client's pooled session
+    and share the client's rate limiter, so the batch stays under the
+    Smartsheet per-token request limit.
+
+    :param ids: IDs of the objects to get. An item may also be a
+        ``(type_, id_)`` tuple to mix sheets and reports in one batch
+    :type ids: Iterable[int | tuple[str, int]]
+
+    :param type_: type of the objects given as plain IDs. Must be one of 'report' or 'sheet'
+    :type type_: str
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param max_workers: Maximum number of objects fetched at the same time
+    :type max_workers: int
+
+    :param include_row_id: If True, will append a 'row_id' column to the dataframe
+            and populate with row id for each row in sheet
+    :type include_row_id: bool
+
+    :param include_parent_id: If True, will append a 'parent_id' column to the
+            dataframe and populate with parent ID for each nested row
+    :type include_parent_id: bool
+
+    :param client: Client whose pooled session, token and timeouts are used
+        for the requests. The shared default client is used if not provided
+    :type client: SmartsheetDataFrameClient
+
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type.
+        See ``get_as_df``
+    :type typed: bool
+
+    :param convert_workers: Number of threads the rows of large objects are converted in.
+        The objects of the batch share one pool of threads. See ``get_as_df``
+    :type convert_workers: int
+
+    :return: Dictionary of object ID to DataFrame, in the order the IDs were given.
+        If an object could not be retrieved, its value is the raised exception
+    :rtype: dict[int, pd.DataFrame | Exception]
+    """
+
+    client = client or get_default_client()
+    token = token or client.token
+    if not token:
+        raise ValueError("A token must be included in the parameters or in the client")
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be at least 1")
+    if convert_workers < 1:
+        raise ValueError("'convert_workers' must be at least 1")
+
+    objects: list[Tuple[str, int]] = [item if isinstance(item, tuple) else (type_, item) for item in ids]
+    results: Dict[int, Union[pd.DataFrame, Exception]] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(get_as_df, object_type, token=token, id_=id_,
+                                   include_row_id=include_row_id,
+                                   include_parent_id=include_parent_id,
+                                   client=client,
+                                   typed=typed,
+                                   convert_workers=convert_workers): id_
+                   for object_type, id_ in objects}
+
+        for future in as_completed(futures):
+            id_ = futures[future]
+            try:
+                results[id_] = future.result()
+            except Exception as e:
+                logger.warning(f"Could not retrieve object {id_}", exc_info=True)
+                results[id_] = e
+
+    return {id_: results[id_] for _, id_ in objects}
+
+
+def iter_sheet_chunks(token: Optional[str] = None,
+                      sheet_id: Optional[int] = None,
+                      chunk_rows: int = CHUNK_ROWS,
+                      include_row_id: bool = True,
+                      include_parent_id: bool = True,
+                      client: Optional[SmartsheetDataFrameClient] = None,
+                      typed: bool = True) -> Iterator[pd.DataFrame]:
+    """Iterate over a Smartsheet sheet as Pandas DataFrame chunks.
+
+    Each chunk is one page of the sheet, requested with the API's ``page``
+    and ``pageSize`` parameters, so only one chunk is held in memory at a time.
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param sheet_id: Smartsheet source sheet ID to get
+    :type sheet_id: int
+
+    :param chunk_rows: Number of rows in each chunk
+    :type chunk_rows: int
+
+    :param include_row_id: If True, will append a 'row_id' column to the dataframe
+            and populate with row id for each row in sheet
+    :type include_row_id: bool
+
+    :param include_parent_id: If True, will append a 'parent_id' column to the
+            dataframe and populate with parent ID for each nested row
+    :type include_parent_id: bool
+
+    :param client: Client whose pooled session, token and timeouts are used
+        for the requests. The shared default client is used if not provided
+    :type client: SmartsheetDataFrameClient
+
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type.
+        See ``get_as_df``
+    :type typed: bool
+
+    :return: Generator of DataFrames with the sheet's columns. The index of each
+        chunk continues from the previous one, and every chunk has the dtypes of the
+        first chunk where its values fit them
+    :rtype: Iterator[pd.DataFrame]
+    """
+
+    return _iter_chunks(SHEET, token, sheet_id, chunk_rows,
+                        ConversionOptions(include_row_id, include_parent_id, typed), client)
+
+
+def iter_report_chunks(token: Optional[str] = None,
+                       report_id: Optional[int] = None,
+                       chunk_rows: int = CHUNK_ROWS,
+                       include_row_id: bool = True,
+                       include_parent_id: bool = True,
+                       client: Optional[SmartsheetDataFrameClient] = None,
+                       typed: bool = True) -> Iterator[pd.DataFrame]:
+    """Iterate over a Smartsheet report as Pandas DataFrame chunks.
+
+    Each chunk is one page of the report, requested with the API's ``page``
+    and ``pageSize`` parameters, so only one chunk is held in memory at a time.
+
+    :param token: Smartsheet Personal Access Token
+    :type token: str
+
+    :param report_id: ID of report to retrieve
+    :type report_id: int
+
+    :param chunk_rows: Number of rows in each chunk
+    :type chunk_rows: int
+
+    :param include_row_id: If True, will append a 'row_id' column to the dataframe
+            and populate with row id for each row in sheet
+    :type include_row_id: bool
+
+    :param include_parent_id: If True, will append a 'parent_id' column to the
+            dataframe and populate with parent ID for each nested row
+    :type include_parent_id: bool
+
+    :param client: Client whose pooled session, token and timeouts are used
+        for the requests. The shared default client is used if not provided
+    :type client: SmartsheetDataFrameClient
+
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type.
+        See ``get_as_df``
+    :type typed: bool
+
+    :return: Generator of DataFrames with the report's columns. The index of each
+        chunk continues from the previous one, and every chunk has the dtypes of the
+        first chunk where its values fit them
+    :rtype: Iterator[pd.DataFrame]
+    """
+
+    return _iter_chunks(REPORT, token, report_id, chunk_rows,
+                        ConversionOptions(include_row_id, include_parent_id, typed), client)
+
+
+def _iter_chunks(type_: str,
+                 token: Optional[str],
+                 id_: Optional[int],
+                 chunk_rows: int,
+                 options: ConversionOptions,
+                 client: Optional[SmartsheetDataFrameClient]) -> Iterator[pd.DataFrame]:
+    client = client or get_default_client()
+    token = token or client.token
+    if not token:
+        raise ValueError("A token must be included in the parameters or in the client")
+    if not id_:
+        raise ValueError(f"A {type_.lower()}_id must be included in the parameters")
+    if chunk_rows < 1:
+        raise ValueError("'chunk_rows' must be at least 1")
+
+    import pandas as pd  # noqa: PLC0415
+
+    def generate() -> Iterator[pd.DataFrame]:
+        # Requested on the first iteration rather than when the generator is created
+        params = _object_value_params(client, token, id_) if type_.upper() == SHEET else {}
+        first: Optional[pd.DataFrame] = None
+        page = 1
+        offset = 0
+        while True:
+            url = _object_url(client.base_url, id_, type_, page=page, pageSize=chunk_rows, **params)
+            object_dict = _get_json(client, url, token)
+            rows_count = len(object_dict.get("rows") or ())
+
+            # Always yield the first page so that an empty object still provides its columns
+            if rows_count or page == 1:
+                df = _convert(object_dict, options)
+                df.index = pd.RangeIndex(offset, offset + len(df))
+                # Each page is typed from its own values, so later chunks are cast to the first chunk's dtypes
+                if first is None:
+                    first = df.iloc[:0]
+                else:
+                    df = cast_like(df, first)
+                yield df
+
+            offset += rows_count
+            if not rows_count or offset >= (object_dict.get("totalRowCount") or 0):
+                return
+
+            page += 1
+
+    return generate()
+
+
+def _cache_key(client: Optional[SmartsheetDataFrameClient],
+               token: str,
+               type_: str,
+               id_: int,
+               options: ConversionOptions,
+               *selection: Union[int, Sequence[Union[str, int]], None]) -> tuple:
+    """Build the cache key of an object fetched with the given token, options and selection.
+
+    The memory and the disk caches both use this key. It holds the API base URL,
+    so that objects of different regions are kept apart, and a hash of the token,
+    so that callers with different permissions do not share results.
+    """
+    return ((client or get_default_client()).base_url,
+            hashlib.sha256(token.encode()).hexdigest(),
+            type_.upper(),
+            id_,
+            # The number of workers does not change the result
+            options._replace(workers=1),
+            *(tuple(values) if values is not None and not isinstance(values, int) else values
+              for values in selection))
+
+
+def _get_sheet_cached(cache_dir: Union[str, os.PathLike[str], DiskCache],
+                      token: str,
+                      sheet_id: int,
+                      options: ConversionOptions,
+                      client: Optional[SmartsheetDataFrameClient],
+                      stream: bool = False,
+                      columns: Optional[Sequence[Union[str, int]]] = None,
+                      stats: Optional[FetchStats] = None) -> pd.DataFrame:
+    """Get a sheet as a DataFrame, using the disk cache if the sheet is unchanged.
+
+    :param cache_dir: Cache directory, or cache
+    :type cache_dir: str | os.PathLike | DiskCache
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param sheet_id: Smartsheet source sheet ID to get
+    :type sheet_id: int
+
+    :param options: Conversion options
+    :type options: ConversionOptions
+
+    :param client: Client used to send the requests
+    :type client: SmartsheetDataFrameClient
+
+    :param stream: If True, a changed sheet is parsed incrementally
+    :type stream: bool
+
+    :param columns: Titles or IDs of the columns to get
+    :type columns: Sequence[str | int]
+
+    :param stats: Timings and counts to add to
+    :type stats: FetchStats
+
+    :return: Pandas DataFrame with sheet data
+    :rtype: pd.DataFrame
+    """
+    if options.backend != PANDAS_BACKEND:
+        raise ValueError("Only the 'pandas' backend can be used with 'cache_dir'")
+
+    cache = cache_dir if isinstance(cache_dir, DiskCache) else DiskCache(cache_dir)
+    client = client or get_default_client()
+    column_ids = None
+    if columns is not None:
+        column_ids = _resolve_column_ids(client, token, sheet_id, columns, stats)
+    cache_key = _cache_key(client, token, SHEET, sheet_id, options, None if column_ids is None else sorted(column_ids))
+    key = f"sheet-{sheet_id}-{hashlib.sha256(repr(cache_key).encode()).hexdigest()[:16]}"
+
+    version = _get_json(client, f"{client.base_url}/sheets/{sheet_id}/version", token, stats)["version"]
+    df = cache.get(key, version)
+    if df is not None:
+        logger.debug("Sheet loaded from cache", extra={"id": sheet_id, "version": version})
+        return df
+
+    if stream:
+        df = _stream_from_request(token, sheet_id, SHEET, options, client, columns=column_ids, stats=stats)
+    else:
+        object_dict = _get_from_request(token, sheet_id, SHEET, client=client, columns=column_ids, stats=stats)
+        df = _convert(object_dict, options, stats)
+        version = object_dict.get("version", version)
+    cache.put(key, version, df)
+
+    return df
+
+
+def _get_from_request(token: str,
+                      id_: int,
+                      type_: str,
+                      client: Optional[SmartsheetDataFrameClient] = None,
+                      page_size: int = REPORT_PAGE_SIZE,
+                      max_workers: int = DEFAULT_MAX_WORKERS,
+                      columns: Optional[Sequence[Union[str, int]]] = None,
+                      row_ids: Optional[Sequence[int]] = None,
+                      filter_id: Optional[int] = None,
+                      stats: Optional[FetchStats] = None) -> dict:
+    client = client or get_default_client()
+
+    if type_.upper() == REPORT:
+        return _project_columns(_get_report_pages(token, id_, client, page_size, max_workers, stats), columns)
+
+    urls = _sheet_urls(client, token, id_, columns, row_ids, filter_id, stats)
+    object_dict = _get_sheet_batches(client, token, urls, max_workers, stats)
+    if client.schema_first and not _columns_cached(client, id_, object_dict.get("columns", [])):
+        # Columns were added since the schema was cached, and may need object values
+        del client.columns_cache[id_]
+        refreshed_urls = _sheet_urls(client, token, id_, columns, row_ids, filter_id, stats)
+        if refreshed_urls != urls:
+            object_dict = _get_sheet_batches(client, token, refreshed_urls, max_workers, stats)
+
+    return object_dict
+
+
+def _get_sheet_batches(client: SmartsheetDataFrameClient,
+                       token: str,
+                       urls: list,
+                       max_workers: int,
+                       stats: Optional[FetchStats] = None) -> dict:
+    if len(urls) == 1:
+        return _get_json(client, urls[0], token, stats)
+
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be at least 1")
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        batches = list(executor.map(lambda url: _get_json(client, url, token, stats), urls))
+
+    return _merge_pages(batches[0], batches[1:])
+
+
+def _columns_cached(client: SmartsheetDataFrameClient, sheet_id: int, columns: list) -> bool:
+    """Check whether every column of a response is in the sheet's cached schema."""
+    schema = client.columns_cache.get(sheet_id)
+    if schema is None:
+        return True
+
+    return {column.get("id") for column in columns} <= {column.get("id") for column in schema}
+
+
+def _get_json(client: SmartsheetDataFrameClient,
+              url: str,
+              token: Optional[str],
+              stats: Optional[FetchStats] = None) -> dict:
+    response = _do_request(url,
+                           options=client.headers(token),
+                           retries=client.retries,
+                           session=client.session,
+                           timeout=client.timeout,
+                           rate_limiter=client.limiter(token),
+                           retry_policy=client.retry_policy,
+                           stats=stats)
+    # Decoding the bytes directly skips building the whole body as a str first
+    if stats is None:
+        return decode_json(client.json_decoder, response.content, client.pause_gc)
+
+    start = time.perf_counter()
+    content = response.content
+    object_dict = decode_json(client.json_decoder, content, client.pause_gc)
+    stats.add(decode_seconds=time.perf_counter() - start, response_bytes=len(content))
+
+    return object_dict
+
+
+def _stream_from_request(token: str,
+                         id_: int,
+                         type_: str,
+                         options: ConversionOptions,
+                         client: Optional[SmartsheetDataFrameClient] = None,
+                         page_size: int = REPORT_PAGE_SIZE,
+                         columns: Optional[Sequence[Union[str, int]]] = None,
+                         row_ids: Optional[Sequence[int]] = None,
+                         filter_id: Optional[int] = None,
+                         stats: Optional[FetchStats] = None) -> pd.DataFrame:
+    """Get a sheet or report, converting each row as the response body is parsed.
+
+    Report pages, and sheet row ID batches, are fetched one after another
+    into the same column buffers.
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param id_: Smartsheet object (report or sheet) ID
+    :type id_: int
+
+    :param type_: type of object to get. Must be one of 'report' or 'sheet'
+    :type type_: str
+
+    :param options: Conversion options
+    :type options: ConversionOptions
+
+    :param client: Client used to send the requests
+    :type client: SmartsheetDataFrameClient
+
+    :param page_size: Number of report rows requested per page
+    :type page_size: int
+
+    :param columns: Titles or IDs of the columns to get
+    :type columns: Sequence[str | int]
+
+    :param row_ids: IDs of the sheet rows to get
+    :type row_ids: Sequence[int]
+
+    :param filter_id: ID of a saved sheet filter to apply
+    :type filter_id: int
 
-def _get_from_request(token: str, id_: int, type_: str) -> dict:
-    if type_.upper() == "SHEET":
-        url = f"https://api.smartsheet.com/2.0/sheets/{id_}?include=objectValue&level=1"
+    :param stats: Timings and counts to add to
+    :type stats: FetchStats
+
+    :return: Pandas DataFrame with object data
+    :rtype: pd.DataFrame
+    """
+    client = client or get_default_client()
+    builder = ColumnBuilder(options)
+
+    if type_.upper() != REPORT:
+        urls = _sheet_urls(client, token, id_, columns, row_ids, filter_id, stats)
+        object_columns, _ = _stream_json(client, urls[0], token, builder, stats)
+        for url in urls[1:]:
+            _stream_json(client, url, token, builder, stats)
+        return _build(builder, object_columns, stats)
+
+    if page_size < 1:
+        raise ValueError("'page_size' must be at least 1")
+
+    object_columns, fields = _stream_json(client,
+                                          _object_url(client.base_url, id_, REPORT, page=1, pageSize=page_size),
+                                          token, builder, stats)
+    for page in _remaining_pages(fields, page_size):
+        _stream_json(client, _object_url(client.base_url, id_, REPORT, page=page, pageSize=page_size),
+                     token, builder, stats)
+
+    if columns is not None:
+        # Rows are already buffered, so report columns are dropped from the buffers
+        object_columns = builder.select(object_columns, _column_positions(object_columns, columns))
+
+    return _build(builder, object_columns, stats)
+
+
+def _stream_json(client: SmartsheetDataFrameClient,
+                 url: str,
+                 token: Optional[str],
+                 builder: ColumnBuilder,
+                 stats: Optional[FetchStats] = None) -> Tuple[list, dict]:
+    response = _do_request(url,
+                           options=client.headers(token),
+                           retries=client.retries,
+                           session=client.session,
+                           timeout=client.timeout,
+                           rate_limiter=client.limiter(token),
+                           retry_policy=client.retry_policy,
+                           stream=True,
+                           stats=stats)
+    try:
+        response.raw.decode_content = True
+        start = time.perf_counter()
+        result = stream_into(response.raw, builder)
+        if stats is not None:
+            # Bytes read from the connection, before decompression
+            received = response.raw.tell()
+            stats.add(decode_seconds=time.perf_counter() - start,
+                      response_bytes=received if isinstance(received, int) else 0)
+        return result
+    finally:
+        response.close()
+
+
+def _sheet_urls(client: SmartsheetDataFrameClient,
+                token: Optional[str],
+                sheet_id: int,
+                columns: Optional[Sequence[Union[str, int]]] = None,
+                row_ids: Optional[Sequence[int]] = None,
+                filter_id: Optional[int] = None,
+                stats: Optional[FetchStats] = None) -> list:
+    """Build the URLs used to get a sheet, filtered by the API.
+
+    :param client: Client used to resolve column titles
+    :type client: SmartsheetDataFrameClient
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param sheet_id: Smartsheet source sheet ID
+    :type sheet_id: int
+
+    :param columns: Titles or IDs of the columns to get
+    :type columns: Sequence[str | int]
+
+    :param row_ids: IDs of the rows to get
+    :type row_ids: Sequence[int]
+
+    :param filter_id: ID of a saved sheet filter to apply
+    :type filter_id: int
+
+    :param stats: Timings and counts to add to
+    :type stats: FetchStats
+
+    :return: One URL, or one URL per batch of row IDs
+    :rtype: list[str]
+    """
+    params = _column_params(client, token, sheet_id, columns, stats)
+    params.update(_object_value_params(client, token, sheet_id, stats))
+    if filter_id is not None:
+        # Without the exclusion, rows hidden by the filter are only flagged as filtered out
+        params.update(filterId=filter_id, exclude="filteredOutRows")
+
+    if row_ids is None:
+        return [_object_url(client.base_url, sheet_id, SHEET, **params)]
+
+    return [_object_url(client.base_url, sheet_id, SHEET, rowIds=",".join(map(str, batch)), **params)
+            for batch in _row_id_batches(row_ids)]
+
+
+def _row_id_batches(row_ids: Sequence[int], max_length: int = ROW_IDS_MAX_LENGTH) -> list:
+    """Split row IDs into batches that keep the ``rowIds`` parameter under a length limit.
+
+    :param row_ids: Row IDs
+    :type row_ids: Sequence[int]
+
+    :param max_length: Maximum length of the comma-separated IDs of one batch
+    :type max_length: int
+
+    :return: Batches of row IDs, in the order given
+    :rtype: list[list[int]]
+    """
+    if not row_ids:
+        raise ValueError("'row_ids' must include at least one row ID")
+
+    batches: list[list[int]] = [[]]
+    length = 0
+    for row_id in row_ids:
+        size = len(str(row_id)) + 1
+        if batches[-1] and length + size > max_length:
+            batches.append([])
+            length = 0
+        batches[-1].append(row_id)
+        length += size
+
+    return batches
+
+
+def _column_params(client: SmartsheetDataFrameClient,
+                   token: Optional[str],
+                   sheet_id: int,
+                   columns: Optional[Sequence[Union[str, int]]],
+                   stats: Optional[FetchStats] = None) -> dict:
+    """Build the query parameters asking the API for only some sheet columns.
+
+    :param client: Client used to resolve column titles
+    :type client: SmartsheetDataFrameClient
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param sheet_id: Smartsheet source sheet ID
+    :type sheet_id: int
+
+    :param columns: Titles or IDs of the columns to get. Every column is requested if None
+    :type columns: Sequence[str | int]
+
+    :param stats: Timings and counts to add to
+    :type stats: FetchStats
+
+    :return: ``columnIds`` parameter, or no parameters if every column is wanted
+    :rtype: dict
+    """
+    if columns is None:
+        return {}
+
+    column_ids = _resolve_column_ids(client, token, sheet_id, columns, stats)
+
+    return {"columnIds": ",".join(str(column_id) for column_id in column_ids)}
+
+
+def _resolve_column_ids(client: SmartsheetDataFrameClient,
+                        token: Optional[str],
+                        sheet_id: int,
+                        columns: Sequence[Union[str, int]],
+                        stats: Optional[FetchStats] = None) -> list:
+    """Resolve column titles and IDs to sheet column IDs.
+
+    Titles are looked up in the sheet's column list, which is cached on the
+    client. The list is fetched again if a title is not found in the cached one,
+    in case the sheet's columns were renamed.
+
+    :param client: Client used to send the request and holding the column cache
+    :type client: SmartsheetDataFrameClient
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param sheet_id: Smartsheet source sheet ID
+    :type sheet_id: int
+
+    :param columns: Column titles or IDs
+    :type columns: Sequence[str | int]
+
+    :param stats: Timings and counts to add to
+    :type stats: FetchStats
+
+    :return: Column IDs, in the order given
+    :rtype: list[int]
+    """
+    if not columns:
+        raise ValueError("'columns' must include at least one column")
+
+    titles = {column for column in columns if isinstance(column, str)}
+    if not titles:
+        return [int(column) for column in columns]
+
+    schema = _sheet_columns(client, token, sheet_id, stats)
+    if not titles <= {column["title"] for column in schema}:
+        schema = _sheet_columns(client, token, sheet_id, stats, refresh=True)
+
+    ids = {column["title"]: column["id"] for column in schema}
+    missing = [title for title in titles if title not in ids]
+    if missing:
+        raise ValueError(f"Columns {missing} were not found in sheet {sheet_id}")
+
+    return [ids[column] if isinstance(column, str) else int(column) for column in columns]
+
+
+def _object_value_params(client: SmartsheetDataFrameClient,
+                         token: Optional[str],
+                         sheet_id: int,
+                         stats: Optional[FetchStats] = None) -> dict:
+    """Build the query parameters leaving out cell object values, if the sheet does not need them.
+
+    Only multi-contact cells keep their value in ``objectValue`` alone. Sheets
+    without multi-contact columns are requested at the default level, which
+    gives the same values, and without an object for every cell.
+
+    :return: Parameters removing the ``include`` and ``level`` defaults, or no parameters
+        if the client is not schema-first or the sheet has multi-contact columns
+    :rtype: dict
+    """
+    if not client.schema_first:
+        return {}
+
+    schema = _sheet_columns(client, token, sheet_id, stats)
+    if any(column.get("type") in OBJECT_VALUE_COLUMN_TYPES for column in schema):
+        return {}
+
+    return {"include": None, "level": None}
+
+
+def _sheet_columns(client: SmartsheetDataFrameClient,
+                   token: Optional[str],
+                   sheet_id: int,
+                   stats: Optional[FetchStats] = None,
+                   refresh: bool = False) -> list:
+    """Get a sheet's columns from the client's cache, fetching them if they are not cached.
+
+    :param refresh: If True, the columns are fetched even if they are cached
+    :type refresh: bool
+
+    :return: Column dictionaries, with their types at the level sheets are requested at
+    :rtype: list[dict]
+    """
+    schema = None if refresh else client.columns_cache.get(sheet_id)
+    if schema is None:
+        schema = _get_json(client, f"{client.base_url}/sheets/{sheet_id}/columns?includeAll=true&level=1",
+                           token, stats)["data"]
+        client.columns_cache[sheet_id] = schema
+
+    return schema
+
+
+def _column_positions(object_columns: list, columns: Sequence[Union[str, int]]) -> list:
+    """Find the positions of the selected columns in an object's columns.
+
+    :param object_columns: Column dictionaries of the sheet or report
+    :type object_columns: list[dict]
+
+    :param columns: Titles or IDs of the columns to keep. Report columns are matched
+        on their ``virtualId`` as well as their ``id``
+    :type columns: Sequence[str | int]
+
+    :return: Positions of the selected columns, in object order
+    :rtype: list[int]
+    """
+    if not columns:
+        raise ValueError("'columns' must include at least one column")
+
+    wanted = set(columns)
+    positions = []
+    found = set()
+    for position, column in enumerate(object_columns):
+        keys = {column.get("title"), column.get("id"), column.get("virtualId")} & wanted
+        if keys:
+            positions.append(position)
+            found |= keys
+
+    missing = [column for column in columns if column not in found]
+    if missing:
+        raise ValueError(f"Columns {missing} were not found")
+
+    return positions
+
+
+def _project_columns(object_dict: dict, columns: Optional[Sequence[Union[str, int]]]) -> dict:
+    """Drop the columns, and their cells, that were not selected from an object dictionary.
+
+    :param object_dict: Smartsheet object dictionary
+    :type object_dict: dict
+
+    :param columns: Titles or IDs of the columns to keep. Every column is kept if None
+    :type columns: Sequence[str | int]
+
+    :return: Object dictionary with only the selected columns
+    :rtype: dict
+    """
+    if columns is None:
+        return object_dict
+
+    positions = _column_positions(object_dict["columns"], columns)
+    rows = [{**row, "cells": [row["cells"][position] if position < len(row["cells"]) else {}
+                              for position in positions]}
+            for row in object_dict.get("rows") or ()]
+
+    return {**object_dict,
+            "columns": [object_dict["columns"][position] for position in positions],
+            "rows": rows}
+
+
+def _get_report_pages(token: str,
+                      id_: int,
+                      client: SmartsheetDataFrameClient,
+                      page_size: int,
+                      max_workers: int,
+                      stats: Optional[FetchStats] = None) -> dict:
+    """Get every page of a report and join them into one report dictionary.
+
+    The first page is fetched on its own to learn ``totalRowCount``.
+    The remaining pages are then fetched concurrently.
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param id_: Smartsheet report ID
+    :type id_: int
+
+    :param client: Client used to send the requests
+    :type client: SmartsheetDataFrameClient
+
+    :param page_size: Number of rows requested per page
+    :type page_size: int
+
+    :param max_workers: Maximum number of pages fetched at the same time
+    :type max_workers: int
+
+    :param stats: Timings and counts to add to
+    :type stats: FetchStats
+
+    :return: Report dictionary holding the rows of every page, in order
+    :rtype: dict
+    """
+    if page_size < 1:
+        raise ValueError("'page_size' must be at least 1")
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be at least 1")
+
+    def get_page(page: int) -> dict:
+        return _get_json(client, _object_url(client.base_url, id_, REPORT, page=page, pageSize=page_size),
+                         token, stats)
+
+    first_page = get_page(1)
+    page_numbers = _remaining_pages(first_page, page_size)
+    if not page_numbers:
+        return first_page
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(page_numbers))) as executor:
+        pages = list(executor.map(get_page, page_numbers))
+
+    return _merge_pages(first_page, pages)
+
+
+def _remaining_pages(first_page: dict, page_size: int) -> range:
+    """Get the page numbers left to fetch after the first page of a report.
+
+    :param first_page: First page of the report
+    :type first_page: dict
+
+    :param page_size: Number of rows requested per page
+    :type page_size: int
+
+    :return: Page numbers of the remaining pages
+    :rtype: range
+    """
+    total_row_count: int = first_page.get("totalRowCount") or 0
+    page_count = -(-total_row_count // page_size)
+
+    return range(2, page_count + 1)
+
+
+def _merge_pages(first_page: dict, pages: list) -> dict:
+    """Join the rows of report pages into the first page.
+
+    :param first_page: First page of the report, providing the columns
+    :type first_page: dict
+
+    :param pages: Remaining pages, in page order
+    :type pages: list[dict]
+
+    :return: Report dictionary with the rows of every page
+    :rtype: dict
+    """
+    rows: list[dict] = list(first_page.get("rows") or [])
+    for page in pages:
+        rows.extend(page.get("rows") or [])
+
+    return {**first_page, "rows": rows}
+
+
+def _object_url(base_url: str, id_: int, type_: str, **params: Any) -> str:
+    """Build the API URL used to get a sheet or report.
+
+    :param base_url: Smartsheet API base URL
+    :type base_url: str
+
+    :param id_: Smartsheet object (report or sheet) ID
+    :type id_: int
+
+    :param type_: type of object to get. Must be one of 'report' or 'sheet'
+    :type type_: str
+
+    :param params: Query parameters added to, or overriding, the defaults for the object type.
+        A parameter set to None removes a default
+    :type params: Any
+
+    :return: Object URL
+    :rtype: str
+    """
+    if type_.upper() == SHEET:
+        url = f"{base_url}/sheets/{id_}"
+        query: dict = {"include": "objectValue", "level": 1}
         logger.debug("Getting sheet request", extra={"id": id_,
                                                      "url": url,
                                                      "object_type": "sheet"})
-    elif type_.upper() == "REPORT":
-        url = f"https://api.smartsheet.com/2.0/reports/{id_}?pageSize=50000"
+    elif type_.upper() == REPORT:
+        url = f"{base_url}/reports/{id_}"
+        query = {"pageSize": REPORT_PAGE_SIZE}
         logger.debug("Getting report request", extra={"id": id_,
                                                       "url": url,
                                                       "object_Type": "report"})
     else:
         raise ValueError(f"'type_' parameter must be one of SHEET or REPORT. The current value is {type_.upper()}")
 
-    credentials: dict = {"Authorization": f"Bearer {token}"}
-    response = _do_request(url, options=credentials)
+    query.update(params)
+    query = {key: value for key, value in query.items() if value is not None}
+    if not query:
+        return url
 
-    return response.json()
+    return f"{url}?{urlencode(query, safe=',')}"
 
 
 def _to_dataframe(object_dict: dict,
                   include_row_id: bool = True,
-                  include_parent_id: bool = True) -> pd.DataFrame:
+                  include_parent_id: bool = True,
+                  typed: bool = True) -> pd.DataFrame:
     """Convert a Smartsheet object dictionary to a Pandas DataFrame.
 
     :param object_dict: Smartsheet object dictionary
@@ -222,46 +1419,84 @@ def _to_dataframe(object_dict: dict,
             dataframe and populate with parent ID for each nested row
     :type include_parent_id: bool
 
+    :param typed: If True, each column's dtype is chosen from its Smartsheet column type
+    :type typed: bool
+
     :return: Pandas DataFrame with object data
     :rtype: pd.DataFrame
     """
 
-    columns_list: list[str] = [column["title"] for column in object_dict["columns"]]
+    return _convert(object_dict, ConversionOptions(include_row_id, include_parent_id, typed))
 
-    if include_parent_id:
-        columns_list.insert(0, "parent_id")
-    if include_row_id:
-        columns_list.insert(0, "row_id")
 
-    rows_list: list[list[Any]] = []
+def _convert(object_dict: dict, options: ConversionOptions, stats: Optional[FetchStats] = None) -> pd.DataFrame:
+    start = time.perf_counter()
+    builder = convert_rows(object_dict.get("rows") or [], options)
 
-    # Handle empty sheet condition
-    if not object_dict.get("rows", None):
-        return pd.DataFrame(columns=columns_list)  # pyright: ignore
+    return _build(builder, object_dict["columns"], stats, start)
 
-    for row in object_dict["rows"]:
-        cells_list: list[Any] = []
-        if include_row_id:
-            cells_list.append(int(row["id"]))
-        if include_parent_id:
-            cells_list.append(int(row["parentId"])) if "parentId" in row else cells_list.append("")
 
-        for cell in row["cells"]:
-            if "value" in cell:
-                cells_list.append(cell["value"])
-            elif "objectValue" in cell:
-                cells_list.append(_handle_object_value(cell["objectValue"]))
-            else:
-                cells_list.append("")
-        else:
-            rows_list.append(cells_list)
+def _convert_object(obj: Any,
+                    options: ConversionOptions,
+                    columns: Optional[Sequence[Union[str, int]]],
+                    stats: Optional[FetchStats] = None) -> pd.DataFrame:
+    """Convert a Smartsheet Python SDK sheet or report.
+
+    Rows and cells are read from the SDK objects directly, since ``to_dict()``
+    would copy the whole sheet into dictionaries first. Objects that do not hold
+    a list of rows are converted through ``to_dict()``.
+    """
+    rows = getattr(obj, "rows", None)
+    if not isinstance(rows, collections.abc.Sequence):
+        return _convert(_project_columns(obj.to_dict(), columns), options, stats)
+
+    start = time.perf_counter()
+    # Columns are few, so their dictionaries are cheap
+    object_columns = [column.to_dict() for column in obj.columns]
+    builder = ColumnBuilder(options)
+    builder.add_model_rows(rows)
+    if columns is not None:
+        object_columns = builder.select(object_columns, _column_positions(object_columns, columns))
+
+    return _build(builder, object_columns, stats, start)
 
-    return pd.DataFrame(rows_list, columns=columns_list)  # pyright: ignore
 
+def _build(builder: ColumnBuilder,
+           columns: list,
+           stats: Optional[FetchStats] = None,
+           start: Optional[float] = None) -> Any:
+    """Build the output of a builder, adding the conversion time and counts to the stats.
 
-def _do_request(url: str, options: dict, retries: int = 3) -> requests.Response:
+    The conversion time runs from ``start`` if given, or else covers only the build.
+    """
+    if stats is None:
+        return builder.build(columns)
+
+    start = time.perf_counter() if start is None else start
+    result = builder.build(columns)
+    stats.add(convert_seconds=time.perf_counter() - start, rows=builder.row_count, cells=builder.cell_count)
+
+    return result
+
+
+def _do_request(url: str,
+                options: dict,
+                retries: int = 3,
+                session: Optional[requests.Session] = None,
+                timeout: Optional[Timeout] = None,
+                rate_limiter: Optional[RateLimiter] = None,
+                stream: bool = False,
+                stats: Optional[FetchStats] = None,
+                retry_policy: Optional[RetryPolicy] = None,
+                method: str = "GET",
+                body: Optional[Any] = None) -> requests.Response:
     """Do the HTTP request, handling rate limit retrying.
 
+    Rate limit errors, server errors and connection errors are retried after
+    a backoff, which is the response's ``Retry-After`` when it has one. A POST
+    may have been applied when the connection failed or the server erred, so
+    it is only retried after a rate limit error.
+
     :param url: Smartsheet API URL
     :type url: str
 
@@ -271,45 +1506,106 @@ def _do_request(url: str, options: dict, retries: int = 3) -> requests.Response:
     :param retries: Number of retries
     :type retries: int
 
+    :param session: Pooled session to send the request with.
+        A one-off connection is used if not provided
+    :type session: requests.Session
+
+    :param timeout: Request timeout in seconds
+    :type timeout: float | tuple[float, float]
+
+    :param rate_limiter: Rate limiter to acquire before each attempt.
+        It is throttled when the request is rate limited
+    :type rate_limiter: RateLimiter
+
+    :param stream: If True, the response body is not downloaded until it is read
+    :type stream: bool
+
+    :param stats: Timings and counts to add the requests, retries and waits to
+    :type stats: FetchStats
+
+    :param retry_policy: Backoff between attempts and total backoff allowed
+    :type retry_policy: RetryPolicy
+
+    :param method: HTTP method
+    :type method: str
+
+    :param body: Body sent as JSON with methods other than GET
+    :type body: Any
+
     :return: Requests response object
     :rtype: requests.Response
     """
+    send = getattr(session if session is not None else requests, method.lower())
+    kwargs = {"stream": stream} if method == "GET" else {"json": body}
+    retry_policy = retry_policy or RetryPolicy()
+    backed_off = 0.0
+
     i = 0
     for i in range(retries):
+        throttle = False
         try:
-            response = requests.get(url, headers=options)
-            response_json = response.json()
-
-            if response.status_code != 200:
-                if response_json["errorCode"] == 1002 or response_json["errorCode"] == 1003 or \
-                        response_json["errorCode"] == 1004:
-                    raise AuthenticationError("Could not connect using the supplied auth token \n" +
-                                              response.text)
-                elif response_json["errorCode"] == 4004:
-                    logger.debug(f"Rate limit exceeded. Waiting and trying again... {i}")
-                    time.sleep(5 + (i * 5))
-                    continue
-                else:
-                    warnings.warn("An unhandled status_code was returned by the Smartsheet API: \n" +
-                                  response.text)
-                    return
+            if rate_limiter is not None:
+                waited = rate_limiter.acquire()
+                if stats is not None:
+                    stats.add(rate_limit_seconds=waited)
+            if stats is not None:
+                stats.add(requests=1, retries=int(i > 0))
+            start = time.perf_counter()
+            response = send(url, headers=options, timeout=timeout, **kwargs)
+            if stats is not None:
+                stats.add(network_seconds=time.perf_counter() - start)
+
+            if response.status_code == 200:
+                return response
+
+            error_code = _error_code(response)
+            throttle = error_code == RATE_LIMIT_ERROR_CODE or response.status_code == 429
+            if error_code in AUTH_ERROR_CODES:
+                raise AuthenticationError("Could not connect using the supplied auth token \n" +
+                                          response.text)
+            elif throttle or (response.status_code in RETRY_STATUS_CODES and method != "POST"):
+                logger.debug(f"Rate limit exceeded or server error. Waiting and trying again... {i}")
+                delay = retry_policy.delay(i, retry_after(response.headers))
+            else:
+                warnings.warn("An unhandled status_code was returned by the Smartsheet API: \n" +
+                              response.text)
+                return
         except AuthenticationError:
             logger.exception("Smartsheet returned an error status code")
-            break
+            return response
         except Exception:
+            if method == "POST":
+                raise
             logger.exception(f"Not able to retrieve get response. Retrying... {i}")
-            time.sleep(5 + (i * 5))
-            continue
-        break
-    else:
-        raise Exception(f"Could not retrieve request after retrying {i} times")
+            delay = retry_policy.delay(i)
+
+        # No point waiting after the last attempt, or past the retry budget
+        if i == retries - 1 or backed_off + delay > retry_policy.budget:
+            break
+        _backoff(delay, stats, rate_limiter if throttle else None)
+        backed_off += delay
 
-    return response
+    raise RetryError(f"Could not retrieve request after retrying {i} times")
 
 
-def _handle_object_value(object_value: dict) -> str:
-    email_list_string: str = ""
-    if object_value["objectType"].upper() == "MULTI_CONTACT":
-        email_list_string = ", ".join(obj["email"] for obj in object_value["values"])
+def _error_code(response: Any) -> Optional[int]:
+    """Get the Smartsheet error code of a failed response, or None if its body has none."""
+    try:
+        body = response.json()
+    except ValueError:
+        return None
 
-    return email_list_string
+    return body.get("errorCode") if isinstance(body, dict) else None
+
+
+def _backoff(delay: float, stats: Optional[FetchStats] = None, rate_limiter: Optional[RateLimiter] = None) -> None:
+    """Wait before sending a request again.
+
+    After a rate limit error the shared rate limiter is throttled for the same
+    time, so the other requests using it wait as well.
+    """
+    if rate_limiter is not None:
+        rate_limiter.throttle(delay)
+    time.sleep(delay)
+    if stats is not None:
+        stats.add(backoff_seconds=delay)
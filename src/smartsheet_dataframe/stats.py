@@ -0,0 +1,160 @@
+"""Fetch timings and counts for the smartsheet_dataframe package.
+
+A ``FetchStats`` collects where the time of one sheet or report call went:
+waiting for the rate limiter, the network, backing off between retries,
+decoding the JSON body and converting the rows. It is filled in when passed
+to a call with ``stats=``, and handed to a client's ``on_fetch`` hook after
+every call made through that client, which makes it easy to export to a
+metrics system.
+"""
+
+# Standard Imports
+import contextlib
+import logging
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FetchStats:
+    """Timings and counts of one call that gets a sheet or report.
+
+    Times are in seconds. Requests sent from a thread pool, such as report
+    pages, add their times together, so the phase times may be greater than
+    ``total_seconds``. When a response is streamed, ``decode_seconds`` also
+    includes reading the body from the network and buffering the rows.
+
+    :param object_type: Type of the object fetched, 'SHEET' or 'REPORT'
+    :type object_type: str
+
+    :param object_id: ID of the object fetched
+    :type object_id: int
+    """
+
+    COUNTERS = (
+        "requests",
+        "retries",
+        "rate_limit_seconds",
+        "network_seconds",
+        "backoff_seconds",
+        "decode_seconds",
+        "convert_seconds",
+        "response_bytes",
+        "rows",
+        "cells",
+    )
+
+    def __init__(self, object_type: Optional[str] = None, object_id: Optional[int] = None) -> None:
+        """Start with every counter at zero."""
+        self.object_type = object_type
+        self.object_id = object_id
+        # Number of HTTP requests sent, retries included
+        self.requests = 0
+        # Number of requests sent again after a rate limit or connection error
+        self.retries = 0
+        # Time spent waiting for the rate limiter before sending
+        self.rate_limit_seconds = 0.0
+        # Time spent sending requests and receiving responses
+        self.network_seconds = 0.0
+        # Time slept between retries
+        self.backoff_seconds = 0.0
+        # Time spent decoding JSON response bodies
+        self.decode_seconds = 0.0
+        # Time spent converting the rows to the output format
+        self.convert_seconds = 0.0
+        # Size of the response bodies, as received
+        self.response_bytes = 0
+        # Number of rows converted
+        self.rows = 0
+        # Number of cells converted
+        self.cells = 0
+        # Wall-clock time of the whole call
+        self.total_seconds = 0.0
+        # Name of the exception raised by the call, if it failed
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def add(self, **counters: float) -> None:
+        """Add to counters, from any thread.
+
+        :param counters: Amounts to add, by counter name
+        :type counters: float
+        """
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the stats as a dictionary.
+
+        :return: Object type and ID, counters, total time and error
+        :rtype: dict
+        """
+        return {"object_type": self.object_type,
+                "object_id": self.object_id,
+                **{name: getattr(self, name) for name in self.COUNTERS},
+                "total_seconds": self.total_seconds,
+                "error": self.error}
+
+    def __repr__(self) -> str:
+        """Show the non-zero stats."""
+        values = ", ".join(f"{name}={value!r}" for name, value in self.as_dict().items() if value)
+        return f"FetchStats({values})"
+
+
+FetchHook = Callable[[FetchStats], None]
+
+
+@contextlib.contextmanager
+def observe(stats: Optional[FetchStats],
+            on_fetch: Optional[FetchHook],
+            object_type: Optional[str] = None,
+            object_id: Optional[int] = None) -> Iterator[Optional[FetchStats]]:
+    """Time a call, then hand its stats to the hook.
+
+    Nothing is measured if there is neither a stats object nor a hook.
+
+    :param stats: Stats object passed to the call
+    :type stats: FetchStats
+
+    :param on_fetch: Hook called with the stats once the call ends, even if it failed
+    :type on_fetch: Callable[[FetchStats], None]
+
+    :param object_type: Type of the object fetched
+    :type object_type: str
+
+    :param object_id: ID of the object fetched
+    :type object_id: int
+
+    :return: Stats to fill in, or None
+    :rtype: Iterator[FetchStats | None]
+    """
+    if stats is None and on_fetch is None:
+        yield None
+        return
+
+    stats = stats if stats is not None else FetchStats()
+    stats.object_type = stats.object_type or (object_type.upper() if object_type else None)
+    stats.object_id = stats.object_id or object_id
+    start = time.perf_counter()
+    try:
+        yield stats
+    except BaseException as e:
+        stats.error = type(e).__name__
+        raise
+    finally:
+        stats.total_seconds += time.perf_counter() - start
+        if on_fetch is not None:
+            try:
+                on_fetch(stats)
+            except Exception:
+                # A broken metrics exporter must not fail the fetch
+                logger.exception("The 'on_fetch' hook raised an exception")
@@ -0,0 +1,12 @@
+"""Helpers for testing and benchmarking code that uses smartsheet_dataframe."""
+
+# Local Imports
+from .synthetic import (
+    generate_report,
+    generate_sheet,
+)
+
+__all__ = [
+    "generate_report",
+    "generate_sheet",
+]
@@ -0,0 +1,480 @@
+"""Local stand-in for the Smartsheet API, for integration tests and load tests.
+
+``FakeSmartsheetServer`` serves synthetic sheets and reports over HTTP from
+a background thread, with the endpoints the package uses: sheets with
+``page``, ``pageSize``, ``rowIds``, ``columnIds``, ``include`` and ``level``,
+sheet versions and columns, paginated reports and workspace contents.
+Latency, rate limit errors, server errors and slow bodies can be switched on
+to see how a caller copes with them. Point a client at it with its
+``base_url``::
+
+    with FakeSmartsheetServer() as server:
+        sheet_id = server.add_sheet(rows=5000)
+        client = SmartsheetDataFrameClient(token="fake", base_url=server.base_url)
+        df = get_sheet_as_df(sheet_id=sheet_id, client=client)
+
+The server can also be run on its own, for example to load test a service::
+
+    python -m smartsheet_dataframe.testing.fake_server --port 8080 --sheets 10 --rows 5000
+"""
+
+# Standard Imports
+import argparse
+import collections
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import (
+    parse_qs,
+    urlsplit,
+)
+
+# Local Imports
+from ..utils.constants import (
+    OBJECT_VALUE_COLUMN_TYPES,
+    RATE_LIMIT_ERROR_CODE,
+)
+from .synthetic import (
+    generate_report,
+    generate_sheet,
+)
+
+API_PREFIX = "/2.0"
+# Page size of reports and sheets requested with 'page' but without 'pageSize', as in the API
+DEFAULT_PAGE_SIZE = 100
+# Encoded bodies kept for repeated requests, so that encoding does not dominate a load test
+BODY_CACHE_SIZE = 64
+BODY_CHUNK_BYTES = 64 * 1024
+
+# (status, errorCode, message) of the simulated server errors
+SERVER_ERRORS = (
+    (500, 4000, "An unexpected error has occurred."),
+    (503, 4001, "Smartsheet.com is currently offline for system maintenance."),
+)
+
+_ROUTES = (
+    (re.compile(r"/sheets/(\d+)"), "_get_sheet"),
+    (re.compile(r"/sheets/(\d+)/version"), "_get_version"),
+    (re.compile(r"/sheets/(\d+)/columns"), "_get_columns"),
+    (re.compile(r"/reports/(\d+)"), "_get_report"),
+    (re.compile(r"/workspaces/(\d+)"), "_get_workspace"),
+)
+
+
+class FakeSmartsheetServer:
+    """Smartsheet API stand-in serving synthetic sheets and reports from a background thread.
+
+    Any bearer token is accepted. Only GET requests are supported. The fault
+    settings are attributes, so they can be changed while the server is running.
+
+    :param host: Interface to listen on
+    :type host: str
+
+    :param port: Port to listen on. A free port is chosen if 0
+    :type port: int
+
+    :param latency: Seconds each response is delayed by
+    :type latency: float
+
+    :param rate_limit_rate: Share of requests, from 0 to 1, answered with a 429 rate limit error
+    :type rate_limit_rate: float
+
+    :param error_rate: Share of requests, from 0 to 1, answered with a 500 or 503 error
+    :type error_rate: float
+
+    :param retry_after: Value of the 'Retry-After' header of rate limit errors, in seconds.
+        The header is left out if None
+    :type retry_after: float
+
+    :param body_bytes_per_second: Rate successful bodies are sent at. They are sent at once if None
+    :type body_bytes_per_second: float
+
+    :param seed: Seed of the fault injection, so that a run can be repeated
+    :type seed: int
+    """
+
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: float = 0.0,
+                 rate_limit_rate: float = 0.0,
+                 error_rate: float = 0.0,
+                 retry_after: Optional[float] = None,
+                 body_bytes_per_second: Optional[float] = None,
+                 seed: int = 0) -> None:
+        """Create the server and bind its port. It is not serving until ``start`` is called."""
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.body_bytes_per_second = body_bytes_per_second
+
+        self.sheets: Dict[int, dict] = {}
+        self.reports: Dict[int, dict] = {}
+        # (method, path with query, status) of every request answered
+        self.requests: List[Tuple[str, str, int]] = []
+
+        # Seeded so that the injected faults can be replayed. It is not used for anything secret
+        self._random = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._next_id = 1000
+        self._bodies: collections.OrderedDict = collections.OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self  # type: ignore[attr-defined]
+
+    @property
+    def base_url(self) -> str:
+        """API base URL to give a client."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def add_sheet(self, sheet: Optional[dict] = None, sheet_id: Optional[int] = None, **kwargs: Any) -> int:
+        """Serve a sheet.
+
+        :param sheet: Sheet dictionary, as returned by ``GET /sheets/{id}`` at level 1 with
+            object values. Generated with ``generate_sheet(**kwargs)`` if not provided
+        :type sheet: dict
+
+        :param sheet_id: ID to serve the sheet at. A new ID is chosen if not provided
+        :type sheet_id: int
+
+        :return: ID of the sheet
+        :rtype: int
+        """
+        with self._lock:
+            sheet_id = sheet_id or self._new_id()
+            self.sheets[sheet_id] = {**(sheet or generate_sheet(**kwargs)), "id": sheet_id}
+            self._bodies.clear()
+
+        return sheet_id
+
+    def add_report(self, report: Optional[dict] = None, report_id: Optional[int] = None, **kwargs: Any) -> int:
+        """Serve a report.
+
+        :param report: Report dictionary, as returned by ``GET /reports/{id}`` for all its rows.
+            Generated with ``generate_report(**kwargs)`` if not provided
+        :type report: dict
+
+        :param report_id: ID to serve the report at. A new ID is chosen if not provided
+        :type report_id: int
+
+        :return: ID of the report
+        :rtype: int
+        """
+        with self._lock:
+            report_id = report_id or self._new_id()
+            self.reports[report_id] = {**(report or generate_report(**kwargs)), "id": report_id}
+            self._bodies.clear()
+
+        return report_id
+
+    def touch(self, sheet_id: int) -> None:
+        """Increase a sheet's version, as an edit of the sheet would.
+
+        :param sheet_id: ID of the sheet
+        :type sheet_id: int
+        """
+        with self._lock:
+            sheet = self.sheets[sheet_id]
+            self.sheets[sheet_id] = {**sheet, "version": sheet.get("version", 0) + 1}
+            self._bodies.clear()
+
+    def start(self) -> "FakeSmartsheetServer":
+        """Start serving from a background thread.
+
+        :return: The server
+        :rtype: FakeSmartsheetServer
+        """
+        # A short poll interval lets ``stop`` return quickly
+        self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05},
+                                        name="fake-smartsheet", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the port."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeSmartsheetServer":  # noqa: PYI034
+        """Start serving when entering a ``with`` block."""
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        """Stop serving when leaving a ``with`` block."""
+        self.stop()
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        while self._next_id in self.sheets or self._next_id in self.reports:
+            self._next_id += 1
+        return self._next_id
+
+    def _handle(self, handler: "_Handler") -> None:
+        """Answer one request."""
+        if self.latency:
+            time.sleep(self.latency)
+
+        if not handler.headers.get("Authorization", "").startswith("Bearer "):
+            self._send_error(handler, 401, 1002, "Your Access Token is invalid.")
+            return
+
+        with self._lock:
+            draw = self._random.random()
+            server_error = self._random.choice(SERVER_ERRORS)
+        if draw < self.rate_limit_rate:
+            headers = {} if self.retry_after is None else {"Retry-After": f"{self.retry_after:g}"}
+            self._send_error(handler, 429, RATE_LIMIT_ERROR_CODE,
+                             "Rate limit exceeded.", headers)
+            return
+        if draw < self.rate_limit_rate + self.error_rate:
+            self._send_error(handler, *server_error)
+            return
+
+        url = urlsplit(handler.path)
+        path = url.path[len(API_PREFIX):] if url.path.startswith(API_PREFIX) else None
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        route = _route(path)
+        if route is None:
+            self._send_error(handler, 404, 1006, "Not Found.")
+            return
+
+        with self._lock:
+            body = self._bodies.get(handler.path)
+            if body is not None:
+                self._bodies.move_to_end(handler.path)
+        if body is None:
+            try:
+                payload = getattr(self, route[0])(route[1], query)
+            except KeyError:
+                self._send_error(handler, 404, 1006, "Not Found.")
+                return
+            except ValueError:
+                self._send_error(handler, 400, 1008, "Unable to parse request.")
+                return
+            body = json.dumps(payload, separators=(",", ":")).encode()
+            with self._lock:
+                self._bodies[handler.path] = body
+                while len(self._bodies) > BODY_CACHE_SIZE:
+                    self._bodies.popitem(last=False)
+
+        self._send(handler, 200, body)
+
+    def _get_sheet(self, sheet_id: int, query: Dict[str, str]) -> dict:
+        sheet = self.sheets[sheet_id]
+        columns, rows = _at_level(sheet["columns"], sheet.get("rows") or [], query)
+
+        if "columnIds" in query:
+            column_ids = {int(column_id) for column_id in query["columnIds"].split(",")}
+            columns = [column for column in columns if column["id"] in column_ids]
+            rows = [{**row, "cells": [cell for cell in row["cells"] if cell.get("columnId") in column_ids]}
+                    for row in rows]
+        if "rowIds" in query:
+            row_ids = {int(row_id) for row_id in query["rowIds"].split(",")}
+            rows = [row for row in rows if row["id"] in row_ids]
+        rows = _page(rows, query)
+
+        return {**sheet, "columns": columns, "rows": rows}
+
+    def _get_version(self, sheet_id: int, query: Dict[str, str]) -> dict:
+        return {"version": self.sheets[sheet_id].get("version", 0)}
+
+    def _get_columns(self, sheet_id: int, query: Dict[str, str]) -> dict:
+        columns, _ = _at_level(self.sheets[sheet_id]["columns"], [], query, object_value=True)
+        return {"pageNumber": 1, "totalPages": 1, "totalCount": len(columns), "data": columns}
+
+    def _get_report(self, report_id: int, query: Dict[str, str]) -> dict:
+        report = self.reports[report_id]
+        page_size = int(query.get("pageSize", DEFAULT_PAGE_SIZE))
+        query = {"page": query.get("page", "1"), "pageSize": str(page_size)}
+        return {**report, "rows": _page(report.get("rows") or [], query)}
+
+    def _get_workspace(self, workspace_id: int, query: Dict[str, str]) -> dict:
+        # Every object is served from every workspace
+        return {"id": workspace_id,
+                "name": f"Workspace {workspace_id}",
+                "sheets": [{"id": id_, "name": sheet.get("name", "")} for id_, sheet in self.sheets.items()],
+                "reports": [{"id": id_, "name": report.get("name", "")} for id_, report in self.reports.items()]}
+
+    def _send_error(self,
+                    handler: "_Handler",
+                    status: int,
+                    error_code: int,
+                    message: str,
+                    headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps({"errorCode": error_code, "message": message}).encode()
+        self._send(handler, status, body, headers, throttle=False)
+
+    def _send(self,
+              handler: "_Handler",
+              status: int,
+              body: bytes,
+              headers: Optional[Dict[str, str]] = None,
+              throttle: bool = True) -> None:
+        with self._lock:
+            self.requests.append((handler.command, handler.path, status))
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json;charset=UTF-8")
+        handler.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+
+        bytes_per_second = self.body_bytes_per_second if throttle else None
+        if not bytes_per_second:
+            handler.wfile.write(body)
+            return
+        for start in range(0, len(body), BODY_CHUNK_BYTES):
+            chunk = body[start:start + BODY_CHUNK_BYTES]
+            time.sleep(len(chunk) / bytes_per_second)
+            handler.wfile.write(chunk)
+            handler.wfile.flush()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keeps connections open between requests, as the API does
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.server.fake._handle(self)  # type: ignore[attr-defined]
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        # Requests are recorded in FakeSmartsheetServer.requests instead
+        pass
+
+
+def _route(path: Optional[str]) -> Optional[Tuple[str, int]]:
+    """Find the method answering a path, and the ID in the path."""
+    for pattern, method in _ROUTES:
+        match = pattern.fullmatch(path or "")
+        if match:
+            return method, int(match.group(1))
+
+    return None
+
+
+def _at_level(columns: list, rows: list, query: Dict[str, str], object_value: bool = False) -> Tuple[list, list]:
+    """Show multi-contact columns as the API does for the requested level and includes.
+
+    Below level 1, or without object values, multi-contact columns are
+    TEXT_NUMBER columns holding the contacts' names as text.
+    """
+    object_value = object_value or "objectValue" in query.get("include", "").split(",")
+    positions = [position for position, column in enumerate(columns)
+                 if column.get("type") in OBJECT_VALUE_COLUMN_TYPES]
+    if not positions or (object_value and int(query.get("level", 0)) >= 1):
+        return columns, rows
+
+    columns = [{**column, "type": "TEXT_NUMBER"} if position in positions else column
+               for position, column in enumerate(columns)]
+    rows = [{**row, "cells": [_as_text(cell) if position in positions else cell
+                              for position, cell in enumerate(row["cells"])]}
+            for row in rows]
+
+    return columns, rows
+
+
+def _as_text(cell: dict) -> dict:
+    contacts = (cell.get("objectValue") or {}).get("values")
+    if not contacts:
+        return {key: value for key, value in cell.items() if key != "objectValue"}
+
+    text = ", ".join(contact.get("name") or contact.get("email", "") for contact in contacts)
+    return {"columnId": cell.get("columnId"), "value": text, "displayValue": text}
+
+
+def _page(rows: list, query: Dict[str, str]) -> list:
+    if "page" not in query and "pageSize" not in query:
+        return rows
+
+    page_size = int(query.get("pageSize", DEFAULT_PAGE_SIZE))
+    start = (int(query.get("page", 1)) - 1) * page_size
+    return rows[start:start + page_size]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Serve synthetic sheets and reports until interrupted.
+
+    The first line written to stdout holds the base URL, so that a script
+    starting the server on port 0 can find it.
+
+    :param argv: Command line arguments. ``sys.argv`` is used if not provided
+    :type argv: list[str]
+
+    :return: Exit status
+    :rtype: int
+    """
+    args = _parser().parse_args(argv)
+    server = FakeSmartsheetServer(host=args.host,
+                                  port=args.port,
+                                  latency=args.latency,
+                                  rate_limit_rate=args.rate_limit_rate,
+                                  error_rate=args.error_rate,
+                                  retry_after=args.retry_after,
+                                  body_bytes_per_second=args.body_bytes_per_second,
+                                  seed=args.seed)
+    for number in range(args.sheets):
+        server.add_sheet(rows=args.rows, columns=args.columns, max_depth=args.max_depth, seed=args.seed + number)
+    for number in range(args.reports):
+        server.add_report(rows=args.rows, columns=args.columns, seed=args.seed + number)
+
+    sys.stdout.write(f"{server.base_url}\n")
+    sys.stdout.write(f"Serving sheets {sorted(server.sheets)} and reports {sorted(server.reports)}\n")
+    sys.stdout.flush()
+    try:
+        server.start()
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m smartsheet_dataframe.testing.fake_server",
+                                     description="Serve synthetic Smartsheet sheets and reports locally")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on, or 0 for any free port")
+    parser.add_argument("--sheets", type=int, default=1, help="Number of sheets to serve")
+    parser.add_argument("--reports", type=int, default=0, help="Number of reports to serve")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows of each sheet and report")
+    parser.add_argument("--columns", type=int, default=20, help="Columns of each sheet and report")
+    parser.add_argument("--max-depth", type=int, default=0, help="Deepest level of each sheet's row hierarchy")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds each response is delayed by")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Share of requests answered with a rate limit error")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Share of requests answered with a 500 or 503 error")
+    parser.add_argument("--retry-after", type=float, help="Retry-After seconds sent with rate limit errors")
+    parser.add_argument("--body-bytes-per-second", type=float, help="Rate response bodies are sent at")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated objects and of the faults")
+
+    return parser
+
+
+if __name__ == "__main__":
+    sys.exit(main())
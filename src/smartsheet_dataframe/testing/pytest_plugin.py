@@ -0,0 +1,76 @@
+"""Pytest fixtures serving a fake Smartsheet API.
+
+Enable them in a ``conftest.py`` with::
+
+    pytest_plugins = ["smartsheet_dataframe.testing.pytest_plugin"]
+"""
+
+# Standard Imports
+import io
+import json
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+)
+from unittest.mock import Mock
+
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from ..client import SmartsheetDataFrameClient
+from ..rate_limit import RateLimiter
+from .fake_server import FakeSmartsheetServer
+
+
+@pytest.fixture
+def fake_smartsheet() -> Iterator[FakeSmartsheetServer]:
+    """Fake Smartsheet API server with no objects and no faults, stopped after the test."""
+    with FakeSmartsheetServer() as server:
+        yield server
+
+
+@pytest.fixture
+def fake_smartsheet_client(fake_smartsheet: FakeSmartsheetServer) -> Iterator[SmartsheetDataFrameClient]:
+    """Client sending its requests to the ``fake_smartsheet`` server."""
+    with SmartsheetDataFrameClient(token="fake-token", base_url=fake_smartsheet.base_url) as client:  # noqa: S106
+        yield client
+
+
+@pytest.fixture
+def mock_client() -> Callable[..., SmartsheetDataFrameClient]:
+    """Get a factory of clients whose mocked session answers every GET, without a server.
+
+    The factory takes the response body, or a function of the requested URL
+    returning it, followed by keyword arguments for the client, whose token is
+    'fake_token' unless another is given. A body is either encoded bytes or an
+    object encoded as JSON. The requests sent are recorded by ``client.session.get``.
+    """
+    def make(body: Any, **kwargs: Any) -> SmartsheetDataFrameClient:
+        def get(url: str, **_: Any) -> Mock:
+            content = body(url) if callable(body) else body
+            if not isinstance(content, bytes):
+                content = json.dumps(content).encode()
+
+            response = Mock()
+            response.status_code = 200
+            response.content = content
+            response.raw = io.BytesIO(content)
+            return response
+
+        kwargs.setdefault("token", "fake_token")
+        client = SmartsheetDataFrameClient(**kwargs)
+        client.session = Mock()
+        client.session.get.side_effect = get
+        return client
+
+    return make
+
+
+@pytest.fixture
+def unlimited_rate_limiter(monkeypatch: pytest.MonkeyPatch) -> RateLimiter:
+    """Keep the process-wide rate limiters from slowing down tests that send many mocked requests."""
+    limiter = RateLimiter(requests_per_minute=10 ** 9, burst=10 ** 6)
+    monkeypatch.setattr("smartsheet_dataframe.client.get_rate_limiter", lambda token: limiter)
+    return limiter
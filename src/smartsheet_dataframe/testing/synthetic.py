@@ -0,0 +1,244 @@
+"""Synthetic Smartsheet payloads for tests and benchmarks.
+
+The generated dictionaries have the shape of the Smartsheet API's sheet and
+report responses, with a mix of column types, contact object values, row
+hierarchies and empty cells. The same arguments and seed always give the
+same payload.
+"""
+
+# Standard Imports
+import random
+from datetime import (
+    date,
+    datetime,
+    timedelta,
+    timezone,
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+# Local Imports
+from ..utils.constants import (
+    SHEET_MAX_CELLS,
+    SHEET_MAX_COLUMNS,
+    SHEET_MAX_ROWS,
+)
+from ..utils.sequences import zip_equal
+
+COLUMN_TYPES = (
+    "TEXT_NUMBER",
+    "NUMBER",
+    "DATE",
+    "DATETIME",
+    "CHECKBOX",
+    "PICKLIST",
+    "CONTACT_LIST",
+    "MULTI_CONTACT_LIST",
+)
+
+# "NUMBER" is a TEXT_NUMBER column holding numbers only
+_API_COLUMN_TYPES = {"NUMBER": "TEXT_NUMBER"}
+
+_PICKLIST_OPTIONS = ["Not Started", "In Progress", "Blocked", "Complete"]
+_WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet"]
+_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def generate_sheet(rows: int = 1000,
+                   columns: int = 20,
+                   column_types: Optional[Sequence[str]] = None,
+                   max_depth: int = 0,
+                   sparsity: float = 0.1,
+                   contacts: int = 50,
+                   seed: int = 0) -> Dict[str, Any]:
+    """Generate a sheet dictionary like the one returned by ``GET /sheets/{id}``.
+
+    :param rows: Number of rows, at most 20,000
+    :type rows: int
+
+    :param columns: Number of columns, at most 400. The sheet may hold at most 500,000 cells
+    :type columns: int
+
+    :param column_types: Column types to cycle through. Any of 'TEXT_NUMBER' (mixed
+        text and numbers), 'NUMBER', 'DATE', 'DATETIME', 'CHECKBOX', 'PICKLIST',
+        'CONTACT_LIST' and 'MULTI_CONTACT_LIST'. Defaults to all of them
+    :type column_types: Sequence[str]
+
+    :param max_depth: Deepest level of the row hierarchy. 0 gives a flat sheet
+    :type max_depth: int
+
+    :param sparsity: Share of cells left empty, from 0 to 1
+    :type sparsity: float
+
+    :param contacts: Number of distinct contacts used by contact columns
+    :type contacts: int
+
+    :param seed: Random seed
+    :type seed: int
+
+    :return: Sheet dictionary
+    :rtype: dict
+    """
+    _check_size(rows, columns, sparsity)
+    # A seeded generator makes the data reproducible. It is not used for anything secret
+    rng = random.Random(seed)  # noqa: S311
+    types = _column_types(columns, column_types)
+
+    sheet_columns = []
+    for position, column_type in enumerate(types):
+        column: Dict[str, Any] = {"id": 1000 + position,
+                                  "index": position,
+                                  "title": f"{column_type.replace('_', ' ').title()} {position}",
+                                  "type": _API_COLUMN_TYPES.get(column_type, column_type)}
+        if column_type == "PICKLIST":
+            column["options"] = list(_PICKLIST_OPTIONS)
+        if position == 0:
+            column["primary"] = True
+        sheet_columns.append(column)
+
+    emails = [f"user{number}@example.com" for number in range(max(contacts, 1))]
+    parent_ids = _parent_ids(rows, max_depth, rng)
+    sheet_rows = []
+    for number in range(rows):
+        row: Dict[str, Any] = {"id": 10 ** 6 + number, "rowNumber": number + 1,
+                               "cells": [_cell(rng, column, column_type, emails, sparsity)
+                                         for column, column_type in zip_equal(sheet_columns, types)]}
+        if parent_ids[number] is not None:
+            row["parentId"] = parent_ids[number]
+        sheet_rows.append(row)
+
+    return {"id": 1, "name": "Synthetic Sheet", "version": 1, "totalRowCount": rows,
+            "columns": sheet_columns, "rows": sheet_rows}
+
+
+def generate_report(rows: int = 1000,
+                    columns: int = 20,
+                    column_types: Optional[Sequence[str]] = None,
+                    sparsity: float = 0.1,
+                    contacts: int = 50,
+                    source_sheets: int = 5,
+                    seed: int = 0) -> Dict[str, Any]:
+    """Generate a report dictionary like the one returned by ``GET /reports/{id}``.
+
+    Columns are identified by 'virtualId' and cells by 'virtualColumnId', and
+    rows come from several source sheets. The whole report is a single page.
+
+    :param rows: Number of rows
+    :type rows: int
+
+    :param columns: Number of columns
+    :type columns: int
+
+    :param column_types: Column types to cycle through, as for ``generate_sheet``
+    :type column_types: Sequence[str]
+
+    :param sparsity: Share of cells left empty, from 0 to 1
+    :type sparsity: float
+
+    :param contacts: Number of distinct contacts used by contact columns
+    :type contacts: int
+
+    :param source_sheets: Number of sheets the rows come from
+    :type source_sheets: int
+
+    :param seed: Random seed
+    :type seed: int
+
+    :return: Report dictionary
+    :rtype: dict
+    """
+    sheet = generate_sheet(rows, columns, column_types, sparsity=sparsity, contacts=contacts, seed=seed)
+    report_columns = []
+    for column in sheet["columns"]:
+        report_column = {key: value for key, value in column.items() if key != "id"}
+        report_column["virtualId"] = column["id"] + 5000
+        report_columns.append(report_column)
+
+    report_rows = []
+    for number, row in enumerate(sheet["rows"]):
+        cells = [{**{key: value for key, value in cell.items() if key != "columnId"},
+                  "virtualColumnId": cell["columnId"] + 5000}
+                 for cell in row["cells"]]
+        report_rows.append({"id": row["id"], "rowNumber": row["rowNumber"],
+                            "sheetId": 100 + number % max(source_sheets, 1), "cells": cells})
+
+    return {"id": 2, "name": "Synthetic Report", "totalRowCount": rows, "columns": report_columns,
+            "rows": report_rows}
+
+
+def _check_size(rows: int, columns: int, sparsity: float) -> None:
+    if not 0 <= rows <= SHEET_MAX_ROWS:
+        raise ValueError(f"'rows' must be between 0 and {SHEET_MAX_ROWS}. The current value is {rows}")
+    if not 1 <= columns <= SHEET_MAX_COLUMNS:
+        raise ValueError(f"'columns' must be between 1 and {SHEET_MAX_COLUMNS}. The current value is {columns}")
+    if rows * columns > SHEET_MAX_CELLS:
+        raise ValueError(f"A sheet holds at most {SHEET_MAX_CELLS} cells. {rows} x {columns} is too many")
+    if not 0 <= sparsity <= 1:
+        raise ValueError(f"'sparsity' must be between 0 and 1. The current value is {sparsity}")
+
+
+def _column_types(columns: int, column_types: Optional[Sequence[str]]) -> List[str]:
+    types = list(column_types or COLUMN_TYPES)
+    unknown = sorted(set(types) - set(COLUMN_TYPES))
+    if unknown:
+        raise ValueError(f"Unknown column types {unknown}. Use any of {', '.join(COLUMN_TYPES)}")
+
+    # The primary column is always text
+    return ["TEXT_NUMBER"] + [types[position % len(types)] for position in range(columns - 1)]
+
+
+def _parent_ids(rows: int, max_depth: int, rng: random.Random) -> List[Optional[int]]:
+    """Pick a parent for each row, listing parents before their children as the API does."""
+    parent_ids: List[Optional[int]] = []
+    stack: List[int] = []
+    for number in range(rows):
+        row_id = 10 ** 6 + number
+        # The stack holds the ancestors of the next row. Sometimes climb back up
+        # a random number of levels, and sometimes make the next row a child
+        if stack and rng.random() < 0.3:
+            del stack[-rng.randint(1, len(stack)):]
+        parent_ids.append(stack[-1] if stack else None)
+        if len(stack) < max_depth and rng.random() < 0.6:
+            stack.append(row_id)
+
+    return parent_ids
+
+
+def _cell(rng: random.Random,
+          column: Dict[str, Any],
+          column_type: str,
+          emails: List[str],
+          sparsity: float) -> Dict[str, Any]:
+    cell: Dict[str, Any] = {"columnId": column["id"]}
+    if rng.random() < sparsity:
+        return cell
+
+    if column_type == "TEXT_NUMBER":
+        value: Any = rng.choice(_WORDS) + f" {rng.randint(1, 10000)}" if rng.random() < 0.7 else rng.randint(1, 10000)
+    elif column_type == "NUMBER":
+        value = round(rng.uniform(0, 10000), 2) if rng.random() < 0.5 else rng.randint(0, 10000)
+    elif column_type == "DATE":
+        value = (date(2024, 1, 1) + timedelta(days=rng.randint(0, 730))).isoformat()
+    elif column_type == "DATETIME":
+        value = (_START + timedelta(seconds=rng.randint(0, 63072000))).strftime("%Y-%m-%dT%H:%M:%SZ")
+    elif column_type == "CHECKBOX":
+        value = rng.random() < 0.5
+    elif column_type == "PICKLIST":
+        value = rng.choice(_PICKLIST_OPTIONS)
+    elif column_type == "CONTACT_LIST":
+        value = rng.choice(emails)
+    else:
+        people = rng.sample(emails, min(len(emails), rng.randint(1, 3)))
+        cell["objectValue"] = {"objectType": "MULTI_CONTACT",
+                               "values": [{"objectType": "CONTACT", "email": email, "name": email.split("@")[0]}
+                                          for email in people]}
+        return cell
+
+    cell["value"] = value
+    cell["displayValue"] = str(value)
+    return cell
@@ -0,0 +1,292 @@
+"""Writing DataFrames back to sheets for the smartsheet_dataframe package.
+
+``update_sheet_from_df`` compares a DataFrame with the current contents of
+a sheet, matching rows by the ``row_id`` column that the conversion adds,
+and sends only the cells that changed. Changed rows, new rows and deleted
+rows are each sent in bulk requests of up to ``batch_size`` rows.
+"""
+
+from __future__ import annotations
+
+# Standard Imports
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import (
+    date,
+    datetime,
+    timezone,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+# Local Imports
+from .client import (
+    SmartsheetDataFrameClient,
+    get_default_client,
+)
+from .decoders import decode_json
+from .exceptions import WriteError
+from .hierarchy import _row_ids
+from .smartsheet_dataframe import (
+    _do_request,
+    _get_json,
+    _object_url,
+    _row_id_batches,
+)
+from .utils.constants import (
+    CHECKBOX_COLUMN_TYPE,
+    DATE_COLUMN_TYPES,
+    DEFAULT_WRITE_WORKERS,
+    GENERATED_COLUMNS,
+    OBJECT_VALUE_COLUMN_TYPES,
+    SHEET,
+    WRITE_BATCH_ROWS,
+)
+from .utils.sequences import zip_equal
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class SheetUpdate(NamedTuple):
+    """Changes sent to a sheet by ``update_sheet_from_df``.
+
+    :param updated: Number of existing rows with changed cells
+    :type updated: int
+
+    :param added: Number of rows added
+    :type added: int
+
+    :param deleted: Number of rows deleted
+    :type deleted: int
+
+    :param cells: Number of cells written, in updated and added rows
+    :type cells: int
+
+    :param requests: Number of write requests sent
+    :type requests: int
+    """
+
+    updated: int = 0
+    added: int = 0
+    deleted: int = 0
+    cells: int = 0
+    requests: int = 0
+
+
+def update_sheet_from_df(token: Optional[str] = None,
+                         sheet_id: Optional[int] = None,
+                         df: Optional[pd.DataFrame] = None,
+                         client: Optional[SmartsheetDataFrameClient] = None,
+                         delete_missing: bool = False,
+                         batch_size: int = WRITE_BATCH_ROWS,
+                         max_workers: int = DEFAULT_WRITE_WORKERS) -> SheetUpdate:
+    """Write the changes in a DataFrame back to its sheet.
+
+    The DataFrame's rows are matched to the sheet's rows by the 'row_id'
+    column, or by the index if it is named 'row_id', and its columns are
+    matched to the sheet's columns by title. Only the cells whose values
+    differ from the sheet are sent. Rows without a row ID are added to the
+    bottom of the sheet. Columns added by the conversion, such as 'parent_id',
+    and the cells of formula, system and multi-contact columns are not
+    written, so rows cannot be moved.
+
+    :param token: Smartsheet personal authentication token
+    :type token: str
+
+    :param sheet_id: Smartsheet sheet ID to update
+    :type sheet_id: int
+
+    :param df: DataFrame holding the new contents of the sheet, as returned by ``get_sheet_as_df``
+    :type df: pd.DataFrame
+
+    :param client: Client whose pooled session, token, rate limiter and timeouts are used
+        for the requests. The shared default client is used if not provided
+    :type client: SmartsheetDataFrameClient
+
+    :param delete_missing: If True, the sheet's rows whose row ID is not in the DataFrame are deleted
+    :type delete_missing: bool
+
+    :param batch_size: Maximum number of rows sent in one request
+    :type batch_size: int
+
+    :param max_workers: Maximum number of requests sent at the same time. Smartsheet
+        rejects concurrent writes to a sheet made with the same token, which are then
+        retried, so more than one worker only helps when the writes are spread over tokens
+    :type max_workers: int
+
+    :return: Number of rows and cells changed, and of requests sent
+    :rtype: SheetUpdate
+    """
+    if sheet_id is None:
+        raise ValueError("A sheet_id must be included in the parameters")
+    if df is None:
+        raise ValueError("A DataFrame must be included in the parameters")
+    if batch_size < 1:
+        raise ValueError("'batch_size' must be at least 1")
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be at least 1")
+
+    client = client or get_default_client()
+    token = token or client.token
+    if not token:
+        raise ValueError("A token must be included in the parameters or in the client")
+
+    sheet = _get_json(client, _object_url(client.base_url, sheet_id, SHEET), token)
+    updates, additions, deletions = _diff(sheet, df, delete_missing)
+    if not (updates or additions or deletions):
+        return SheetUpdate()
+
+    rows_url = f"{client.base_url}/sheets/{sheet_id}/rows"
+    writes: List[Callable[[], Any]] = []
+    for start in range(0, len(updates), batch_size):
+        writes.append(_write_request(client, token, "PUT", rows_url, updates[start:start + batch_size]))
+    for start in range(0, len(additions), batch_size):
+        writes.append(_write_request(client, token, "POST", rows_url, additions[start:start + batch_size]))
+    if deletions:
+        for batch in _row_id_batches(deletions):
+            for start in range(0, len(batch), batch_size):
+                ids = ",".join(map(str, batch[start:start + batch_size]))
+                writes.append(_write_request(client, token, "DELETE",
+                                               f"{rows_url}?ids={ids}&ignoreRowsNotFound=true"))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Raises the first error after the other requests have finished
+        list(executor.map(lambda send: send(), writes))
+
+    logger.debug(f"Updated sheet {sheet_id}", extra={"id": sheet_id, "requests": len(writes)})
+    return SheetUpdate(updated=len(updates),
+                       added=len(additions),
+                       deleted=len(deletions),
+                       cells=sum(len(row["cells"]) for row in updates + additions),
+                       requests=len(writes))
+
+
+def _diff(sheet: dict, df: pd.DataFrame, delete_missing: bool) -> tuple:
+    """Compare a DataFrame with a sheet's contents.
+
+    :return: Rows to update and to add, as API row objects, and IDs of the rows to delete
+    :rtype: tuple[list[dict], list[dict], list[int]]
+    """
+    columns_by_title = {column["title"]: column for column in sheet["columns"]}
+    unknown = [title for title in df.columns if title not in columns_by_title and title not in GENERATED_COLUMNS]
+    if unknown:
+        raise ValueError(f"The sheet has no columns titled {', '.join(map(str, unknown))}")
+
+    # Formula and system columns cannot be written. Multi-contact cells are read as
+    # flattened text, which would overwrite their contacts if it were sent back
+    columns = [columns_by_title[title] for title in df.columns
+               if title in columns_by_title
+               and "formula" not in columns_by_title[title]
+               and "systemColumnType" not in columns_by_title[title]
+               and columns_by_title[title].get("type") not in OBJECT_VALUE_COLUMN_TYPES]
+    values = [df[column["title"]].tolist() for column in columns]
+    current = {row["id"]: {cell.get("columnId"): cell for cell in row.get("cells", [])} for row in sheet["rows"]}
+
+    row_ids = [None if _is_missing(row_id) else int(row_id) for row_id in _row_ids(df)]
+    existing = [row_id for row_id in row_ids if row_id is not None]
+    if len(set(existing)) != len(existing):
+        raise ValueError("The DataFrame has duplicate row IDs")
+    not_found = [row_id for row_id in existing if row_id not in current]
+    if not_found:
+        raise ValueError(f"Rows {', '.join(map(str, not_found[:10]))} are not in the sheet")
+
+    updates, additions = [], []
+    for position, row_id in enumerate(row_ids):
+        cells = []
+        for column, column_values in zip_equal(columns, values):
+            value = _cell_value(column_values[position], column.get("type"))
+            if row_id is None:
+                if value is not None and not (value is False and column.get("type") == CHECKBOX_COLUMN_TYPE):
+                    cells.append({"columnId": column["id"], "value": value})
+                continue
+
+            cell = current[row_id].get(column["id"], {})
+            if "formula" in cell or value == _cell_value(cell.get("value"), column.get("type")):
+                continue
+            # An empty string clears the cell
+            cells.append({"columnId": column["id"], "value": "" if value is None else value})
+
+        if row_id is None:
+            additions.append({"toBottom": True, "cells": cells})
+        elif cells:
+            updates.append({"id": row_id, "cells": cells})
+
+    kept = set(existing)
+    deletions = [row_id for row_id in current if row_id not in kept] if delete_missing else []
+
+    return updates, additions, deletions
+
+
+def _cell_value(value: Any, column_type: Optional[str]) -> Any:
+    """Convert a DataFrame value to the value the API stores, for comparing and sending."""
+    if _is_missing(value) or value == "":
+        value = None
+    elif hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        # NumPy scalar
+        value = value.item()
+
+    if column_type == CHECKBOX_COLUMN_TYPE:
+        return bool(value)
+    if isinstance(value, date):
+        return _date_value(value, column_type)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+
+    return value
+
+
+def _date_value(value: date, column_type: Optional[str]) -> str:
+    """Format a date or date time the way the API stores it in a column of the given type."""
+    if not isinstance(value, datetime):
+        return value.isoformat()
+    if column_type in DATE_COLUMN_TYPES:
+        return value.date().isoformat()
+    if value.tzinfo is not None:
+        # The API's form of UTC date times
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    return value.isoformat(timespec="seconds")
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+    # pd.NA and pd.NaT, without importing Pandas
+    return type(value).__name__ in ("NAType", "NaTType")
+
+
+def _write_request(client: SmartsheetDataFrameClient,
+                   token: str,
+                   method: str,
+                   url: str,
+                   body: Optional[list] = None) -> Callable[[], Any]:
+    """Build a function sending one write request, raising a WriteError if it is rejected."""
+    def send() -> Any:
+        response = _do_request(url,
+                               options=client.headers(token),
+                               retries=client.retries,
+                               session=client.session,
+                               timeout=client.timeout,
+                               rate_limiter=client.limiter(token),
+                               retry_policy=client.retry_policy,
+                               method=method,
+                               body=body)
+        if response is None or response.status_code != 200:
+            raise WriteError(f"Smartsheet rejected the {method} request to {url}")
+
+        return decode_json(client.json_decoder, response.content, client.pause_gc)
+
+    return send
+
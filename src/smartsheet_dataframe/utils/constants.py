@@ -1,7 +1,11 @@
 """Constants for the smartsheet_dataframe package."""
 
 # Standard Imports
-from typing import Final
+from datetime import timedelta
+from typing import (
+    Final,
+    Tuple,
+)
 from urllib.parse import urljoin
 
 SMARTSHEET_API_BASE_URL: Final[str] = "https://api.smartsheet.com/2.0"
@@ -10,3 +14,76 @@ REPORTS_ENDPOINT: Final[str] = urljoin(SMARTSHEET_API_BASE_URL, "reports/")
 
 REPORT: Final[str] = "REPORT"
 SHEET: Final[str] = "SHEET"
+
+DEFAULT_POOL_SIZE: Final[int] = 10
+DEFAULT_RETRIES: Final[int] = 3
+DEFAULT_TIMEOUT: Final[Tuple[float, float]] = (10.0, 300.0)
+DEFAULT_MAX_WORKERS: Final[int] = 8
+
+REPORT_PAGE_SIZE: Final[int] = 10000
+CHUNK_ROWS: Final[int] = 1000
+# Smaller objects are converted serially, since handing chunks of rows to worker threads costs more than it saves
+PARALLEL_CONVERT_MIN_ROWS: Final[int] = 5000
+# Keeps each rowIds request URL well below common 8 KB URL length limits
+ROW_IDS_MAX_LENGTH: Final[int] = 4000
+
+# Rows sent in one add or update request
+WRITE_BATCH_ROWS: Final[int] = 500
+# Smartsheet applies one write to a sheet at a time, and rejects concurrent writes with the same token
+DEFAULT_WRITE_WORKERS: Final[int] = 1
+# Columns added by the conversion rather than read from the sheet
+GENERATED_COLUMNS: Final[Tuple[str, ...]] = ("row_id", "parent_id", "depth", "root_id", "sibling_index", "path")
+
+DEFAULT_CACHE_MAX_BYTES: Final[int] = 1024 ** 3
+DEFAULT_MEMORY_CACHE_MAX_BYTES: Final[int] = 256 * 1024 ** 2
+DEFAULT_MEMORY_CACHE_TTL: Final[float] = 60.0
+
+SYNC_CLOCK_SKEW: Final[timedelta] = timedelta(minutes=1)
+
+RATE_LIMIT_PER_MINUTE: Final[int] = 300
+RATE_LIMIT_BURST: Final[int] = 10
+# After a rate limit error the sustained rate is halved, down to this share of the configured rate
+RATE_LIMIT_MIN_SHARE: Final[float] = 0.125
+# Seconds a throttled rate takes to climb back from zero to the configured rate
+RATE_LIMIT_RECOVERY_SECONDS: Final[float] = 60.0
+
+BACKOFF_BASE_SECONDS: Final[float] = 5.0
+BACKOFF_MAX_SECONDS: Final[float] = 60.0
+# Total seconds a single request may spend backing off before it gives up
+RETRY_BUDGET_SECONDS: Final[float] = 180.0
+RETRY_STATUS_CODES: Final[Tuple[int, ...]] = (429, 500, 502, 503, 504)
+
+AUTH_ERROR_CODES: Final[Tuple[int, ...]] = (1002, 1003, 1004)
+RATE_LIMIT_ERROR_CODE: Final[int] = 4004
+
+ASYNC_EXECUTOR_ROW_THRESHOLD: Final[int] = 5000
+# Response bodies are decoded in the executor from about the size of ASYNC_EXECUTOR_ROW_THRESHOLD rows of a few columns
+ASYNC_EXECUTOR_BODY_BYTES: Final[int] = 1024 ** 2
+
+TEXT_NUMBER_COLUMN_TYPE: Final[str] = "TEXT_NUMBER"
+CHECKBOX_COLUMN_TYPE: Final[str] = "CHECKBOX"
+DATE_COLUMN_TYPES: Final[Tuple[str, ...]] = ("DATE",)
+DATETIME_COLUMN_TYPES: Final[Tuple[str, ...]] = ("DATETIME", "ABSTRACT_DATETIME")
+
+# Column types whose cells only hold their values in objectValue, at the level sheets are requested at
+OBJECT_VALUE_COLUMN_TYPES: Final[Tuple[str, ...]] = ("MULTI_CONTACT_LIST",)
+CATEGORICAL_COLUMN_TYPES: Final[Tuple[str, ...]] = ("PICKLIST", "MULTI_PICKLIST", "CONTACT_LIST", "MULTI_CONTACT_LIST")
+# Text columns with at most this share of distinct values are stored as categoricals
+CATEGORICAL_MAX_UNIQUE_RATIO: Final[float] = 0.5
+
+PANDAS_BACKEND: Final[str] = "pandas"
+ARROW_BACKEND: Final[str] = "arrow"
+POLARS_BACKEND: Final[str] = "polars"
+DICT_BACKEND: Final[str] = "dict"
+BACKENDS: Final[Tuple[str, ...]] = (PANDAS_BACKEND, ARROW_BACKEND, POLARS_BACKEND, DICT_BACKEND)
+
+ORJSON_DECODER: Final[str] = "orjson"
+MSGSPEC_DECODER: Final[str] = "msgspec"
+STDLIB_DECODER: Final[str] = "json"
+# In order of preference
+JSON_DECODERS: Final[Tuple[str, ...]] = (ORJSON_DECODER, MSGSPEC_DECODER, STDLIB_DECODER)
+
+# Smartsheet sheet size limits
+SHEET_MAX_ROWS: Final[int] = 20000
+SHEET_MAX_COLUMNS: Final[int] = 400
+SHEET_MAX_CELLS: Final[int] = 500000
@@ -0,0 +1,63 @@
+"""Inter-process file lock for the smartsheet_dataframe package."""
+
+# Standard Imports
+import os
+from pathlib import Path
+from typing import (
+    IO,
+    Optional,
+    Union,
+)
+
+
+class FileLock:
+    """Exclusive advisory lock held on a file while inside a ``with`` block.
+
+    Uses ``fcntl.flock`` on POSIX systems and ``msvcrt.locking`` on Windows.
+
+    :param path: Path of the lock file. It is created if it does not exist
+    :type path: str | os.PathLike
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Create the lock without acquiring it."""
+        self.path = Path(path)
+        self._file: Optional[IO[bytes]] = None
+
+    def acquire(self) -> None:
+        """Block until the lock is held."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a+b")
+
+        if os.name == "nt":
+            import msvcrt  # noqa: PLC0415
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore[attr-defined]
+        else:
+            import fcntl  # noqa: PLC0415
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+
+    def release(self) -> None:
+        """Release the lock."""
+        if self._file is None:
+            return
+
+        if os.name == "nt":
+            import msvcrt  # noqa: PLC0415
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore[attr-defined]
+        else:
+            import fcntl  # noqa: PLC0415
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "FileLock":  # noqa: PYI034
+        """Acquire the lock when entering a ``with`` block."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Release the lock when leaving a ``with`` block."""
+        self.release()
@@ -0,0 +1,26 @@
+"""Sequence helpers for the smartsheet_dataframe package."""
+
+# Standard Imports
+from typing import (
+    Iterator,
+    Sequence,
+    Tuple,
+)
+
+
+def zip_equal(*sequences: Sequence) -> Iterator[Tuple]:
+    """Zip sequences that must have the same length, like ``zip(..., strict=True)`` on Python 3.10+.
+
+    :param sequences: Sequences to zip
+    :type sequences: Sequence
+
+    :raises ValueError: If the sequences have different lengths
+
+    :return: Iterator of tuples holding one item of each sequence
+    :rtype: Iterator[tuple]
+    """
+    lengths = [len(sequence) for sequence in sequences]
+    if len(set(lengths)) > 1:
+        raise ValueError(f"Sequences of different lengths can not be zipped: {lengths}")
+
+    return zip(*sequences)
@@ -0,0 +1,10 @@
+# 3rd-Party Imports
+import pytest
+
+pytest_plugins = ["smartsheet_dataframe.testing.pytest_plugin"]
+
+
+@pytest.fixture(autouse=True)
+def unlimited_rate_limiter(unlimited_rate_limiter):
+    """Keep the process-wide rate limiters from slowing down tests that send many mocked requests."""
+    return unlimited_rate_limiter
@@ -0,0 +1,239 @@
+# Standard Imports
+import asyncio
+import gc
+import json
+import threading
+from unittest.mock import patch
+
+# 3rd-Party Imports
+import httpx
+import pandas as pd
+import pytest
+
+# Local Imports
+from smartsheet_dataframe import (
+    AsyncSmartsheetDataFrameClient,
+    aget_as_df,
+    aget_report_as_df,
+    aget_sheet_as_df,
+    get_default_async_client,
+)
+from smartsheet_dataframe.aio import _default_clients
+from smartsheet_dataframe.exceptions import (
+    AuthenticationError,
+    RetryError,
+)
+from smartsheet_dataframe.rate_limit import (
+    FileRateLimiter,
+    RateLimiter,
+)
+
+MOCK_SHEET = {
+    "columns": [{"title": "Column1"}, {"title": "Column2"}],
+    "rows": [{"id": 1, "cells": [{"value": "Value1"}, {"value": "Value2"}]}]
+}
+
+
+def _client(responses: list) -> AsyncSmartsheetDataFrameClient:
+    """Build a client whose transport returns the given (status, payload) pairs in order."""
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        status_code, payload = responses.pop(0)
+        return httpx.Response(status_code, content=json.dumps(payload).encode())
+
+    client = AsyncSmartsheetDataFrameClient(token="client_token",
+                                            rate_limiter=RateLimiter(requests_per_minute=6000, burst=100))
+    client.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client.requests_seen = requests_seen
+    return client
+
+
+async def _run(coroutine_function, client, *args, **kwargs):
+    async with client:
+        return await coroutine_function(*args, client=client, **kwargs)
+
+
+class TestAgetSheetAsDf:
+
+    def test_sheet(self):
+        client = _client([(200, MOCK_SHEET)])
+
+        df = asyncio.run(_run(aget_sheet_as_df, client, sheet_id=12345))
+
+        assert isinstance(df, pd.DataFrame)
+        assert df.loc[0, "Column1"] == "Value1"
+        request = client.requests_seen[0]
+        assert request.url == "https://api.smartsheet.com/2.0/sheets/12345?include=objectValue&level=1"
+        assert request.headers["Authorization"] == "Bearer client_token"
+
+    def test_without_sheet_id(self):
+        with pytest.raises(ValueError):
+            asyncio.run(aget_sheet_as_df(token="fake_token"))
+
+    def test_without_token(self):
+        with pytest.raises(ValueError):
+            asyncio.run(aget_sheet_as_df(sheet_id=12345))
+
+
+class TestAgetReportAsDf:
+
+    def test_report(self):
+        client = _client([(200, MOCK_SHEET)])
+
+        df = asyncio.run(_run(aget_report_as_df, client, token="call_token", report_id=12345))
+
+        assert df.loc[0, "Column2"] == "Value2"
+        request = client.requests_seen[0]
+        assert request.url.path == "/2.0/reports/12345"
+        assert request.headers["Authorization"] == "Bearer call_token"
+
+
+    def test_report_pages_joined_in_order(self):
+        client = _client([])
+
+        def handler(request):
+            client.requests_seen.append(request)
+            number = int(request.url.params["page"])
+            return httpx.Response(200, json={"columns": [{"title": "Column1"}], "totalRowCount": 5,
+                                             "rows": [{"id": number, "cells": [{"value": number}]}]})
+
+        client.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        df = asyncio.run(_run(aget_report_as_df, client, report_id=12345, page_size=2))
+
+        assert df["Column1"].tolist() == [1, 2, 3]
+        assert sorted(request.url.params["page"] for request in client.requests_seen) == ["1", "2", "3"]
+
+
+class TestGetDefaultAsyncClient:
+
+    def test_shared_within_event_loop(self):
+        async def clients():
+            return await asyncio.gather(*(asyncio.sleep(0, get_default_async_client()) for _ in range(3)))
+
+        first, second, third = asyncio.run(clients())
+
+        assert first is second is third
+
+    def test_new_client_for_each_event_loop(self):
+        async def client():
+            return get_default_async_client()
+
+        assert asyncio.run(client()) is not asyncio.run(client())
+
+    def test_client_reused_by_the_same_loop(self):
+        async def client():
+            return get_default_async_client()
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(client()) is loop.run_until_complete(client())
+        finally:
+            loop.close()
+
+    def test_closed_loops_are_dropped(self):
+        async def client():
+            return get_default_async_client()
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(client())
+        loop.close()
+        asyncio.run(client())
+        gc.collect()
+
+        assert loop not in _default_clients
+
+    @patch("smartsheet_dataframe.aio.get_default_async_client")
+    def test_concurrent_calls_share_default_client(self, mock_get_default_async_client):
+        client = _client([(200, MOCK_SHEET), (200, MOCK_SHEET)])
+        mock_get_default_async_client.return_value = client
+
+        async def fetch_both():
+            return await asyncio.gather(aget_sheet_as_df(token="call_token", sheet_id=1),
+                                        aget_sheet_as_df(token="call_token", sheet_id=2))
+
+        dfs = asyncio.run(fetch_both())
+
+        assert [df.loc[0, "Column1"] for df in dfs] == ["Value1", "Value1"]
+        assert len(client.requests_seen) == 2
+        assert {request.headers["Authorization"] for request in client.requests_seen} == {"Bearer call_token"}
+
+
+class TestAgetAsDf:
+
+    @patch("smartsheet_dataframe.aio.asyncio.sleep")
+    def test_rate_limit_retry(self, mock_sleep):
+        mock_sleep.return_value = None
+        client = _client([(429, {"errorCode": 4004}), (200, MOCK_SHEET)])
+
+        df = asyncio.run(_run(aget_as_df, client, "sheet", id_=12345))
+
+        assert df.loc[0, "Column1"] == "Value1"
+        # Backoff of half to all of 5 seconds before the first retry
+        assert 2.5 <= mock_sleep.call_args.args[0] <= 5
+
+    @patch("smartsheet_dataframe.aio.asyncio.sleep")
+    def test_rate_limit_failure(self, mock_sleep):
+        mock_sleep.return_value = None
+        client = _client([(429, {"errorCode": 4004})] * 3)
+
+        with pytest.raises(RetryError) as e:
+            asyncio.run(_run(aget_as_df, client, "sheet", id_=12345))
+
+        assert "Could not retrieve request after retrying" in str(e.value)
+
+    def test_authentication_error(self):
+        client = _client([(401, {"errorCode": 1002})])
+
+        with pytest.raises(AuthenticationError):
+            asyncio.run(_run(aget_as_df, client, "sheet", id_=12345))
+
+    def test_invalid_type(self):
+        client = _client([])
+
+        with pytest.raises(ValueError):
+            asyncio.run(_run(aget_as_df, client, "folder", id_=12345))
+
+    @patch("smartsheet_dataframe.aio.ASYNC_EXECUTOR_BODY_BYTES", 1)
+    def test_large_body_decoded_in_executor(self):
+        client = _client([(200, MOCK_SHEET)])
+        decode_threads = []
+
+        def decode(body):
+            decode_threads.append(threading.current_thread())
+            return json.loads(body)
+
+        client.json_decoder = decode
+
+        df = asyncio.run(_run(aget_as_df, client, "sheet", id_=12345))
+
+        assert df.loc[0, "Column1"] == "Value1"
+        assert len(decode_threads) == 1
+        assert decode_threads[0] is not threading.main_thread()
+
+    def test_file_rate_limiter_updated_in_executor(self, tmp_path):
+        client = _client([(200, MOCK_SHEET)])
+        client.rate_limiter = FileRateLimiter(tmp_path / "bucket.json")
+
+        reserve_threads = []
+
+        def reserve(limiter):
+            reserve_threads.append(threading.current_thread())
+            return 0.0
+
+        with patch.object(FileRateLimiter, "reserve", autospec=True, side_effect=reserve):
+            df = asyncio.run(_run(aget_as_df, client, "sheet", id_=12345))
+
+        assert df.loc[0, "Column1"] == "Value1"
+        assert len(reserve_threads) == 1
+        assert reserve_threads[0] is not threading.main_thread()
+
+    @patch("smartsheet_dataframe.aio.ASYNC_EXECUTOR_ROW_THRESHOLD", 1)
+    def test_large_payload_converted_in_executor(self):
+        client = _client([(200, MOCK_SHEET)])
+
+        df = asyncio.run(_run(aget_as_df, client, "sheet", id_=12345))
+
+        assert df.loc[0, "Column1"] == "Value1"
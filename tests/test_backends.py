@@ -0,0 +1,171 @@
+# Standard Imports
+import datetime
+import subprocess
+import sys
+
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from smartsheet_dataframe import (
+    get_report_as_df,
+    get_sheet_as_df,
+)
+from smartsheet_dataframe.conversion import ConversionOptions
+from smartsheet_dataframe.smartsheet_dataframe import _convert
+
+MOCK_SHEET = {
+    "columns": [
+        {"title": "Task", "type": "TEXT_NUMBER"},
+        {"title": "Hours", "type": "TEXT_NUMBER"},
+        {"title": "Due", "type": "DATE"},
+        {"title": "Done", "type": "CHECKBOX"},
+        {"title": "Status", "type": "PICKLIST", "options": ["Open", "Closed"]},
+    ],
+    "rows": [
+        {"id": 1, "cells": [{"value": "Design"}, {"value": 2}, {"value": "2024-01-31"}, {"value": True},
+                            {"value": "Open"}]},
+        {"id": 2, "parentId": 1, "cells": [{"value": "Build"}, {"value": 1.5}, {}, {}, {"value": "Open"}]},
+    ]
+}
+
+
+def _options(backend, **kwargs):
+    return ConversionOptions(backend=backend, **kwargs)
+
+
+class TestDictBackend:
+
+    def test_typed(self):
+        data = _convert(MOCK_SHEET, _options("dict"))
+
+        assert data == {
+            "row_id": [1, 2],
+            "parent_id": [None, 1],
+            "Task": ["Design", "Build"],
+            "Hours": [2.0, 1.5],
+            "Due": [datetime.date(2024, 1, 31), None],
+            "Done": [True, False],
+            "Status": ["Open", "Open"],
+        }
+
+    def test_empty_columns(self):
+        sheet = {"columns": MOCK_SHEET["columns"], "rows": [{"id": 1, "cells": [{}, {"value": 1}]},
+                                                              {"id": 2, "cells": [{}, {"value": 2.5}]}]}
+
+        data = _convert(sheet, _options("dict", include_row_id=False, include_parent_id=False))
+
+        assert data["Hours"] == [1.0, 2.5]
+        assert data["Task"] == [None, None]
+        assert data["Due"] == [None, None]
+        assert data["Done"] == [False, False]
+
+    def test_untyped(self):
+        data = _convert(MOCK_SHEET, _options("dict", typed=False, include_row_id=False, include_parent_id=False))
+
+        assert data["Due"] == ["2024-01-31", ""]
+        assert data["Done"] == [True, ""]
+
+    def test_hierarchy(self):
+        data = _convert(MOCK_SHEET, _options("dict", hierarchy=True))
+
+        assert data["depth"] == [0, 1]
+        assert data["path"] == [(1,), (1, 2)]
+
+    def test_duplicate_titles(self):
+        sheet = {"columns": [{"title": "A"}, {"title": "A"}], "rows": []}
+
+        with pytest.raises(ValueError):
+            _convert(sheet, _options("dict"))
+
+
+class TestArrowBackend:
+
+    @pytest.fixture(autouse=True)
+    def pa(self):
+        return pytest.importorskip("pyarrow")
+
+    def test_types(self, pa):
+        table = _convert(MOCK_SHEET, _options("arrow"))
+
+        assert isinstance(table, pa.Table)
+        assert table.schema.field("row_id").type == pa.int64()
+        assert table.schema.field("Hours").type == pa.float64()
+        assert table.schema.field("Due").type == pa.date32()
+        assert table.schema.field("Done").type == pa.bool_()
+        assert table.column("parent_id").to_pylist() == [None, 1]
+
+    def test_categorical(self, pa):
+        table = _convert(MOCK_SHEET, _options("arrow", categorical=True))
+
+        assert pa.types.is_dictionary(table.schema.field("Status").type)
+        assert table.column("Status").to_pylist() == ["Open", "Open"]
+
+    def test_mixed_values_fall_back_to_text(self):
+        sheet = {"columns": [{"title": "A", "type": "TEXT_NUMBER"}],
+                 "rows": [{"id": 1, "cells": [{"value": "x"}]}, {"id": 2, "cells": [{"value": 3}]}]}
+
+        table = _convert(sheet, _options("arrow"))
+
+        assert table.column("A").to_pylist() == ["x", "3"]
+
+
+class TestPolarsBackend:
+
+    @pytest.fixture(autouse=True)
+    def pl(self):
+        return pytest.importorskip("polars")
+
+    def test_types(self, pl):
+        df = _convert(MOCK_SHEET, _options("polars"))
+
+        assert isinstance(df, pl.DataFrame)
+        assert df.schema["row_id"] == pl.Int64
+        assert df.schema["Due"] == pl.Date
+        assert df["Hours"].to_list() == [2.0, 1.5]
+
+    def test_categorical(self, pl):
+        df = _convert(MOCK_SHEET, _options("polars", categorical=True))
+
+        assert df.schema["Status"] == pl.Categorical
+
+    def test_mixed_values_fall_back_to_text(self):
+        sheet = {"columns": [{"title": "A", "type": "TEXT_NUMBER"}],
+                 "rows": [{"id": 1, "cells": [{"value": "x"}]}, {"id": 2, "cells": [{"value": 3}]}]}
+
+        df = _convert(sheet, _options("polars"))
+
+        assert df["A"].to_list() == ["x", "3"]
+
+
+class TestGetAsBackend:
+
+    def test_sheet(self, mock_client):
+        client = mock_client(MOCK_SHEET)
+
+        data = get_sheet_as_df(sheet_id=12345, client=client, backend="dict")
+
+        assert data["Task"] == ["Design", "Build"]
+
+    def test_stream_report_columns(self, mock_client):
+        report = {"columns": [{"title": "A", "virtualId": 1}, {"title": "B", "virtualId": 2}], "totalRowCount": 1,
+                  "rows": [{"id": 1, "cells": [{"value": "a"}, {"value": "b"}]}]}
+        client = mock_client(report)
+
+        data = get_report_as_df(report_id=12345, client=client, stream=True, columns=["B"], backend="dict")
+
+        assert data == {"row_id": [1], "parent_id": [None], "B": ["b"]}
+
+    def test_invalid_backend(self):
+        with pytest.raises(ValueError):
+            get_sheet_as_df(token="fake_token", sheet_id=12345, backend="excel")
+
+    def test_cache_requires_pandas(self, tmp_path):
+        with pytest.raises(ValueError):
+            get_sheet_as_df(token="fake_token", sheet_id=12345, cache_dir=tmp_path, backend="dict")
+
+
+def test_import_does_not_load_pandas():
+    code = "import sys, smartsheet_dataframe; sys.exit('pandas' in sys.modules)"
+
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -0,0 +1,307 @@
+# Standard Imports
+import os
+import threading
+import time
+from unittest.mock import (
+    patch,
+    Mock
+)
+
+# 3rd-Party Imports
+import pandas as pd
+import pytest
+
+# Local Imports
+from smartsheet_dataframe import (
+    DiskCache,
+    MemoryCache,
+    get_as_df,
+    get_sheet_as_df,
+    hierarchy_index,
+)
+
+MOCK_SHEET = {
+    "version": 7,
+    "columns": [{"title": "Column1"}, {"title": "Column2"}],
+    "rows": [{"id": 1, "cells": [{"value": "Value1"}, {"value": 2}]}]
+}
+
+
+class TestDiskCache:
+
+    def test_put_and_get(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+        cache.put("key", 3, df)
+
+        pd.testing.assert_frame_equal(cache.get("key", 3), df)
+        assert list(tmp_path.glob("*.parquet"))
+
+    def test_version_mismatch(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.put("key", 3, pd.DataFrame({"a": [1]}))
+
+        assert cache.get("key", 4) is None
+        assert cache.get("missing", 3) is None
+
+    def test_mixed_types_fall_back_to_pickle(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        df = pd.DataFrame({"a": pd.Series([1, ""], dtype=object)})
+
+        cache.put("key", 1, df)
+
+        pd.testing.assert_frame_equal(cache.get("key", 1), df)
+        assert list(tmp_path.glob("*.pickle"))
+
+    def test_tuples_are_kept(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        df = pd.DataFrame({"path": [(1,), (1, 2)], "a": [1, 2]})
+        cache.put("key", 1, df)
+
+        cached = cache.get("key", 1)
+
+        pd.testing.assert_frame_equal(cached, df)
+        assert cached["path"].tolist() == [(1,), (1, 2)]
+
+    def test_replacing_entry_removes_old_data(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.put("key", 1, pd.DataFrame({"a": [1]}))
+        cache.put("key", 2, pd.DataFrame({"a": [2]}))
+
+        assert len(list(tmp_path.glob("*.parquet"))) == 1
+        assert cache.get("key", 2)["a"].tolist() == [2]
+
+    def test_lru_eviction(self, tmp_path):
+        df = pd.DataFrame({"a": range(100)})
+        cache = DiskCache(tmp_path)
+        cache.put("old", 1, df)
+        cache.put("new", 1, df)
+        entry_size = max(path.stat().st_size for path in tmp_path.glob("*.parquet"))
+
+        # Make "old" the most recently used entry
+        for path in tmp_path.glob("new-*.parquet"):
+            os.utime(path, (1, 1))
+        cache.get("old", 1)
+
+        cache.max_bytes = entry_size * 2
+        cache.put("newest", 1, df)
+
+        assert cache.get("new", 1) is None
+        assert cache.get("old", 1) is not None
+        assert cache.get("newest", 1) is not None
+
+    def test_clear(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.put("key", 1, pd.DataFrame({"a": [1]}))
+
+        cache.clear()
+
+        assert cache.get("key", 1) is None
+
+    def test_invalid_max_bytes(self, tmp_path):
+        with pytest.raises(ValueError):
+            DiskCache(tmp_path, max_bytes=-1)
+
+
+class TestGetSheetAsDfWithCache:
+
+    @pytest.fixture
+    def versioned_client(self, mock_client):
+        def make(version):
+            return mock_client(lambda url: {"version": version} if url.endswith("/version") else MOCK_SHEET)
+
+        return make
+
+    def test_unchanged_sheet_is_loaded_from_cache(self, versioned_client, tmp_path):
+        client = versioned_client(version=7)
+
+        first = get_sheet_as_df(sheet_id=12345, client=client, cache_dir=tmp_path)
+        second = get_sheet_as_df(sheet_id=12345, client=client, cache_dir=tmp_path)
+
+        pd.testing.assert_frame_equal(first, second)
+        urls = [call.args[0] for call in client.session.get.call_args_list]
+        assert [url.endswith("/version") for url in urls] == [True, False, True]
+
+    def test_changed_sheet_is_fetched(self, versioned_client, tmp_path):
+        get_sheet_as_df(sheet_id=12345, client=versioned_client(version=7), cache_dir=tmp_path)
+        client = versioned_client(version=8)
+
+        get_as_df(type_="sheet", id_=12345, client=client, cache_dir=DiskCache(tmp_path))
+
+        assert client.session.get.call_count == 2
+
+    def test_different_options_are_cached_separately(self, versioned_client, tmp_path):
+        client = versioned_client(version=7)
+
+        get_sheet_as_df(sheet_id=12345, client=client, cache_dir=tmp_path)
+        df = get_sheet_as_df(sheet_id=12345, client=client, cache_dir=tmp_path, hierarchy=True)
+        get_sheet_as_df(sheet_id=12345, client=client, cache_dir=tmp_path, hierarchy=True, convert_workers=2)
+
+        assert "depth" in df.columns
+        urls = [call.args[0] for call in client.session.get.call_args_list]
+        assert [url.endswith("/version") for url in urls] == [True, False, True, False, True]
+
+    def test_tokens_and_regions_are_cached_separately(self, mock_client, tmp_path):
+        def body(url):
+            return {"version": 7} if url.endswith("/version") else MOCK_SHEET
+
+        clients = [mock_client(body), mock_client(body, token="other_token"),
+                   mock_client(body, base_url="https://api.smartsheet.eu/2.0")]
+
+        for client in clients:
+            get_sheet_as_df(sheet_id=12345, client=client, cache_dir=tmp_path)
+
+        for client in clients:
+            assert client.session.get.call_count == 2
+
+    def test_cached_hierarchy_matches_uncached(self, versioned_client, tmp_path):
+        client = versioned_client(version=7)
+        uncached = get_sheet_as_df(sheet_id=12345, client=client, hierarchy=True)
+
+        get_sheet_as_df(sheet_id=12345, client=client, cache_dir=tmp_path, hierarchy=True)
+        cached = get_sheet_as_df(sheet_id=12345, client=client, cache_dir=tmp_path, hierarchy=True)
+
+        pd.testing.assert_frame_equal(cached, uncached)
+        assert cached["path"].tolist() == [(1,)]
+        assert hierarchy_index(cached).equals(hierarchy_index(uncached))
+
+    @patch("warnings.warn")
+    @patch("smartsheet_dataframe.smartsheet_dataframe._get_from_request")
+    def test_reports_are_not_cached(self, mock_get_from_request, mock_warn, tmp_path):
+        mock_get_from_request.return_value = MOCK_SHEET
+
+        get_as_df(type_="report", token="fake_token", id_=12345, cache_dir=tmp_path)
+
+        mock_warn.assert_called_with("Reports can not be cached. The 'cache_dir' parameter will be ignored")
+        assert not list(tmp_path.iterdir())
+
+
+class TestMemoryCache:
+
+    def test_hit_within_ttl(self):
+        cache = MemoryCache(ttl=60)
+        load = Mock(return_value=pd.DataFrame({"a": [1]}))
+
+        first = cache.get_or_load("key", load)
+        second = cache.get_or_load("key", load)
+
+        pd.testing.assert_frame_equal(first, second)
+        assert load.call_count == 1
+
+    def test_expired_entry_is_loaded_again(self):
+        cache = MemoryCache(ttl=60)
+        load = Mock(return_value=pd.DataFrame({"a": [1]}))
+        cache.get_or_load("key", load)
+
+        with patch("smartsheet_dataframe.cache.time.monotonic", return_value=time.monotonic() + 61):
+            cache.get_or_load("key", load)
+
+        assert load.call_count == 2
+
+    def test_least_recently_used_entry_is_evicted(self):
+        df = pd.DataFrame({"a": range(100)})
+        size = int(df.memory_usage(deep=True).sum())
+        cache = MemoryCache(max_bytes=2 * size)
+
+        cache.get_or_load("first", lambda: df)
+        cache.get_or_load("second", lambda: df)
+        cache.get_or_load("first", lambda: df)
+        cache.get_or_load("third", lambda: df)
+
+        load = Mock(return_value=df)
+        cache.get_or_load("first", load)
+        cache.get_or_load("second", load)
+        assert load.call_count == 1
+
+    def test_entries_larger_than_the_cache_are_not_stored(self):
+        cache = MemoryCache(max_bytes=10)
+
+        cache.get_or_load("key", lambda: pd.DataFrame({"a": range(100)}))
+
+        assert len(cache) == 0
+
+    def test_concurrent_misses_share_one_load(self):
+        cache = MemoryCache()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return pd.DataFrame({"a": [1]})
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("key", load)))
+                   for _ in range(5)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert len(results) == 5
+
+    def test_load_error_is_raised_and_not_cached(self):
+        cache = MemoryCache()
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("key", Mock(side_effect=RuntimeError("failed")))
+
+        load = Mock(return_value=pd.DataFrame({"a": [1]}))
+        cache.get_or_load("key", load)
+        assert load.call_count == 1
+
+    def test_callers_get_independent_frames(self):
+        cache = MemoryCache()
+        cache.get_or_load("key", lambda: pd.DataFrame({"a": [1]}))
+
+        first = cache.get_or_load("key", Mock())
+        first.loc[0, "a"] = 2
+        second = cache.get_or_load("key", Mock())
+
+        assert second.loc[0, "a"] == 1
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            MemoryCache(ttl=0)
+        with pytest.raises(ValueError):
+            MemoryCache(max_bytes=-1)
+
+
+class TestGetSheetAsDfWithMemoryCache:
+
+    @pytest.fixture
+    def client(self, mock_client):
+        return mock_client(MOCK_SHEET)
+
+    def test_repeated_call_is_served_from_memory(self, client):
+        cache = MemoryCache()
+
+        first = get_sheet_as_df(sheet_id=12345, client=client, memory_cache=cache)
+        second = get_as_df(type_="sheet", id_=12345, client=client, memory_cache=cache)
+
+        pd.testing.assert_frame_equal(first, second)
+        assert client.session.get.call_count == 1
+
+    def test_different_options_are_fetched_separately(self, client):
+        cache = MemoryCache()
+
+        get_sheet_as_df(sheet_id=12345, client=client, memory_cache=cache)
+        get_sheet_as_df(sheet_id=12345, client=client, memory_cache=cache, include_row_id=False)
+        get_sheet_as_df(sheet_id=12345, client=client, memory_cache=cache, typed=False)
+
+        assert client.session.get.call_count == 3
+
+    def test_different_tokens_are_fetched_separately(self, client):
+        cache = MemoryCache()
+
+        get_sheet_as_df(sheet_id=12345, client=client, memory_cache=cache)
+        get_sheet_as_df(token="other_token", sheet_id=12345, client=client, memory_cache=cache)
+
+        assert client.session.get.call_count == 2
@@ -0,0 +1,138 @@
+# Standard Imports
+import json
+from unittest.mock import (
+    patch,
+    Mock
+)
+
+# 3rd-Party Imports
+import pandas as pd
+import pytest
+
+# Local Imports
+from smartsheet_dataframe import (
+    SmartsheetDataFrameClient,
+    get_as_df,
+    get_default_client,
+    get_sheet_as_df,
+)
+from smartsheet_dataframe.smartsheet_dataframe import _get_from_request
+
+
+def _mock_response(payload: dict) -> Mock:
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+MOCK_SHEET = {
+    "columns": [{"title": "Column1"}, {"title": "Column2"}],
+    "rows": [{"id": 1, "cells": [{"value": "Value1"}, {"value": "Value2"}]}]
+}
+
+
+class TestSmartsheetDataFrameClient:
+
+    def test_session_is_pooled(self):
+        client = SmartsheetDataFrameClient(token="fake_token", pool_size=4)
+        adapter = client.session.get_adapter("https://api.smartsheet.com")
+
+        assert adapter._pool_maxsize == 4
+        assert adapter._pool_connections == 4
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError):
+            SmartsheetDataFrameClient(pool_size=0)
+
+    def test_headers_prefers_call_token(self):
+        client = SmartsheetDataFrameClient(token="client_token")
+
+        assert client.headers() == {"Authorization": "Bearer client_token"}
+        assert client.headers("call_token") == {"Authorization": "Bearer call_token"}
+
+    def test_headers_without_token(self):
+        with pytest.raises(ValueError):
+            SmartsheetDataFrameClient().headers()
+
+    def test_base_url_trailing_slash(self):
+        client = SmartsheetDataFrameClient(base_url="https://api.smartsheet.eu/2.0/")
+
+        assert client.base_url == "https://api.smartsheet.eu/2.0"
+
+    def test_compressed_responses_accepted(self):
+        client = SmartsheetDataFrameClient()
+
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+
+    def test_json_decoder(self):
+        decoder = Mock(return_value=MOCK_SHEET)
+        client = SmartsheetDataFrameClient(token="fake_token", json_decoder=decoder)
+        client.session = Mock()
+        client.session.get.return_value = _mock_response(MOCK_SHEET)
+
+        df = get_sheet_as_df(sheet_id=1, client=client)
+
+        decoder.assert_called_once_with(json.dumps(MOCK_SHEET).encode())
+        assert df["Column1"].tolist() == ["Value1"]
+
+    def test_context_manager_closes_session(self):
+        with SmartsheetDataFrameClient() as client:
+            client.session = Mock()
+
+        client.session.close.assert_called_once()
+
+    def test_default_client_is_shared(self):
+        assert get_default_client() is get_default_client()
+
+
+class TestGetFromRequestWithClient:
+
+    def test_uses_client_session(self):
+        client = SmartsheetDataFrameClient(token="client_token", timeout=5.0,
+                                           base_url="https://api.smartsheet.eu/2.0")
+        client.session = Mock()
+        client.session.get.return_value = _mock_response(MOCK_SHEET)
+
+        assert _get_from_request("call_token", 12345, "sheet", client=client) == MOCK_SHEET
+
+        client.session.get.assert_called_once_with(
+            "https://api.smartsheet.eu/2.0/sheets/12345?include=objectValue&level=1",
+            headers={"Authorization": "Bearer call_token"},
+            timeout=5.0,
+            stream=False,
+        )
+
+    @patch("smartsheet_dataframe.smartsheet_dataframe.get_default_client")
+    def test_uses_default_client(self, mock_get_default_client):
+        default_client = SmartsheetDataFrameClient()
+        default_client.session = Mock()
+        default_client.session.get.return_value = _mock_response(MOCK_SHEET)
+        mock_get_default_client.return_value = default_client
+
+        _get_from_request("fake_token", 12345, "report")
+
+        default_client.session.get.assert_called_once()
+
+
+class TestEntryPointsWithClient:
+
+    def test_get_sheet_as_df_uses_client_token(self):
+        client = SmartsheetDataFrameClient(token="client_token")
+        client.session = Mock()
+        client.session.get.return_value = _mock_response(MOCK_SHEET)
+
+        df = get_sheet_as_df(sheet_id=12345, client=client)
+
+        assert isinstance(df, pd.DataFrame)
+        assert df.loc[0, "Column1"] == "Value1"
+        assert client.session.get.call_args.kwargs["headers"] == {"Authorization": "Bearer client_token"}
+
+    def test_get_as_df_uses_client_token(self):
+        client = SmartsheetDataFrameClient(token="client_token")
+        client.session = Mock()
+        client.session.get.return_value = _mock_response(MOCK_SHEET)
+
+        df = get_as_df(type_="report", id_=12345, client=client)
+
+        assert df.loc[0, "Column2"] == "Value2"
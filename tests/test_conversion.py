@@ -0,0 +1,286 @@
+# Standard Imports
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# 3rd-Party Imports
+import pandas as pd
+import pytest
+
+# Local Imports
+from smartsheet_dataframe.conversion import (
+    ColumnBuilder,
+    ConversionOptions,
+    convert_rows,
+    stream_into,
+)
+from smartsheet_dataframe.smartsheet_dataframe import (
+    _convert,
+    _to_dataframe,
+)
+from smartsheet_dataframe.testing import generate_sheet
+
+MOCK_SHEET = {
+    "id": 12345,
+    "totalRowCount": 3,
+    "columns": [{"title": "Column1"}, {"title": "Column2"}],
+    "rows": [
+        {"id": 1, "cells": [{"value": "Value1"}, {"value": 2.5}]},
+        {"id": 2, "parentId": 1, "cells": [{"value": "Value3"}, {}]},
+        {"id": 3, "cells": [{"objectValue": {"objectType": "MULTI_CONTACT",
+                                             "values": [{"email": "a@example.com"}, {"email": "b@example.com"}]}},
+                            {"value": 4}]},
+    ]
+}
+
+
+class TestColumnBuilder:
+
+    def test_to_dataframe(self):
+        builder = ColumnBuilder()
+        builder.add_rows(MOCK_SHEET["rows"])
+
+        df = builder.to_dataframe(MOCK_SHEET["columns"])
+
+        assert list(df.columns) == ["row_id", "parent_id", "Column1", "Column2"]
+        assert df["row_id"].dtype == "Int64"
+        assert df["parent_id"].dtype == "Int64"
+        assert df["parent_id"].isna().tolist() == [True, False, True]
+        assert df["Column2"].dtype == "float64"
+        assert pd.isna(df.loc[1, "Column2"])
+        assert df.loc[2, "Column1"] == "a@example.com, b@example.com"
+
+    def test_untyped(self):
+        builder = ColumnBuilder(ConversionOptions(typed=False))
+        builder.add_rows(MOCK_SHEET["rows"])
+
+        df = builder.to_dataframe(MOCK_SHEET["columns"])
+
+        assert df["parent_id"].tolist() == ["", 1, ""]
+        assert df["Column2"].tolist() == [2.5, "", 4]
+
+    def test_short_rows_are_padded(self):
+        builder = ColumnBuilder(ConversionOptions(include_row_id=False, include_parent_id=False))
+        builder.add_row({"id": 1, "cells": [{"value": 1}]})
+        builder.add_row({"id": 2, "cells": [{"value": 2}, {"value": "b"}]})
+
+        df = builder.to_dataframe([{"title": "a"}, {"title": "b"}, {"title": "c"}])
+
+        assert df["a"].tolist() == [1, 2]
+        assert df["b"].isna().tolist() == [True, False]
+        assert df["c"].isna().all()
+
+    def test_more_cells_than_columns(self):
+        builder = ColumnBuilder()
+        builder.add_row({"id": 1, "cells": [{"value": 1}, {"value": 2}]})
+
+        with pytest.raises(ValueError):
+            builder.to_dataframe([{"title": "a"}])
+        with pytest.raises(ValueError):
+            builder.build([{"title": "a"}])
+
+    def test_duplicate_titles(self):
+        builder = ColumnBuilder(ConversionOptions(include_row_id=False, include_parent_id=False))
+        builder.add_row({"id": 1, "cells": [{"value": 1}, {"value": 2}]})
+
+        df = builder.to_dataframe([{"title": "a"}, {"title": "a"}])
+
+        assert df.iloc[0].tolist() == [1, 2]
+
+    def test_empty(self):
+        df = ColumnBuilder().to_dataframe([{"title": "Column1"}])
+
+        assert df.empty
+        assert list(df.columns) == ["row_id", "parent_id", "Column1"]
+
+
+class TestTypedColumns:
+
+    def convert(self, column_type, values):
+        columns = [{"title": "a", "type": column_type}]
+        rows = [{"id": i, "cells": [{} if value is None else {"value": value}]} for i, value in enumerate(values)]
+        return _to_dataframe({"columns": columns, "rows": rows}, include_row_id=False, include_parent_id=False)["a"]
+
+    def test_text_number_integers(self):
+        column = self.convert("TEXT_NUMBER", [1, None, 3])
+
+        assert column.dtype == "Int64"
+        assert column.isna().tolist() == [False, True, False]
+
+    def test_text_number_with_text_is_not_numeric(self):
+        column = self.convert("TEXT_NUMBER", [1, "two"])
+
+        assert column.tolist() == [1, "two"]
+
+    def test_date(self):
+        column = self.convert("DATE", ["2023-01-05", None])
+
+        assert str(column.dtype).startswith("datetime64")
+        assert column[0] == pd.Timestamp("2023-01-05")
+        assert pd.isna(column[1])
+
+    def test_datetime_is_utc(self):
+        column = self.convert("DATETIME", ["2021-02-11T15:02:49Z"])
+
+        assert column[0] == pd.Timestamp("2021-02-11T15:02:49Z")
+        assert str(column.dt.tz) == "UTC"
+
+    def test_invalid_date_is_left_as_is(self):
+        column = self.convert("DATE", ["2023-01-05", "next week"])
+
+        assert column.tolist() == ["2023-01-05", "next week"]
+
+    def test_checkbox(self):
+        column = self.convert("CHECKBOX", [True, None, False])
+
+        assert column.dtype == bool
+        assert column.tolist() == [True, False, False]
+
+    @pytest.mark.parametrize("column_type, dtype", [
+        ("TEXT_NUMBER", "float64"),
+        ("DATE", "datetime64"),
+        ("DATETIME", "datetime64"),
+        ("CHECKBOX", "bool"),
+    ])
+    def test_empty_column_is_typed(self, column_type, dtype):
+        column = self.convert(column_type, [None, None])
+
+        assert str(column.dtype).startswith(dtype)
+        if column_type == "CHECKBOX":
+            assert column.tolist() == [False, False]
+        else:
+            assert column.isna().all()
+        if column_type == "DATETIME":
+            assert str(column.dt.tz) == "UTC"
+
+    def test_picklist_is_inferred(self):
+        column = self.convert("PICKLIST", ["1", "2"])
+
+        assert column.tolist() == ["1", "2"]
+
+
+class TestCategoricalColumns:
+
+    def convert(self, column, values):
+        rows = [{"id": i, "cells": [{} if value is None else {"value": value}]} for i, value in enumerate(values)]
+        builder = ColumnBuilder(ConversionOptions(include_row_id=False, include_parent_id=False, categorical=True))
+        builder.add_rows(rows)
+        return builder.to_dataframe([{"title": "a", **column}])["a"]
+
+    def test_picklist_uses_options(self):
+        column = self.convert({"type": "PICKLIST", "options": ["Low", "High"]}, ["High", None, "Other"])
+
+        assert column.dtype == "category"
+        assert list(column.cat.categories) == ["Low", "High", "Other"]
+        assert column.isna().tolist() == [False, True, False]
+
+    def test_contact_list(self):
+        column = self.convert({"type": "CONTACT_LIST"}, ["a@example.com", "b@example.com"])
+
+        assert column.dtype == "category"
+
+    def test_low_cardinality_text(self):
+        column = self.convert({"type": "TEXT_NUMBER"}, ["Open", "Open", "Closed", "Open"])
+
+        assert column.dtype == "category"
+        assert column.tolist() == ["Open", "Open", "Closed", "Open"]
+
+    def test_high_cardinality_text(self):
+        column = self.convert({"type": "TEXT_NUMBER"}, ["a", "b", "c"])
+
+        assert column.dtype != "category"
+
+    def test_numbers_are_not_categorical(self):
+        column = self.convert({"type": "PICKLIST", "options": ["1", "2"]}, [1, 2, 1])
+
+        assert column.dtype != "category"
+
+    def test_repeated_values_are_interned(self):
+        builder = ColumnBuilder(ConversionOptions(categorical=True))
+        builder.add_row({"id": 1, "cells": [{"value": "".join(["Op", "en"])}]})
+        builder.add_row({"id": 2, "cells": [{"value": "".join(["Op", "en"])}]})
+
+        assert builder.buffers[0][0] is builder.buffers[0][1]
+
+
+class TestStreamInto:
+
+    def test_matches_decoded_conversion(self):
+        builder = ColumnBuilder()
+
+        columns, fields = stream_into(io.BytesIO(json.dumps(MOCK_SHEET).encode()), builder)
+
+        assert fields == {"id": 12345, "totalRowCount": 3}
+        pd.testing.assert_frame_equal(builder.to_dataframe(columns), _to_dataframe(MOCK_SHEET))
+
+    def test_rows_before_columns(self):
+        payload = {"rows": MOCK_SHEET["rows"], "columns": MOCK_SHEET["columns"]}
+        builder = ColumnBuilder()
+
+        columns, _ = stream_into(io.BytesIO(json.dumps(payload).encode()), builder)
+
+        pd.testing.assert_frame_equal(builder.to_dataframe(columns), _to_dataframe(MOCK_SHEET))
+
+
+class TestParallelConversion:
+
+    @pytest.fixture(autouse=True)
+    def small_objects(self):
+        with patch("smartsheet_dataframe.conversion.PARALLEL_CONVERT_MIN_ROWS", 10):
+            yield
+
+    @pytest.fixture
+    def threads(self):
+        with patch("smartsheet_dataframe.conversion._gil_enabled", return_value=False):
+            yield
+
+    @pytest.mark.parametrize("options", [
+        ConversionOptions(),
+        ConversionOptions(typed=False),
+        ConversionOptions(hierarchy=True),
+        ConversionOptions(categorical=True),
+    ])
+    def test_matches_serial_conversion(self, threads, options):
+        sheet = generate_sheet(rows=100, columns=12, max_depth=3, seed=2)
+
+        parallel = _convert(sheet, options._replace(workers=3))
+
+        pd.testing.assert_frame_equal(parallel, _convert(sheet, options))
+
+    def test_short_rows_in_later_chunks_are_padded(self, threads):
+        rows = [{"id": row_id, "cells": [{"value": row_id}] * (1 if row_id < 15 else 3)} for row_id in range(30)]
+        columns = [{"title": "a"}, {"title": "b"}, {"title": "c"}]
+
+        builder = convert_rows(rows, ConversionOptions(workers=3))
+
+        assert builder.row_count == 30
+        assert [len(buffer) for buffer in builder.buffers] == [30, 30, 30]
+        pd.testing.assert_frame_equal(builder.build(columns), _convert({"columns": columns, "rows": rows},
+                                                                       ConversionOptions()))
+
+    def test_shared_pool_is_used(self, threads):
+        sheet = generate_sheet(rows=40, columns=5, seed=3)
+
+        with patch("smartsheet_dataframe.conversion._conversion_pool",
+                   return_value=ThreadPoolExecutor(2)) as mock_pool:
+            parallel = _convert(sheet, ConversionOptions(workers=2))
+
+        mock_pool.assert_called_once_with(2)
+        pd.testing.assert_frame_equal(parallel, _convert(sheet, ConversionOptions()))
+
+    def test_gil_interpreter_converts_serially(self):
+        sheet = generate_sheet(rows=40, columns=5, seed=3)
+
+        with patch("smartsheet_dataframe.conversion._gil_enabled", return_value=True), \
+                patch("smartsheet_dataframe.conversion._conversion_pool") as mock_pool, \
+                pytest.warns(UserWarning, match="without the GIL"):
+            convert_rows(sheet["rows"], ConversionOptions(workers=4))
+
+        mock_pool.assert_not_called()
+
+    def test_small_objects_are_converted_serially(self, threads):
+        with patch("smartsheet_dataframe.conversion._conversion_pool") as mock_pool:
+            convert_rows(MOCK_SHEET["rows"], ConversionOptions(workers=4))
+
+        mock_pool.assert_not_called()
@@ -0,0 +1,98 @@
+# Standard Imports
+import gc
+import json
+import sys
+from unittest.mock import patch
+
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from smartsheet_dataframe.decoders import (
+    decode_json,
+    get_json_decoder,
+)
+
+BODY = json.dumps({"rows": [{"id": 1, "cells": [{"value": "Value1"}, {"value": 2.5}]}]}).encode()
+
+
+class TestGetJsonDecoder:
+
+    @pytest.mark.parametrize("name", ["orjson", "msgspec", "json"])
+    def test_decoders_agree(self, name):
+        if name != "json":
+            pytest.importorskip(name)
+
+        assert get_json_decoder(name)(BODY) == json.loads(BODY)
+
+    def test_fastest_installed_is_default(self):
+        orjson = pytest.importorskip("orjson")
+
+        assert get_json_decoder() is orjson.loads
+
+    def test_falls_back_to_stdlib(self):
+        with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+            assert get_json_decoder() is json.loads
+
+    def test_missing_library(self):
+        with patch.dict(sys.modules, {"msgspec": None}):
+            with pytest.raises(ImportError, match="fast-json"):
+                get_json_decoder("msgspec")
+
+    def test_function(self):
+        def decoder(body):
+            return {}
+
+        assert get_json_decoder(decoder) is decoder
+
+    def test_invalid_name(self):
+        with pytest.raises(ValueError):
+            get_json_decoder("yaml")
+
+
+class TestDecodeJson:
+
+    def test_garbage_collector_left_alone_by_default(self):
+        def decoder(body):
+            assert gc.isenabled()
+            return json.loads(body)
+
+        assert decode_json(decoder, BODY) == json.loads(BODY)
+
+    def test_garbage_collector_paused_and_restored(self):
+        def decoder(body):
+            assert not gc.isenabled()
+            return json.loads(body)
+
+        assert decode_json(decoder, BODY, pause_gc=True) == json.loads(BODY)
+        assert gc.isenabled()
+
+    def test_garbage_collector_restored_on_error(self):
+        with pytest.raises(ValueError):
+            decode_json(json.loads, b"not json", pause_gc=True)
+
+        assert gc.isenabled()
+
+    def test_nested_decodes_share_one_pause(self):
+        def inner(body):
+            assert not gc.isenabled()
+            return json.loads(body)
+
+        def outer(body):
+            decode_json(inner, body, pause_gc=True)
+            # The inner decode ending does not enable the collector while the outer one runs
+            assert not gc.isenabled()
+            return json.loads(body)
+
+        decode_json(outer, BODY, pause_gc=True)
+
+        assert gc.isenabled()
+
+    def test_disabled_garbage_collector_stays_disabled(self):
+        gc.disable()
+        try:
+            decode_json(json.loads, BODY, pause_gc=True)
+
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
@@ -0,0 +1,130 @@
+# Standard Imports
+import json
+from unittest.mock import Mock
+from urllib.parse import urlparse
+
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from smartsheet_dataframe import (
+    export_to_parquet,
+)
+from smartsheet_dataframe.cli import main
+from smartsheet_dataframe.client import SmartsheetDataFrameClient
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _sheet(value):
+    return {"columns": [{"title": "Column1", "type": "TEXT_NUMBER"}],
+            "rows": [{"id": 1, "cells": [{"value": value}]}, {"id": 2, "cells": [{"value": value + 1}]}]}
+
+
+class FakeApi:
+    """Answers the workspace, folder, sheet and report requests of an export."""
+
+    def __init__(self):
+        self.versions = {10: 1, 11: 1}
+        self.failing = set()
+        self.paths = []
+
+    def get(self, url, **kwargs):
+        path = urlparse(url).path.split("/2.0/")[1]
+        self.paths.append(path)
+        parts = path.split("/")
+        response = Mock()
+        response.status_code = 200
+        if parts[0] == "workspaces":
+            payload = {"sheets": [{"id": 10, "name": "Sheet A"}],
+                       "reports": [{"id": 20, "name": "Report"}],
+                       "folders": [{"id": 30, "name": "Folder"}]}
+        elif parts[0] == "folders":
+            payload = {"sheets": [{"id": 11, "name": "Sheet B"}]}
+        elif parts[-1] == "version":
+            payload = {"version": self.versions[int(parts[1])]}
+        elif parts[0] == "sheets" and int(parts[1]) in self.failing:
+            response.status_code = 404
+            payload = {"errorCode": 1006}
+        elif parts[0] == "sheets":
+            payload = _sheet(int(parts[1]))
+        else:
+            payload = {**_sheet(int(parts[1])), "totalRowCount": 2}
+        response.content = json.dumps(payload).encode()
+        response.json.return_value = payload
+        response.text = response.content.decode()
+        return response
+
+    def client(self):
+        client = SmartsheetDataFrameClient(token="fake_token")
+        client.session = Mock()
+        client.session.get.side_effect = self.get
+        return client
+
+
+class TestExportToParquet:
+
+    def test_workspace(self, tmp_path):
+        results = export_to_parquet(tmp_path, workspace_id=1, client=FakeApi().client())
+
+        assert [(result.type_, result.id_, result.status) for result in results] == [
+            ("SHEET", 10, "exported"), ("REPORT", 20, "exported"), ("SHEET", 11, "exported")]
+        assert pq.read_table(tmp_path / "sheet" / "10.parquet").column("Column1").to_pylist() == [10, 11]
+        assert pq.read_table(tmp_path / "report" / "20.parquet").num_rows == 2
+        manifest = json.loads((tmp_path / "manifest.json").read_text())["objects"]
+        assert manifest["sheet-11"]["version"] == 1
+        assert manifest["sheet-11"]["path"] == "sheet/11.parquet"
+        assert manifest["report-20"]["version"] is None
+
+    def test_unchanged_sheets_skipped(self, tmp_path):
+        api = FakeApi()
+        export_to_parquet(tmp_path, workspace_id=1, client=api.client())
+        api.versions[11] = 2
+        api.paths.clear()
+
+        results = export_to_parquet(tmp_path, workspace_id=1, client=api.client())
+
+        assert [result.status for result in results] == ["skipped", "exported", "exported"]
+        assert "sheets/10" not in api.paths
+        assert json.loads((tmp_path / "manifest.json").read_text())["objects"]["sheet-11"]["version"] == 2
+
+    def test_failed_object_retried_next_time(self, tmp_path):
+        api = FakeApi()
+        api.failing.add(11)
+
+        with pytest.warns(UserWarning):
+            results = export_to_parquet(tmp_path, folder_id=30, client=api.client())
+
+        assert results[0].status == "failed"
+        assert not (tmp_path / "manifest.json").exists()
+
+        api.failing.clear()
+        assert export_to_parquet(tmp_path, folder_id=30, client=api.client())[0].status == "exported"
+
+    def test_sheets_only(self, tmp_path):
+        results = export_to_parquet(tmp_path, workspace_id=1, client=FakeApi().client(), reports=False)
+
+        assert [result.id_ for result in results] == [10, 11]
+
+    def test_workspace_or_folder_required(self, tmp_path):
+        with pytest.raises(ValueError):
+            export_to_parquet(tmp_path, token="fake_token")
+        with pytest.raises(ValueError):
+            export_to_parquet(tmp_path, workspace_id=1, folder_id=2, token="fake_token")
+
+
+class TestCli:
+
+    def test_export(self, tmp_path, monkeypatch, capsys):
+        api = FakeApi()
+        monkeypatch.setenv("SMARTSHEET_ACCESS_TOKEN", "fake_token")
+        monkeypatch.setattr("smartsheet_dataframe.cli.SmartsheetDataFrameClient", lambda token: api.client())
+
+        assert main(["export", "--workspace", "1", "--out", str(tmp_path)]) == 0
+        assert "Exported 3, skipped 0 unchanged, failed 0 of 3 objects" in capsys.readouterr().out
+        assert (tmp_path / "sheet" / "11.parquet").exists()
+
+    def test_missing_token(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("SMARTSHEET_ACCESS_TOKEN", raising=False)
+
+        assert main(["export", "--folder", "1", "--out", str(tmp_path)]) == 2
@@ -0,0 +1,160 @@
+# Standard Imports
+import subprocess
+import sys
+import time
+
+# 3rd-Party Imports
+import pandas as pd
+import pytest
+import requests
+
+# Local Imports
+from smartsheet_dataframe import (
+    DiskCache,
+    FetchStats,
+    RetryPolicy,
+    SmartsheetDataFrameClient,
+    get_report_as_df,
+    get_sheet_as_df,
+    iter_sheet_chunks,
+)
+from smartsheet_dataframe.conversion import ConversionOptions
+from smartsheet_dataframe.smartsheet_dataframe import _convert
+from smartsheet_dataframe.testing import (
+    generate_report,
+    generate_sheet,
+)
+from smartsheet_dataframe.testing.fake_server import FakeSmartsheetServer
+
+
+@pytest.fixture
+def fast_retries(fake_smartsheet_client):
+    fake_smartsheet_client.retries = 10
+    fake_smartsheet_client.retry_policy = RetryPolicy(base=0.01, max_delay=0.02)
+    return fake_smartsheet_client
+
+
+class TestFakeSmartsheetServer:
+
+    def test_sheet(self, fake_smartsheet, fake_smartsheet_client):
+        sheet = generate_sheet(rows=200, columns=8, max_depth=2)
+        sheet_id = fake_smartsheet.add_sheet(sheet)
+
+        df = get_sheet_as_df(sheet_id=sheet_id, client=fake_smartsheet_client)
+
+        pd.testing.assert_frame_equal(df, _convert(sheet, ConversionOptions()))
+
+    def test_report_pages(self, fake_smartsheet, fake_smartsheet_client):
+        report = generate_report(rows=250, columns=4)
+        report_id = fake_smartsheet.add_report(report)
+
+        df = get_report_as_df(report_id=report_id, client=fake_smartsheet_client, page_size=100)
+
+        pd.testing.assert_frame_equal(df, _convert(report, ConversionOptions()))
+        assert [status for _, _, status in fake_smartsheet.requests] == [200] * 3
+
+    def test_sheet_chunks(self, fake_smartsheet, fake_smartsheet_client):
+        sheet_id = fake_smartsheet.add_sheet(rows=250, columns=4)
+
+        chunks = list(iter_sheet_chunks(sheet_id=sheet_id, client=fake_smartsheet_client, chunk_rows=100))
+
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+
+    def test_version(self, fake_smartsheet, fake_smartsheet_client, tmp_path):
+        sheet_id = fake_smartsheet.add_sheet(rows=10, columns=4)
+        cache = DiskCache(tmp_path)
+
+        get_sheet_as_df(sheet_id=sheet_id, client=fake_smartsheet_client, cache_dir=cache)
+        get_sheet_as_df(sheet_id=sheet_id, client=fake_smartsheet_client, cache_dir=cache)
+        fake_smartsheet.touch(sheet_id)
+        get_sheet_as_df(sheet_id=sheet_id, client=fake_smartsheet_client, cache_dir=cache)
+
+        paths = [path.split("?")[0] for _, path, _ in fake_smartsheet.requests]
+        assert [path.endswith("/version") for path in paths] == [True, False, True, True, False]
+
+    def test_multi_contact_columns_follow_the_requested_level(self, fake_smartsheet, fake_smartsheet_client):
+        sheet_id = fake_smartsheet.add_sheet(rows=10, columns=2, column_types=["MULTI_CONTACT_LIST"], sparsity=0)
+        url = f"{fake_smartsheet.base_url}/sheets/{sheet_id}"
+        headers = {"Authorization": "Bearer fake-token"}
+
+        object_values = requests.get(f"{url}?include=objectValue&level=1", headers=headers).json()
+        text = requests.get(url, headers=headers).json()
+
+        # The first column is the primary column, which is always TEXT_NUMBER
+        assert object_values["columns"][1]["type"] == "MULTI_CONTACT_LIST"
+        assert "objectValue" in object_values["rows"][0]["cells"][1]
+        assert text["columns"][1]["type"] == "TEXT_NUMBER"
+        assert isinstance(text["rows"][0]["cells"][1]["value"], str)
+
+    def test_rate_limits_are_retried(self, fake_smartsheet, fast_retries):
+        sheet_id = fake_smartsheet.add_sheet(rows=10, columns=4)
+        fake_smartsheet.rate_limit_rate = 0.5
+        stats = FetchStats()
+
+        for _ in range(5):
+            get_sheet_as_df(sheet_id=sheet_id, client=fast_retries, stats=stats)
+
+        assert stats.retries == sum(status == 429 for _, _, status in fake_smartsheet.requests) > 0
+
+    def test_server_errors_are_retried(self, fake_smartsheet, fast_retries):
+        sheet_id = fake_smartsheet.add_sheet(rows=10, columns=4)
+        fake_smartsheet.error_rate = 0.5
+
+        for _ in range(5):
+            get_sheet_as_df(sheet_id=sheet_id, client=fast_retries)
+
+        assert {status for _, _, status in fake_smartsheet.requests} > {200}
+
+    def test_same_seed_same_faults(self):
+        statuses = []
+        for _ in range(2):
+            with FakeSmartsheetServer(error_rate=0.5, seed=7) as server:
+                for _ in range(20):
+                    requests.get(f"{server.base_url}/sheets/1", headers={"Authorization": "Bearer token"})
+                statuses.append([status for _, _, status in server.requests])
+
+        assert statuses[0] == statuses[1]
+        assert set(statuses[0]) > {404}
+
+    def test_retry_after(self, fake_smartsheet, fake_smartsheet_client):
+        fake_smartsheet.rate_limit_rate = 1
+        fake_smartsheet.retry_after = 2
+
+        response = requests.get(f"{fake_smartsheet.base_url}/sheets/1", headers={"Authorization": "Bearer token"})
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+        assert response.json()["errorCode"] == 4004
+
+    def test_latency_and_slow_bodies(self, fake_smartsheet, fake_smartsheet_client):
+        sheet_id = fake_smartsheet.add_sheet(rows=200, columns=10)
+        fake_smartsheet.latency = 0.1
+        fake_smartsheet.body_bytes_per_second = 10 ** 6
+        stats = FetchStats()
+
+        get_sheet_as_df(sheet_id=sheet_id, client=fake_smartsheet_client, stats=stats)
+
+        assert stats.network_seconds >= 0.1 + stats.response_bytes / 10 ** 6 * 0.9
+
+    def test_errors(self, fake_smartsheet):
+        base_url = fake_smartsheet.base_url
+
+        assert requests.get(f"{base_url}/sheets/1").status_code == 401
+        assert requests.get(f"{base_url}/sheets/1", headers={"Authorization": "Bearer token"}).status_code == 404
+        assert requests.get(f"{base_url}/unknown", headers={"Authorization": "Bearer token"}).status_code == 404
+
+
+def test_command_line():
+    process = subprocess.Popen([sys.executable, "-m", "smartsheet_dataframe.testing.fake_server",
+                                "--port", "0", "--sheets", "2", "--rows", "20", "--columns", "3"],
+                               stdout=subprocess.PIPE, text=True)
+    try:
+        base_url = process.stdout.readline().strip()
+        sheet_ids = process.stdout.readline()
+        with SmartsheetDataFrameClient(token="fake-token", base_url=base_url) as client:
+            df = get_sheet_as_df(sheet_id=int(sheet_ids.split("[")[1].split(",")[0]), client=client)
+    finally:
+        process.terminate()
+        process.wait(10)
+
+    assert df.shape == (20, 5)
@@ -0,0 +1,94 @@
+# 3rd-Party Imports
+import pandas as pd
+import pytest
+
+# Local Imports
+from smartsheet_dataframe.conversion import ConversionOptions
+from smartsheet_dataframe.hierarchy import (
+    adjacency,
+    hierarchy_index,
+    rollup,
+    subtree,
+)
+from smartsheet_dataframe.smartsheet_dataframe import _convert
+
+# 1
+# ├── 2
+# │   └── 3
+# └── 4
+# 5
+MOCK_SHEET = {
+    "columns": [{"title": "Task", "type": "TEXT_NUMBER"}, {"title": "Hours", "type": "TEXT_NUMBER"}],
+    "rows": [
+        {"id": 1, "cells": [{"value": "Project"}, {"value": 1}]},
+        {"id": 2, "parentId": 1, "cells": [{"value": "Phase"}, {"value": 2}]},
+        {"id": 3, "parentId": 2, "cells": [{"value": "Task"}, {"value": 3}]},
+        {"id": 4, "parentId": 1, "cells": [{"value": "Phase"}, {"value": 4}]},
+        {"id": 5, "cells": [{"value": "Other"}, {"value": 5}]},
+    ]
+}
+
+
+@pytest.fixture
+def df():
+    return _convert(MOCK_SHEET, ConversionOptions(hierarchy=True))
+
+
+class TestHierarchyColumns:
+
+    def test_columns(self, df):
+        assert list(df.columns) == ["row_id", "parent_id", "depth", "root_id", "sibling_index", "path",
+                                    "Task", "Hours"]
+        assert df["depth"].tolist() == [0, 1, 2, 1, 0]
+        assert df["root_id"].tolist() == [1, 1, 1, 1, 5]
+        assert df["sibling_index"].tolist() == [0, 0, 0, 1, 1]
+        assert df["path"].tolist() == [(1,), (1, 2), (1, 2, 3), (1, 4), (5,)]
+
+    def test_missing_parent_is_root(self):
+        partial = {"columns": MOCK_SHEET["columns"], "rows": MOCK_SHEET["rows"][2:4]}
+
+        df = _convert(partial, ConversionOptions(hierarchy=True))
+
+        assert df["depth"].tolist() == [0, 0]
+        assert df["parent_id"].tolist() == [2, 1]
+
+    def test_disabled_by_default(self):
+        assert "depth" not in _convert(MOCK_SHEET, ConversionOptions()).columns
+
+
+class TestHelpers:
+
+    def test_hierarchy_index(self, df):
+        index = hierarchy_index(df)
+
+        assert index.names == ["level_0", "level_1", "level_2"]
+        assert df.set_axis(index).loc[1]["Hours"].tolist() == [1, 2, 3, 4]
+
+    def test_adjacency(self, df):
+        assert adjacency(df) == {1: [2, 4], 2: [3]}
+
+    def test_subtree(self, df):
+        assert subtree(df, 2)["row_id"].tolist() == [2, 3]
+        assert subtree(df, 1, include_self=False)["row_id"].tolist() == [2, 3, 4]
+
+    def test_subtree_indexed_by_row_id(self, df):
+        assert subtree(df.set_index("row_id"), 4).index.tolist() == [4]
+
+    def test_subtree_unknown_row(self, df):
+        with pytest.raises(KeyError):
+            subtree(df, 99)
+
+    def test_rollup(self, df):
+        totals = rollup(df, "Hours")
+
+        assert totals.to_dict() == {1: 10, 2: 5, 3: 3, 4: 4, 5: 5}
+
+    def test_rollup_many_columns(self, df):
+        totals = rollup(df, ["Hours"], "max")
+
+        assert isinstance(totals, pd.DataFrame)
+        assert totals["Hours"].tolist() == [4, 3, 3, 4, 5]
+
+    def test_requires_hierarchy_columns(self):
+        with pytest.raises(ValueError):
+            rollup(_convert(MOCK_SHEET, ConversionOptions()), "Hours")
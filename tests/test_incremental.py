@@ -0,0 +1,134 @@
+# Standard Imports
+from urllib.parse import (
+    parse_qs,
+    urlparse,
+)
+
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from smartsheet_dataframe import (
+    IncrementalSheet,
+)
+
+COLUMNS = [{"id": 11, "title": "Column1"}, {"id": 12, "title": "Column2"}]
+
+
+def _row(id_, value1, value2, parent_id=None):
+    row = {"id": id_, "cells": [{"value": value1}, {"value": value2}]}
+    if parent_id:
+        row["parentId"] = parent_id
+    return row
+
+
+class FakeSheet:
+    """Serves a mutable list of rows, honouring rowsModifiedSince and columnIds."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.modified = set()
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+        query = parse_qs(urlparse(url).query)
+
+        # Row numbers are positions in the whole sheet, as sent by the API
+        rows = [{**row, "rowNumber": number} for number, row in enumerate(self.rows, start=1)]
+        if "rowsModifiedSince" in query:
+            rows = [row for row in rows if row["id"] in self.modified]
+        if "columnIds" in query:
+            rows = [{"id": row["id"], "cells": row["cells"][:1]} for row in rows]
+
+        return {"columns": COLUMNS, "totalRowCount": len(self.rows), "rows": rows}
+
+
+@pytest.fixture
+def sheet():
+    return FakeSheet([_row(1, "a", 1), _row(2, "b", 2), _row(3, "c", 3, parent_id=1)])
+
+
+@pytest.fixture
+def incremental(sheet, mock_client):
+    return IncrementalSheet(12345, client=mock_client(sheet.get))
+
+
+class TestIncrementalSheet:
+
+    def test_first_refresh_loads_full_sheet(self, incremental, sheet):
+        df = incremental.refresh()
+
+        assert df.index.tolist() == [1, 2, 3]
+        assert df.loc[2, "Column1"] == "b"
+        assert incremental.last_sync is not None
+        assert "rowsModifiedSince" not in sheet.urls[0]
+
+    def test_upserts_modified_and_new_rows(self, incremental, sheet):
+        incremental.refresh()
+        sheet.rows[1] = _row(2, "B", 20)
+        sheet.rows.append(_row(4, "d", 4))
+        sheet.modified = {2, 4}
+
+        df = incremental.refresh()
+
+        assert "rowsModifiedSince" in sheet.urls[-2]
+        assert "columnIds=11" in sheet.urls[-1]
+        assert df.index.tolist() == [1, 2, 3, 4]
+        assert df.loc[2, "Column1"] == "B"
+        assert df.loc[4, "Column2"] == 4
+        assert df.loc[3, "parent_id"] == 1
+
+    def test_new_rows_in_sheet_order(self, incremental, sheet):
+        incremental.refresh()
+        sheet.rows.insert(1, _row(4, "d", 4))
+        sheet.modified = {4}
+
+        df = incremental.refresh()
+
+        assert df.index.tolist() == [1, 4, 2, 3]
+
+    def test_moved_rows_in_sheet_order(self, incremental, sheet):
+        incremental.refresh()
+        sheet.rows.insert(0, sheet.rows.pop(2))
+        sheet.rows[0] = _row(3, "c", 3)
+        sheet.modified = {3}
+
+        df = incremental.refresh()
+
+        assert df.index.tolist() == [3, 1, 2]
+        assert df.loc[3, "Column1"] == "c"
+        assert "columnIds=11" in sheet.urls[-1]
+
+    def test_modified_rows_keep_dtypes(self, incremental, sheet):
+        dtypes = incremental.refresh().dtypes
+        sheet.rows[1] = _row(2, "B", None)
+        sheet.modified = {2}
+
+        df = incremental.refresh()
+
+        assert df.dtypes.equals(dtypes)
+        assert df.index.tolist() == [1, 2, 3]
+        assert df.loc[1, "Column2"] == 1
+
+    def test_detects_deleted_rows(self, incremental, sheet):
+        incremental.refresh()
+        del sheet.rows[0]
+
+        df = incremental.refresh()
+
+        assert df.index.tolist() == [2, 3]
+        assert "columnIds=11" in sheet.urls[-1]
+        assert "include=objectValue" not in sheet.urls[-1]
+
+    def test_no_changes(self, incremental, sheet):
+        first = incremental.refresh().copy()
+
+        df = incremental.refresh()
+
+        assert df.equals(first)
+        assert len(sheet.urls) == 2
+
+    def test_requires_token(self):
+        with pytest.raises(ValueError):
+            IncrementalSheet(12345)
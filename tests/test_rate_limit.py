@@ -0,0 +1,136 @@
+# Standard Imports
+from email.utils import format_datetime
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from unittest.mock import patch
+
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from smartsheet_dataframe.rate_limit import (
+    FileRateLimiter,
+    RateLimiter,
+    RetryPolicy,
+    get_rate_limiter,
+    retry_after,
+)
+
+
+class TestRateLimiter:
+
+    def test_burst_does_not_wait(self):
+        limiter = RateLimiter(requests_per_minute=60, burst=3)
+
+        assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    @patch("smartsheet_dataframe.rate_limit.time.sleep")
+    def test_waits_when_empty(self, mock_sleep):
+        limiter = RateLimiter(requests_per_minute=60, burst=1)
+        limiter.acquire()
+
+        # Sleeping does not advance the clock, so refill by moving the last update back
+        def refill(delay):
+            limiter._updated -= delay
+
+        mock_sleep.side_effect = refill
+
+        assert limiter.acquire() == pytest.approx(1.0, abs=0.05)
+        mock_sleep.assert_called_once()
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_minute=0)
+        with pytest.raises(ValueError):
+            RateLimiter(burst=0)
+
+
+    def test_throttle_pauses_and_slows_down(self):
+        limiter = RateLimiter(requests_per_minute=60, burst=10)
+
+        limiter.throttle(30)
+
+        assert limiter.reserve() == pytest.approx(30 + 2, abs=0.05)
+        assert limiter.rate == pytest.approx(0.5)
+
+    def test_throttled_rate_recovers(self):
+        limiter = RateLimiter(requests_per_minute=60, burst=10)
+        limiter.throttle(0)
+
+        # Half the rate is recovered in 30 seconds
+        limiter._updated -= 30
+        limiter._paused_until -= 30
+        limiter.reserve()
+
+        assert limiter.rate == pytest.approx(1.0)
+
+    def test_throttle_keeps_a_minimum_rate(self):
+        limiter = RateLimiter(requests_per_minute=60, burst=10)
+
+        for _ in range(10):
+            limiter.throttle(0)
+
+        assert limiter.rate == pytest.approx(0.125)
+
+
+class TestFileRateLimiter:
+
+    def test_shared_between_instances(self, tmp_path):
+        first = FileRateLimiter(tmp_path / "bucket.json", requests_per_minute=60, burst=2)
+        second = FileRateLimiter(tmp_path / "bucket.json", requests_per_minute=60, burst=2)
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+        assert first.reserve() == pytest.approx(1.0, abs=0.05)
+
+    def test_throttle_is_shared(self, tmp_path):
+        first = FileRateLimiter(tmp_path / "bucket.json")
+        second = FileRateLimiter(tmp_path / "bucket.json")
+
+        first.throttle(20)
+
+        assert second.reserve() >= 20
+
+    def test_unreadable_file_starts_a_new_bucket(self, tmp_path):
+        (tmp_path / "bucket.json").write_text("not json")
+
+        assert FileRateLimiter(tmp_path / "bucket.json").reserve() == 0.0
+
+
+class TestRetryPolicy:
+
+    def test_exponential_backoff_with_jitter(self):
+        policy = RetryPolicy(base=2, max_delay=60)
+
+        for attempt, ceiling in [(0, 2), (1, 4), (3, 16), (10, 60)]:
+            delays = [policy.delay(attempt) for _ in range(50)]
+            assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
+            assert len(set(delays)) > 1
+
+    def test_retry_after_is_honoured(self):
+        assert 90 <= RetryPolicy(max_delay=60).delay(0, retry_after=90) <= 91
+
+
+class TestRetryAfter:
+
+    def test_seconds(self):
+        assert retry_after({"Retry-After": "12"}) == 12.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        assert retry_after({"Retry-After": format_datetime(when, usegmt=True)}) == pytest.approx(30, abs=2)
+
+    def test_missing_or_invalid(self):
+        assert retry_after({}) is None
+        assert retry_after({"Retry-After": "soon"}) is None
+
+
+class TestGetRateLimiter:
+
+    def test_shared_per_token(self):
+        assert get_rate_limiter("token_a") is get_rate_limiter("token_a")
+        assert get_rate_limiter("token_a") is not get_rate_limiter("token_b")
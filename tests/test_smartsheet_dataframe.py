@@ -16,9 +16,16 @@ from smartsheet_dataframe import (
     get_report_as_df,
     get_sheet_as_df,
     get_as_df,
+    get_many_as_df,
+    iter_report_chunks,
+    iter_sheet_chunks,
 )
+from smartsheet_dataframe.rate_limit import RetryPolicy
 from smartsheet_dataframe.smartsheet_dataframe import (
     _do_request,
+    _get_from_request,
+    _object_url,
+    _row_id_batches,
     _to_dataframe
 )
 
@@ -256,6 +263,366 @@ class TestGetAsDf:
             get_as_df(type_="test", token="test")
 
 
+class TestGetManyAsDf:
+
+    @patch('smartsheet_dataframe.smartsheet_dataframe._get_from_request')
+    def test_get_many_as_df(self, mock_get_from_request):
+        def get_from_request(token, id_, type_, client=None, **kwargs):
+            return {
+                "columns": [{"title": "Column1"}],
+                "rows": [{"id": id_, "cells": [{"value": f"{type_}-{id_}"}]}]
+            }
+
+        mock_get_from_request.side_effect = get_from_request
+
+        dfs = get_many_as_df([3, 1, ("report", 2)], token="fake_token", max_workers=2)
+
+        assert list(dfs) == [3, 1, 2]
+        assert dfs[3].loc[0, "Column1"] == "SHEET-3"
+        assert dfs[2].loc[0, "Column1"] == "report-2"
+
+    @patch('smartsheet_dataframe.smartsheet_dataframe._get_from_request')
+    def test_get_many_as_df_reports_errors_per_id(self, mock_get_from_request):
+        def get_from_request(token, id_, type_, client=None, **kwargs):
+            if id_ == 2:
+                raise RuntimeError("boom")
+            return {"columns": [{"title": "Column1"}], "rows": []}
+
+        mock_get_from_request.side_effect = get_from_request
+
+        dfs = get_many_as_df([1, 2], token="fake_token")
+
+        assert isinstance(dfs[1], pd.DataFrame)
+        assert isinstance(dfs[2], RuntimeError)
+
+    def test_get_many_as_df_without_token(self):
+        with pytest.raises(ValueError):
+            get_many_as_df([1])
+
+    def test_get_many_as_df_invalid_max_workers(self):
+        with pytest.raises(ValueError):
+            get_many_as_df([1], token="fake_token", max_workers=0)
+
+
+class TestGetReportPages:
+
+    @pytest.fixture
+    def pages_client(self, mock_client):
+        def make(total_row_count):
+            def page(url):
+                number = int(url.split("page=")[1].split("&")[0])
+                return {
+                    "columns": [{"title": "Column1"}],
+                    "totalRowCount": total_row_count,
+                    "rows": [{"id": number, "cells": [{"value": f"page-{number}"}]}],
+                }
+
+            return mock_client(page)
+
+        return make
+
+    def test_single_page(self, pages_client):
+        client = pages_client(total_row_count=2)
+
+        report = _get_from_request("fake_token", 12345, "report", client=client, page_size=2)
+
+        assert [row["id"] for row in report["rows"]] == [1]
+        client.session.get.assert_called_once()
+
+    def test_pages_joined_in_order(self, pages_client):
+        client = pages_client(total_row_count=9)
+
+        report = _get_from_request("fake_token", 12345, "report", client=client, page_size=2, max_workers=3)
+
+        assert [row["id"] for row in report["rows"]] == [1, 2, 3, 4, 5]
+        assert report["columns"] == [{"title": "Column1"}]
+        assert client.session.get.call_count == 5
+
+    def test_get_report_as_df(self, pages_client):
+        client = pages_client(total_row_count=3)
+
+        df = get_report_as_df(report_id=12345, client=client, page_size=2)
+
+        assert df["Column1"].tolist() == ["page-1", "page-2"]
+
+    def test_invalid_page_size(self, pages_client):
+        with pytest.raises(ValueError):
+            _get_from_request("fake_token", 12345, "report", client=pages_client(1), page_size=0)
+
+
+class TestIterChunks:
+
+    @pytest.fixture
+    def pages_client(self, mock_client):
+        def make(total_row_count, empty_from=None):
+            def page(url):
+                number = int(url.split("page=")[1].split("&")[0])
+                page_size = int(url.split("pageSize=")[1].split("&")[0])
+                first_row = (number - 1) * page_size
+                return {
+                    "columns": [{"title": "Column1", "type": "TEXT_NUMBER"}],
+                    "totalRowCount": total_row_count,
+                    "rows": [{"id": i, "cells": [{} if empty_from is not None and i >= empty_from else {"value": i}]}
+                             for i in range(first_row, min(first_row + page_size, total_row_count))],
+                }
+
+            return mock_client(page)
+
+        return make
+
+    def test_iter_sheet_chunks(self, pages_client):
+        client = pages_client(total_row_count=5)
+
+        chunks = list(iter_sheet_chunks(sheet_id=12345, chunk_rows=2, client=client))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert pd.concat(chunks)["Column1"].tolist() == [0, 1, 2, 3, 4]
+        assert pd.concat(chunks).index.tolist() == [0, 1, 2, 3, 4]
+        assert "include=objectValue" in client.session.get.call_args_list[0].args[0]
+
+    def test_iter_report_chunks(self, pages_client):
+        client = pages_client(total_row_count=4)
+
+        chunks = list(iter_report_chunks(report_id=12345, chunk_rows=2, client=client))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2]
+        assert client.session.get.call_count == 2
+        assert "/reports/12345" in client.session.get.call_args_list[0].args[0]
+
+    def test_chunks_keep_first_chunk_dtypes(self, pages_client):
+        client = pages_client(total_row_count=4, empty_from=2)
+
+        chunks = list(iter_sheet_chunks(sheet_id=12345, chunk_rows=2, client=client))
+
+        assert [chunk["Column1"].dtype for chunk in chunks] == ["Int64", "Int64"]
+        assert chunks[1]["Column1"].isna().all()
+
+    def test_no_request_until_iterated(self, pages_client):
+        client = pages_client(total_row_count=2)
+
+        chunks = iter_sheet_chunks(sheet_id=12345, client=client)
+
+        client.session.get.assert_not_called()
+        assert len(next(chunks)) == 2
+
+    def test_empty_sheet_yields_columns(self, pages_client):
+        chunks = list(iter_sheet_chunks(sheet_id=12345, client=pages_client(total_row_count=0)))
+
+        assert len(chunks) == 1
+        assert chunks[0].empty
+        assert "Column1" in chunks[0].columns
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            iter_sheet_chunks(sheet_id=12345)
+        with pytest.raises(ValueError):
+            iter_sheet_chunks(token="fake_token")
+        with pytest.raises(ValueError):
+            iter_sheet_chunks(token="fake_token", sheet_id=12345, chunk_rows=0)
+
+
+class TestStream:
+
+    def test_stream_sheet_matches_decoded(self, mock_client):
+        payload = {
+            "columns": [{"title": "Column1"}, {"title": "Column2"}],
+            "rows": [{"id": 1, "cells": [{"value": "Value1"}, {"value": 1.5}]},
+                     {"id": 2, "parentId": 1, "cells": [{"value": "Value3"}, {}]}]
+        }
+        client = mock_client(payload)
+
+        df = get_sheet_as_df(sheet_id=12345, client=client, stream=True)
+
+        pd.testing.assert_frame_equal(df, _to_dataframe(payload))
+        assert client.session.get.call_args.kwargs["stream"] is True
+
+    def test_stream_report_pages(self, mock_client):
+        def page(number):
+            return {"columns": [{"title": "Column1"}], "totalRowCount": 3,
+                    "rows": [{"id": number, "cells": [{"value": number}]}]}
+
+        pages = [page(1), page(2), page(3)]
+        client = mock_client(lambda url: pages.pop(0))
+
+        df = get_report_as_df(report_id=12345, client=client, page_size=1, stream=True)
+
+        assert df["Column1"].tolist() == [1, 2, 3]
+
+
+class TestColumns:
+
+    SCHEMA = [{"id": 11, "title": "Column1"}, {"id": 12, "title": "Column2"}, {"id": 13, "title": "Column3"}]
+
+    @pytest.fixture
+    def client(self, mock_client):
+        def get(url):
+            if "/columns" in url:
+                return {"data": self.SCHEMA}
+
+            column_ids = [int(i) for i in url.split("columnIds=")[1].split("&")[0].split(",")]
+            return {
+                "columns": [column for column in self.SCHEMA if column["id"] in column_ids],
+                "rows": [{"id": 1, "cells": [{"columnId": i, "value": i} for i in sorted(column_ids)]}],
+            }
+
+        return mock_client(get)
+
+    def test_sheet_columns_by_title(self, client):
+
+        df = get_sheet_as_df(sheet_id=12345, client=client, columns=["Column3", "Column1"])
+        get_sheet_as_df(sheet_id=12345, client=client, columns=["Column2"])
+
+        assert list(df.columns) == ["row_id", "parent_id", "Column1", "Column3"]
+        assert df["Column3"].tolist() == [13]
+        urls = [call.args[0] for call in client.session.get.call_args_list]
+        assert [url for url in urls if "/columns" in url] == ["https://api.smartsheet.com/2.0/sheets/12345/columns?includeAll=true&level=1"]
+        assert "columnIds=13,11" in urls[1]
+
+    def test_sheet_columns_by_id(self, client):
+
+        df = get_as_df("sheet", id_=12345, client=client, columns=[12])
+
+        assert list(df.columns) == ["row_id", "parent_id", "Column2"]
+        client.session.get.assert_called_once()
+
+    def test_unknown_title(self, client):
+        with pytest.raises(ValueError):
+            get_sheet_as_df(sheet_id=12345, client=client, columns=["Missing"])
+
+    def test_report_columns_are_projected(self):
+        report = {
+            "columns": [{"virtualId": 21, "title": "Column1"}, {"virtualId": 22, "title": "Column2"}],
+            "rows": [{"id": 1, "cells": [{"value": "a"}, {"value": "b"}]}],
+        }
+        report_obj = Mock()
+        report_obj.to_dict.return_value = report
+
+        df = get_report_as_df(report_obj=report_obj, columns=[22], include_row_id=False)
+
+        assert list(df.columns) == ["parent_id", "Column2"]
+        assert df["Column2"].tolist() == ["b"]
+
+
+class TestSchemaFirst:
+
+    TEXT_COLUMN = {"id": 11, "title": "Column1", "type": "TEXT_NUMBER"}
+    CONTACTS_COLUMN = {"id": 12, "title": "Column2", "type": "MULTI_CONTACT_LIST"}
+
+    @pytest.fixture
+    def schema_client(self, mock_client):
+        def make(schema):
+            def get(url):
+                if "/columns" in url:
+                    return {"data": schema}
+                return {"columns": schema, "rows": [{"id": 1, "cells": [{"value": "a"} for _ in schema]}]}
+
+            return mock_client(get, schema_first=True)
+
+        return make
+
+    @staticmethod
+    def _sheet_urls(client):
+        return [call.args[0] for call in client.session.get.call_args_list if "/columns" not in call.args[0]]
+
+    def test_object_values_are_left_out(self, schema_client):
+        client = schema_client([self.TEXT_COLUMN])
+
+        get_sheet_as_df(sheet_id=12345, client=client)
+        get_sheet_as_df(sheet_id=12345, client=client)
+
+        assert self._sheet_urls(client) == ["https://api.smartsheet.com/2.0/sheets/12345"] * 2
+        assert client.session.get.call_count == 3
+
+    def test_multi_contact_columns_need_object_values(self, schema_client):
+        client = schema_client([self.TEXT_COLUMN, self.CONTACTS_COLUMN])
+
+        get_sheet_as_df(sheet_id=12345, client=client)
+
+        assert "include=objectValue&level=1" in self._sheet_urls(client)[0]
+
+    def test_added_column_refreshes_schema(self, schema_client):
+        client = schema_client([self.TEXT_COLUMN, self.CONTACTS_COLUMN])
+        client.columns_cache[12345] = [self.TEXT_COLUMN]
+
+        get_sheet_as_df(sheet_id=12345, client=client)
+
+        urls = self._sheet_urls(client)
+        assert len(urls) == 2
+        assert "include=objectValue" not in urls[0]
+        assert "include=objectValue&level=1" in urls[1]
+        assert client.columns_cache[12345] == [self.TEXT_COLUMN, self.CONTACTS_COLUMN]
+
+    def test_chunks(self, schema_client):
+        client = schema_client([self.TEXT_COLUMN])
+
+        list(iter_sheet_chunks(sheet_id=12345, client=client, chunk_rows=10))
+
+        assert self._sheet_urls(client) == ["https://api.smartsheet.com/2.0/sheets/12345?page=1&pageSize=10"]
+
+    def test_disabled(self, schema_client):
+        client = schema_client([self.TEXT_COLUMN])
+        client.schema_first = False
+
+        get_sheet_as_df(sheet_id=12345, client=client)
+
+        client.session.get.assert_called_once()
+        assert "include=objectValue&level=1" in self._sheet_urls(client)[0]
+
+
+class TestRowFilters:
+
+    @pytest.fixture
+    def client(self, mock_client):
+        def get(url):
+            row_ids = url.split("rowIds=")[1].split("&")[0].split(",") if "rowIds=" in url else ["1"]
+            return {
+                "columns": [{"title": "Column1"}],
+                "rows": [{"id": int(row_id), "cells": [{"value": row_id}]} for row_id in row_ids],
+            }
+
+        return mock_client(get)
+
+    def test_row_id_batches(self):
+        assert _row_id_batches([1, 22, 333, 4], max_length=7) == [[1, 22], [333, 4]]
+
+    def test_row_ids_batched_and_joined_in_order(self, client):
+        row_ids = list(range(10 ** 15, 10 ** 15 + 600))
+
+        df = get_sheet_as_df(sheet_id=12345, client=client, row_ids=row_ids)
+
+        assert df["row_id"].tolist() == row_ids
+        assert client.session.get.call_count == 3
+        assert all(len(call.args[0]) < 5000 for call in client.session.get.call_args_list)
+
+    def test_filter_id(self, client):
+
+        get_as_df("sheet", id_=12345, client=client, filter_id=678)
+
+        assert "filterId=678&exclude=filteredOutRows" in client.session.get.call_args.args[0]
+
+    def test_report_row_ids(self, client):
+        with pytest.raises(ValueError):
+            get_as_df("report", id_=12345, client=client, row_ids=[1])
+
+    def test_empty_row_ids(self, client):
+        with pytest.raises(ValueError):
+            get_sheet_as_df(sheet_id=12345, client=client, row_ids=[])
+
+
+class TestObjectUrl:
+
+    def test_sheet_url(self):
+        assert _object_url("https://base", 1, "sheet") == "https://base/sheets/1?include=objectValue&level=1"
+
+    def test_report_url_with_params(self):
+        assert _object_url("https://base", 1, "report", page=3, pageSize=10) == \
+            "https://base/reports/1?pageSize=10&page=3"
+
+    def test_invalid_type(self):
+        with pytest.raises(ValueError):
+            _object_url("https://base", 1, "folder")
+
+
 class TestDoRequest:
 
     @patch('smartsheet_dataframe.smartsheet_dataframe.requests.get')
@@ -304,6 +671,80 @@ class TestDoRequest:
 
         assert 'Could not retrieve request after retrying' in str(e.value)
 
+    @patch("smartsheet_dataframe.smartsheet_dataframe.time")
+    @patch('smartsheet_dataframe.smartsheet_dataframe.requests.get')
+    def test_do_request_retry_after(self, mock_get, mock_time):
+        mock_response_rate_limit = Mock()
+        mock_response_rate_limit.status_code = 429
+        mock_response_rate_limit.headers = {"Retry-After": "42"}
+        mock_response_rate_limit.json.return_value = {"errorCode": 4004}
+        mock_response_success = Mock()
+        mock_response_success.status_code = 200
+
+        mock_get.side_effect = [mock_response_rate_limit, mock_response_success]
+
+        assert _do_request(url="https://fakeurl.com", options={}) is mock_response_success
+        assert 42 <= mock_time.sleep.call_args.args[0] <= 43
+
+    @patch("smartsheet_dataframe.smartsheet_dataframe.time")
+    @patch('smartsheet_dataframe.smartsheet_dataframe.requests.get')
+    def test_do_request_server_error(self, mock_get, mock_time):
+        mock_response_error = Mock()
+        mock_response_error.status_code = 503
+        mock_response_error.json.side_effect = ValueError
+        mock_response_success = Mock()
+        mock_response_success.status_code = 200
+
+        mock_get.side_effect = [mock_response_error, mock_response_success]
+
+        assert _do_request(url="https://fakeurl.com", options={}) is mock_response_success
+        mock_time.sleep.assert_called_once()
+
+    @patch("smartsheet_dataframe.smartsheet_dataframe.time")
+    @patch('smartsheet_dataframe.smartsheet_dataframe.requests.get')
+    def test_do_request_retry_budget(self, mock_get, mock_time):
+        mock_response_rate_limit = Mock()
+        mock_response_rate_limit.status_code = 429
+        mock_response_rate_limit.headers = {"Retry-After": "120"}
+        mock_response_rate_limit.json.return_value = {"errorCode": 4004}
+
+        mock_get.return_value = mock_response_rate_limit
+
+        with pytest.raises(Exception) as e:
+            _do_request(url="https://fakeurl.com", options={}, retries=5, retry_policy=RetryPolicy(budget=60))
+
+        assert 'Could not retrieve request after retrying' in str(e.value)
+        mock_time.sleep.assert_not_called()
+        assert mock_get.call_count == 1
+
+    @patch("smartsheet_dataframe.smartsheet_dataframe.time")
+    @patch('smartsheet_dataframe.smartsheet_dataframe.requests.get')
+    def test_do_request_rate_limit_throttles_limiter(self, mock_get, mock_time):
+        mock_response_rate_limit = Mock()
+        mock_response_rate_limit.status_code = 429
+        mock_response_rate_limit.json.return_value = {"errorCode": 4004}
+        mock_response_success = Mock()
+        mock_response_success.status_code = 200
+        limiter = Mock()
+        limiter.acquire.return_value = 0.0
+
+        mock_get.side_effect = [mock_response_rate_limit, mock_response_success]
+
+        _do_request(url="https://fakeurl.com", options={}, rate_limiter=limiter)
+
+        limiter.throttle.assert_called_once_with(mock_time.sleep.call_args.args[0])
+
+    @patch("smartsheet_dataframe.smartsheet_dataframe.time")
+    @patch('smartsheet_dataframe.smartsheet_dataframe.requests.post')
+    def test_do_request_post_not_retried_after_connection_error(self, mock_post, mock_time):
+        mock_post.side_effect = ConnectionError
+
+        with pytest.raises(ConnectionError):
+            _do_request(url="https://fakeurl.com", options={}, method="POST", body=[{"cells": []}])
+
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.kwargs["json"] == [{"cells": []}]
+
 
 class TestToDataFrame:
 
@@ -333,3 +774,42 @@ class TestToDataFrame:
         assert "Column2" in df.columns
         assert df.loc[0, "Column1"] == "Value1"
         assert df.loc[0, "Column2"] == "Value2"
+
+
+class TestSdkObjects:
+
+    SHEET = {
+        "columns": [{"id": 11, "title": "Text", "type": "TEXT_NUMBER"},
+                    {"id": 12, "title": "Due", "type": "DATE"},
+                    {"id": 13, "title": "People", "type": "MULTI_CONTACT_LIST"}],
+        "rows": [
+            {"id": 1, "cells": [{"columnId": 11, "value": "Value1"}, {"columnId": 12, "value": "2024-01-31"},
+                                {"columnId": 13, "objectValue": {"objectType": "MULTI_CONTACT",
+                                                                 "values": [{"email": "a@example.com"},
+                                                                            {"email": "b@example.com"}]}}]},
+            {"id": 2, "parentId": 1, "cells": [{"columnId": 11, "value": 2}, {"columnId": 12}, {"columnId": 13}]},
+            {"id": 3, "cells": [{"columnId": 11, "value": True}]},
+        ]
+    }
+
+    @pytest.mark.parametrize("kwargs", [{}, {"typed": False}, {"columns": ["People", 11]}])
+    def test_sheet_matches_dict_path(self, kwargs):
+        sheet = smartsheet.models.Sheet(self.SHEET)
+        expected = get_sheet_as_df(sheet_obj=Mock(to_dict=Mock(return_value=sheet.to_dict())), **kwargs)
+
+        with patch.object(smartsheet.models.Row, "to_dict", side_effect=AssertionError):
+            df = get_sheet_as_df(sheet_obj=sheet, **kwargs)
+
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_report_matches_dict_path(self):
+        report = smartsheet.models.Report({
+            "columns": [{"virtualId": 7, "title": "Column1", "type": "TEXT_NUMBER"}],
+            "rows": [{"id": 1, "sheetId": 9, "cells": [{"virtualColumnId": 7, "value": 1.5}]},
+                     {"id": 2, "sheetId": 9, "cells": [{"virtualColumnId": 7}]}]
+        })
+        expected = get_report_as_df(report_obj=Mock(to_dict=Mock(return_value=report.to_dict())))
+
+        df = get_as_df(type_="report", obj=report)
+
+        pd.testing.assert_frame_equal(df, expected)
@@ -0,0 +1,165 @@
+# Standard Imports
+import asyncio
+import io
+import json
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+# 3rd-Party Imports
+import httpx
+import pytest
+
+# Local Imports
+from smartsheet_dataframe import (
+    AsyncSmartsheetDataFrameClient,
+    FetchStats,
+    aget_sheet_as_df,
+    get_many_as_df,
+    get_report_as_df,
+    get_sheet_as_df,
+)
+from smartsheet_dataframe.client import SmartsheetDataFrameClient
+from smartsheet_dataframe.rate_limit import RateLimiter
+
+MOCK_SHEET = {
+    "columns": [{"title": "Column1"}, {"title": "Column2"}],
+    "rows": [{"id": 1, "cells": [{"value": "Value1"}, {"value": 2}]},
+             {"id": 2, "cells": [{"value": "Value3"}]}]
+}
+
+
+def _client(payloads, on_fetch=None):
+    """Build a client whose session answers with the given (status, payload) pairs in order."""
+    def get(url, **kwargs):
+        status_code, payload = payloads.pop(0)
+        body = json.dumps(payload).encode()
+        response = Mock()
+        response.status_code = status_code
+        response.json.return_value = payload
+        response.content = body
+        response.raw = io.BytesIO(body)
+        return response
+
+    client = SmartsheetDataFrameClient(token="fake_token", on_fetch=on_fetch)
+    client.session = Mock()
+    client.session.get.side_effect = get
+    return client
+
+
+class TestFetchStats:
+
+    def test_sheet(self):
+        stats = FetchStats()
+
+        get_sheet_as_df(sheet_id=12345, client=_client([(200, MOCK_SHEET)]), stats=stats)
+
+        assert stats.object_type == "SHEET"
+        assert stats.object_id == 12345
+        assert stats.requests == 1
+        assert stats.retries == 0
+        assert stats.rows == 2
+        assert stats.cells == 3
+        assert stats.response_bytes == len(json.dumps(MOCK_SHEET))
+        assert stats.total_seconds >= stats.convert_seconds > 0
+        assert stats.network_seconds > 0
+        assert stats.error is None
+
+    def test_stream(self):
+        stats = FetchStats()
+
+        get_sheet_as_df(sheet_id=12345, client=_client([(200, MOCK_SHEET)]), stream=True, stats=stats)
+
+        assert stats.response_bytes == len(json.dumps(MOCK_SHEET))
+        assert stats.rows == 2
+
+    def test_report_pages(self):
+        def page(number):
+            return 200, {"columns": [{"title": "Column1"}], "totalRowCount": 3,
+                         "rows": [{"id": number, "cells": [{"value": number}]}]}
+
+        stats = FetchStats()
+
+        get_report_as_df(report_id=1, client=_client([page(1), page(2), page(3)]), page_size=1, stats=stats)
+
+        assert stats.object_type == "REPORT"
+        assert stats.requests == 3
+        assert stats.rows == 3
+
+    @patch("smartsheet_dataframe.smartsheet_dataframe.time.sleep")
+    def test_retries_and_backoff(self, mock_sleep):
+        stats = FetchStats()
+        client = _client([(429, {"errorCode": 4004}), (200, MOCK_SHEET)])
+
+        get_sheet_as_df(sheet_id=12345, client=client, stats=stats)
+
+        assert stats.requests == 2
+        assert stats.retries == 1
+        assert 2.5 <= stats.backoff_seconds <= 5
+        mock_sleep.assert_any_call(stats.backoff_seconds)
+
+    def test_sdk_object(self):
+        stats = FetchStats()
+        sheet_obj = Mock()
+        sheet_obj.to_dict.return_value = MOCK_SHEET
+
+        get_sheet_as_df(sheet_obj=sheet_obj, stats=stats)
+
+        assert stats.requests == 0
+        assert stats.rows == 2
+
+    def test_as_dict(self):
+        stats = FetchStats("SHEET", 1)
+        stats.add(requests=2, decode_seconds=0.5)
+
+        assert stats.as_dict()["requests"] == 2
+        assert stats.as_dict()["decode_seconds"] == 0.5
+        assert repr(stats) == "FetchStats(object_type='SHEET', object_id=1, requests=2, decode_seconds=0.5)"
+
+
+class TestOnFetch:
+
+    def test_called_for_each_object(self):
+        seen = []
+        client = _client([(200, MOCK_SHEET), (200, MOCK_SHEET)], on_fetch=seen.append)
+
+        get_many_as_df([1, 2], client=client, max_workers=1)
+
+        assert sorted(stats.object_id for stats in seen) == [1, 2]
+        assert all(stats.rows == 2 for stats in seen)
+
+    def test_called_on_error(self):
+        seen = []
+        client = _client([(200, {"rows": []})], on_fetch=seen.append)
+
+        with pytest.raises(KeyError):
+            get_sheet_as_df(sheet_id=1, client=client)
+
+        assert seen[0].error == "KeyError"
+
+    def test_hook_errors_are_logged(self, caplog):
+        client = _client([(200, MOCK_SHEET)], on_fetch=Mock(side_effect=RuntimeError))
+
+        df = get_sheet_as_df(sheet_id=1, client=client)
+
+        assert len(df) == 2
+        assert "on_fetch" in caplog.text
+
+    def test_async(self):
+        seen = []
+
+        def handler(request):
+            return httpx.Response(200, content=json.dumps(MOCK_SHEET).encode())
+
+        async def run():
+            async with AsyncSmartsheetDataFrameClient(token="fake_token", on_fetch=seen.append,
+                                                      rate_limiter=RateLimiter(6000, 100)) as client:
+                client.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await aget_sheet_as_df(sheet_id=1, client=client)
+
+        asyncio.run(run())
+
+        assert seen[0].requests == 1
+        assert seen[0].rows == 2
+        assert seen[0].response_bytes == len(json.dumps(MOCK_SHEET))
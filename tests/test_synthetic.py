@@ -0,0 +1,61 @@
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from smartsheet_dataframe.conversion import ConversionOptions
+from smartsheet_dataframe.smartsheet_dataframe import _convert
+from smartsheet_dataframe.testing import (
+    generate_report,
+    generate_sheet,
+)
+
+
+class TestGenerateSheet:
+
+    def test_shape(self):
+        sheet = generate_sheet(rows=50, columns=12)
+
+        assert len(sheet["columns"]) == 12
+        assert len(sheet["rows"]) == 50
+        assert all(len(row["cells"]) == 12 for row in sheet["rows"])
+
+    def test_same_seed_same_sheet(self):
+        assert generate_sheet(rows=20, columns=5, seed=3) == generate_sheet(rows=20, columns=5, seed=3)
+        assert generate_sheet(rows=20, columns=5, seed=3) != generate_sheet(rows=20, columns=5, seed=4)
+
+    def test_hierarchy(self):
+        df = _convert(generate_sheet(rows=500, columns=2, max_depth=4), ConversionOptions(hierarchy=True))
+
+        assert df["depth"].max() == 4
+        assert df["parent_id"].notna().any()
+
+    def test_flat_by_default(self):
+        assert all("parentId" not in row for row in generate_sheet(rows=100, columns=2)["rows"])
+
+    def test_sparsity(self):
+        sheet = generate_sheet(rows=100, columns=10, sparsity=1)
+
+        assert all(set(cell) == {"columnId"} for row in sheet["rows"] for cell in row["cells"])
+
+    def test_converts_with_types(self):
+        df = _convert(generate_sheet(rows=200, columns=9), ConversionOptions())
+
+        assert str(df["Number 2"].dtype) == "float64"
+        assert str(df["Checkbox 5"].dtype) == "bool"
+        assert df["Multi Contact List 8"].str.contains("@example.com").any()
+
+    @pytest.mark.parametrize("kwargs", [{"rows": 20001}, {"columns": 401}, {"rows": 20000, "columns": 26},
+                                        {"sparsity": 2}, {"column_types": ["FORMULA"]}])
+    def test_limits(self, kwargs):
+        with pytest.raises(ValueError):
+            generate_sheet(**kwargs)
+
+
+class TestGenerateReport:
+
+    def test_virtual_ids(self):
+        report = generate_report(rows=10, columns=4, source_sheets=3)
+
+        assert all("virtualId" in column and "id" not in column for column in report["columns"])
+        assert all("virtualColumnId" in cell for row in report["rows"] for cell in row["cells"])
+        assert {row["sheetId"] for row in report["rows"]} == {100, 101, 102}
@@ -0,0 +1,173 @@
+# Standard Imports
+import json
+from unittest.mock import Mock
+
+# 3rd-Party Imports
+import pandas as pd
+import pytest
+
+# Local Imports
+from smartsheet_dataframe import (
+    SheetUpdate,
+    get_sheet_as_df,
+    update_sheet_from_df,
+)
+from smartsheet_dataframe.client import SmartsheetDataFrameClient
+from smartsheet_dataframe.exceptions import WriteError
+
+SHEET = {
+    "columns": [{"id": 11, "title": "Name", "type": "TEXT_NUMBER"},
+                {"id": 12, "title": "Count", "type": "TEXT_NUMBER"},
+                {"id": 13, "title": "Due", "type": "DATE"},
+                {"id": 14, "title": "Done", "type": "CHECKBOX"},
+                {"id": 15, "title": "Total", "type": "TEXT_NUMBER", "formula": "=Count@row * 2"},
+                {"id": 16, "title": "Created", "type": "DATETIME", "systemColumnType": "CREATED_DATE"}],
+    "rows": [{"id": row_id,
+              "cells": [{"columnId": 11, "value": f"Row {row_id}"},
+                        {"columnId": 12, "value": row_id},
+                        {"columnId": 13, "value": "2024-01-15"},
+                        {"columnId": 14, "value": False},
+                        {"columnId": 15, "value": row_id * 2},
+                        {"columnId": 16, "value": "2024-01-01T10:00:00Z"}]}
+             for row_id in range(1, 1001)],
+}
+
+
+def _client(status_code=200):
+    """Client answering GETs with the sheet and recording every write."""
+    def respond(payload, code=200):
+        response = Mock()
+        response.status_code = code
+        response.content = json.dumps(payload).encode()
+        response.json.return_value = payload
+        response.text = response.content.decode()
+        return response
+
+    client = SmartsheetDataFrameClient(token="fake_token")
+    client.session = Mock()
+    client.session.get.side_effect = lambda url, **kwargs: respond(SHEET)
+    for method in ("put", "post", "delete"):
+        getattr(client.session, method).side_effect = \
+            lambda url, **kwargs: respond({"message": "SUCCESS", "result": []} if status_code == 200
+                                          else {"errorCode": 1006}, status_code)
+    return client
+
+
+def _df(client):
+    return get_sheet_as_df(sheet_id=1, client=client)
+
+
+class TestUpdateSheetFromDf:
+
+    def test_unchanged(self):
+        client = _client()
+
+        result = update_sheet_from_df(sheet_id=1, df=_df(client), client=client)
+
+        assert result == SheetUpdate()
+        client.session.put.assert_not_called()
+        client.session.post.assert_not_called()
+
+    def test_only_changed_cells_sent(self):
+        client = _client()
+        df = _df(client)
+        df.loc[df["row_id"] == 5, "Count"] = 50
+        df.loc[df["row_id"] == 7, "Name"] = None
+        df.loc[df["row_id"] == 7, "Due"] = pd.Timestamp("2024-02-01")
+        df.loc[df["row_id"] == 9, "Done"] = True
+
+        result = update_sheet_from_df(sheet_id=1, df=df, client=client)
+
+        assert result == SheetUpdate(updated=3, cells=4, requests=1)
+        assert client.session.put.call_args.kwargs["json"] == [
+            {"id": 5, "cells": [{"columnId": 12, "value": 50}]},
+            {"id": 7, "cells": [{"columnId": 11, "value": ""}, {"columnId": 13, "value": "2024-02-01"}]},
+            {"id": 9, "cells": [{"columnId": 14, "value": True}]},
+        ]
+
+    def test_formula_and_system_columns_not_written(self):
+        client = _client()
+        df = _df(client)
+        df["Total"] = 0
+
+        assert update_sheet_from_df(sheet_id=1, df=df, client=client) == SheetUpdate()
+
+    def test_multi_contact_columns_not_written(self):
+        sheet = {"columns": SHEET["columns"][:1] + [{"id": 17, "title": "Owners", "type": "MULTI_CONTACT_LIST"}],
+                 "rows": [{"id": 1, "cells": [
+                     {"columnId": 11, "value": "Row 1"},
+                     {"columnId": 17, "objectValue": {"objectType": "MULTI_CONTACT",
+                                                      "values": [{"objectType": "CONTACT", "email": "x@y.com"},
+                                                                 {"objectType": "CONTACT", "email": "z@y.com"}]}}]}]}
+        client = _client()
+        client.session.get.side_effect = lambda url, **kwargs: Mock(status_code=200,
+                                                                    content=json.dumps(sheet).encode())
+        df = _df(client)
+        assert df.loc[0, "Owners"] == "x@y.com, z@y.com"
+
+        assert update_sheet_from_df(sheet_id=1, df=df, client=client) == SheetUpdate()
+        df.loc[0, "Owners"] = "x@y.com"
+        assert update_sheet_from_df(sheet_id=1, df=df, client=client) == SheetUpdate()
+        client.session.put.assert_not_called()
+
+    def test_added_rows(self):
+        client = _client()
+        df = _df(client)
+        df = pd.concat([df, pd.DataFrame({"Name": ["New"], "Count": [3]})], ignore_index=True)
+
+        result = update_sheet_from_df(sheet_id=1, df=df, client=client)
+
+        assert result == SheetUpdate(added=1, cells=2, requests=1)
+        assert client.session.post.call_args.kwargs["json"] == [
+            {"toBottom": True, "cells": [{"columnId": 11, "value": "New"}, {"columnId": 12, "value": 3}]}]
+
+    def test_batches(self):
+        client = _client()
+        df = _df(client)
+        df["Count"] = df["Count"] + 1
+
+        result = update_sheet_from_df(sheet_id=1, df=df, client=client, batch_size=400)
+
+        assert result.updated == 1000
+        assert [len(call.kwargs["json"]) for call in client.session.put.call_args_list] == [400, 400, 200]
+
+    def test_delete_missing(self):
+        client = _client()
+        df = _df(client)
+        df = df[df["row_id"] > 3]
+
+        assert update_sheet_from_df(sheet_id=1, df=df, client=client) == SheetUpdate()
+
+        result = update_sheet_from_df(sheet_id=1, df=df, client=client, delete_missing=True)
+
+        assert result == SheetUpdate(deleted=3, requests=1)
+        assert client.session.delete.call_args.args[0].endswith("/sheets/1/rows?ids=1,2,3&ignoreRowsNotFound=true")
+
+    def test_indexed_by_row_id(self):
+        client = _client()
+        df = _df(client).set_index("row_id")
+        df.loc[2, "Count"] = 20
+
+        assert update_sheet_from_df(sheet_id=1, df=df, client=client).updated == 1
+
+    def test_unknown_column(self):
+        client = _client()
+        df = _df(client).assign(Other=1)
+
+        with pytest.raises(ValueError, match="Other"):
+            update_sheet_from_df(sheet_id=1, df=df, client=client)
+
+    def test_row_not_in_sheet(self):
+        client = _client()
+        df = pd.DataFrame({"row_id": [99999], "Name": ["x"]})
+
+        with pytest.raises(ValueError, match="99999"):
+            update_sheet_from_df(sheet_id=1, df=df, client=client)
+
+    def test_rejected_write(self):
+        client = _client(status_code=400)
+        df = _df(client)
+        df.loc[0, "Count"] = 0
+
+        with pytest.warns(UserWarning), pytest.raises(WriteError):
+            update_sheet_from_df(sheet_id=1, df=df, client=client)
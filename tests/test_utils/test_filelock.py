@@ -0,0 +1,29 @@
+# Standard Imports
+import threading
+import time
+
+# Local Imports
+from smartsheet_dataframe.utils.filelock import FileLock
+
+
+class TestFileLock:
+
+    def test_lock_is_exclusive(self, tmp_path):
+        events = []
+
+        def hold():
+            with FileLock(tmp_path / "lock"):
+                events.append("second acquired")
+
+        with FileLock(tmp_path / "lock"):
+            thread = threading.Thread(target=hold)
+            thread.start()
+            time.sleep(0.1)
+            events.append("first released")
+
+        thread.join()
+
+        assert events == ["first released", "second acquired"]
+
+    def test_release_without_acquire(self, tmp_path):
+        FileLock(tmp_path / "lock").release()
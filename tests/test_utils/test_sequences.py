@@ -0,0 +1,15 @@
+# 3rd-Party Imports
+import pytest
+
+# Local Imports
+from smartsheet_dataframe.utils.sequences import zip_equal
+
+
+class TestZipEqual:
+
+    def test_same_lengths(self):
+        assert list(zip_equal([1, 2], ["a", "b"], (True, False))) == [(1, "a", True), (2, "b", False)]
+
+    def test_different_lengths(self):
+        with pytest.raises(ValueError):
+            zip_equal([1, 2], ["a"])